@@ -0,0 +1,67 @@
+"""
+Per-response cost of building a ReelUpload from a configure response, and from its already decoded dict:
+- reflection: The decoder BaseResponseData used to have, inspecting every field's type on each decode
+- compiled: Generated per-class decoder, on a dict from the JSON backend
+- typed: Straight from the response's bytes into msgspec structs (needs msgspec)
+
+Usage: python -m benchmarks.bench_containers
+"""
+
+import json
+import timeit
+from dataclasses import fields, is_dataclass
+from ensta import JsonBackend
+from ensta.containers import BaseResponseData, ReelUpload
+from .bench_json import post
+
+
+def reflection(cls, data):
+    parsed_data = {}
+
+    for field in fields(cls):
+        raw_value = data.get(field.name, None)
+
+        if raw_value is None: parsed_data[field.name] = None
+        elif not isinstance(field.type, type): parsed_data[field.name] = raw_value
+        elif issubclass(field.type, BaseResponseData): parsed_data[field.name] = reflection(field.type, raw_value)
+        elif is_dataclass(field.type): parsed_data[field.name] = field.type(**raw_value)
+        else: parsed_data[field.name] = raw_value
+
+    return cls(**parsed_data)
+
+
+MEDIA: dict = {
+    **post(0),
+    "comment_inform_treatment": {"should_have_inform_treatment": False, "text": "", "url": None, "action_type": None},
+    "sharing_friction_info": {"should_have_sharing_friction": False, "bloks_app_url": None, "sharing_friction_payload": None},
+    "media_appreciation_settings": {"media_gifting_state": "enabled", "gift_count_visibility": "private"},
+    **{field.name: 0 for field in fields(ReelUpload) if field.type is int}
+}
+
+CONTENT: bytes = json.dumps({"media": MEDIA, "status": "ok"}).encode()
+
+
+if __name__ == "__main__":
+    number = 20_000
+    ReelUpload.from_response_content(CONTENT)
+
+    BaseResponseData.typed_decoding = False
+
+    for name, function in (("reflection", reflection), ("compiled", lambda cls, data: cls.from_data(data))):
+        seconds = min(timeit.repeat(lambda: function(ReelUpload, MEDIA), number=number, repeat=5))
+        print(f"{name:>10} (dict): {seconds / number * 1e6:8.1f} µs/response")
+
+    cases = {
+        "reflection": lambda: reflection(ReelUpload, JsonBackend.loads(CONTENT)["media"]),
+        "compiled": lambda: ReelUpload.from_response_content(CONTENT)
+    }
+
+    for name, function in cases.items():
+        seconds = min(timeit.repeat(function, number=number, repeat=5))
+        print(f"{name:>10} ({JsonBackend.json_backend()}): {seconds / number * 1e6:8.1f} µs/response")
+
+    BaseResponseData.typed_decoding = True
+
+    if BaseResponseData._typed():
+        seconds = min(timeit.repeat(lambda: ReelUpload.from_response_content(CONTENT), number=number, repeat=5))
+        print(f"{'typed':>10} (msgspec): {seconds / number * 1e6:8.1f} µs/response")
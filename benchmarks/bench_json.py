@@ -0,0 +1,60 @@
+"""
+Per-page cost of decoding a followers page (35 users) and a feed page (12 posts) with each JSON backend.
+
+Usage: python -m benchmarks.bench_json
+"""
+
+import json
+import timeit
+from ensta import JsonBackend
+
+
+def user(index: int) -> dict:
+    return {
+        "pk": str(10 ** 10 + index),
+        "pk_id": str(10 ** 10 + index),
+        "username": f"user_{index}",
+        "full_name": f"User Number {index} ✨",
+        "is_private": index % 3 == 0,
+        "is_verified": index % 7 == 0,
+        "profile_pic_id": f"{10 ** 18 + index}_{10 ** 10 + index}",
+        "profile_pic_url": f"https://scontent.cdninstagram.com/v/t51.2885-19/{10 ** 9 + index}_n.jpg?stp=dst-jpg_s150x150",
+        "has_anonymous_profile_picture": False,
+        "latest_reel_media": 0
+    }
+
+
+def post(index: int) -> dict:
+    return {
+        "pk": str(3 * 10 ** 18 + index),
+        "id": f"{3 * 10 ** 18 + index}_{10 ** 10}",
+        "code": f"Cx{index:09d}",
+        "taken_at": 1700000000 + index,
+        "media_type": 1,
+        "like_count": 1000 + index,
+        "comment_count": 10 + index,
+        "caption": {"text": "Lorem ipsum dolor sit amet #tag " * 8, "pk": str(index)},
+        "user": user(index),
+        "image_versions2": {"candidates": [
+            {"width": width, "height": width, "url": f"https://scontent.cdninstagram.com/{index}_{width}.jpg?_nc_ht=x" * 3}
+            for width in (1080, 750, 640, 480, 320, 240, 150)
+        ]},
+        "usertags": {"in": [{"user": user(index + tag), "position": [0.5, 0.5]} for tag in range(3)]}
+    }
+
+
+PAGES: dict[str, bytes] = {
+    "followers": json.dumps({"users": [user(index) for index in range(35)], "next_max_id": "35", "status": "ok"}).encode(),
+    "feed": json.dumps({"items": [post(index) for index in range(12)], "next_max_id": "abc", "status": "ok"}).encode()
+}
+
+
+if __name__ == "__main__":
+    number = 2_000
+
+    for page, content in PAGES.items():
+        for backend in JsonBackend.BACKENDS:
+            JsonBackend.use_json_backend(backend)
+
+            seconds = min(timeit.repeat(lambda: JsonBackend.loads(content), number=number, repeat=5))
+            print(f"{page:>10} ({len(content) // 1024:3d} KiB) {backend:>7}: {seconds / number * 1e6:8.1f} µs/page")
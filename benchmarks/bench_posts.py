@@ -0,0 +1,36 @@
+"""
+Posts per second of turning feed items into Posts (eager, the default) and into PostViews (lazy=True),
+when only a couple of fields of each post are read.
+
+Usage: python -m benchmarks.bench_posts
+"""
+
+import json
+import timeit
+from ensta import Guest
+from ensta.containers import PostView
+from .bench_json import PAGES
+
+ITEMS: list[dict] = json.loads(PAGES["feed"])["items"] * 100
+
+process_post_data = Guest._Guest__process_post_data
+
+
+def eager() -> None:
+    for item in ITEMS:
+        post = process_post_data(item)
+        post.post_id, post.like_count, post.user.username
+
+
+def lazy() -> None:
+    for item in ITEMS:
+        post = PostView(item)
+        post.post_id, post.like_count, post.user.username
+
+
+if __name__ == "__main__":
+    number = 20
+
+    for name, function in (("eager", eager), ("lazy", lazy)):
+        seconds = min(timeit.repeat(function, number=number, repeat=5))
+        print(f"{name:>5}: {len(ITEMS) * number / seconds:12,.0f} posts/s")
@@ -0,0 +1,326 @@
+import time
+import threading
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Sequence
+from dataclasses import dataclass, field
+from .SessionHost import SessionHost
+from .Mobile import Mobile
+from .containers.Comment import Comment
+from .containers.Liker import Liker
+from .containers.Post import Post
+from .containers.PostView import PostView
+from .containers import FollowPerson, FollowersDiff, Profile, ProfileResult
+from .Batch import run_batch, DEFAULT_CONCURRENCY
+from .Checkpoint import Checkpoint
+from .FollowersDiffer import diff_followers, DEFAULT_KNOWN_RUN
+from .UserStore import FollowPersonStore, LikerStore
+from .lib.Exceptions import RateLimitedError
+
+
+@dataclass
+class AccountStats:
+
+    username: str = None
+    in_flight: int = 0
+    calls: int = 0
+    items: int = 0
+    rate_limited: int = 0
+    benched_until: float = 0.0
+    completed_at: deque = field(default_factory=deque)
+
+
+class AccountPool:
+    """
+    Spreads read calls (profile, followers, posts, ...) across many logged-in accounts.
+
+    - Every call goes to the least-loaded healthy account that supports it.
+    - An account that raises RateLimitedError is benched for 'bench_time' seconds,
+      and the call is sent again using another account.
+    - Paginated calls stick to one account. If it gets benched midway, the next account
+      continues without yielding the same items twice.
+    """
+
+    accounts: list[SessionHost | Mobile]
+    stats: dict[int, AccountStats]
+    bench_time: float
+    window: float
+    lock: threading.Lock
+
+    def __init__(
+        self,
+        accounts: list[SessionHost | Mobile] | None = None,
+        bench_time: float = 900.0,
+        window: float = 60.0
+    ) -> None:
+
+        """
+        :param accounts: (Optional) Logged-in SessionHost / Host / Mobile instances
+        :param bench_time: (Optional) Seconds a rate limited account is left out for
+        :param window: (Optional) Seconds over which throughput is measured
+        """
+
+        self.accounts = []
+        self.stats = {}
+        self.bench_time = bench_time
+        self.window = window
+        self.lock = threading.Lock()
+
+        for account in accounts or []: self.add(account)
+
+    def add(self, account: SessionHost | Mobile) -> None:
+        """
+        Adds a logged-in account to the pool.
+        :param account: SessionHost, Host or Mobile instance
+        :return: None
+        """
+
+        with self.lock:
+            self.accounts.append(account)
+            self.stats[id(account)] = AccountStats(username=getattr(account, "username", None))
+
+    def remove(self, account: SessionHost | Mobile) -> None:
+        with self.lock:
+            self.accounts.remove(account)
+            del self.stats[id(account)]
+
+    def _acquire(self, method: str, excluded: set[int]) -> SessionHost | Mobile:
+        with self.lock:
+            now: float = time.monotonic()
+
+            candidates = [
+                account for account in self.accounts
+                if id(account) not in excluded
+                and hasattr(account, method)
+                and self.stats[id(account)].benched_until <= now
+            ]
+
+            if len(candidates) == 0: raise RateLimitedError(
+                f"No healthy account left in the pool to call '{method}'. "
+                "All of them are rate limited, wait for some time or add more accounts."
+            )
+
+            account = min(candidates, key=lambda each: (self.stats[id(each)].in_flight, self.stats[id(each)].calls))
+            self.stats[id(account)].in_flight += 1
+
+            return account
+
+    def _release(self, account: SessionHost | Mobile, items: int = 0, rate_limited: bool = False) -> None:
+        with self.lock:
+            stats: AccountStats = self.stats.get(id(account))
+            if stats is None: return
+
+            now: float = time.monotonic()
+
+            stats.in_flight -= 1
+            stats.calls += 1
+            stats.items += items
+            stats.completed_at.append((now, items))
+
+            while stats.completed_at and stats.completed_at[0][0] < now - self.window: stats.completed_at.popleft()
+
+            if rate_limited:
+                stats.rate_limited += 1
+                stats.benched_until = now + self.bench_time
+
+    def call(self, method: str, *args, **kwargs) -> any:
+        """
+        Calls the given method on the least-loaded healthy account.
+        :param method: Name of the method. e.g. - "profile"
+        :return: Whatever the method returns
+        """
+
+        excluded: set[int] = set()
+
+        while True:
+            account = self._acquire(method, excluded)
+
+            try: result = getattr(account, method)(*args, **kwargs)
+
+            except RateLimitedError:
+                self._release(account, rate_limited=True)
+                excluded.add(id(account))
+                continue
+
+            except Exception:
+                self._release(account)
+                raise
+
+            self._release(account, items=1)
+            return result
+
+    def paginate(self, method: str, *args, **kwargs) -> Generator[any, None, None]:
+        """
+        Iterates over a paginated method (followers, followings, posts, iter_likers, comments) on the least-loaded healthy account.
+        :param method: Name of the method. e.g. - "followers"
+        :return: Generator which yields whatever the method yields
+        """
+
+        excluded: set[int] = set()
+
+        # Shared by every account: The next one carries on from the page the previous one was on
+        kwargs["resume_from"] = kwargs.get("resume_from") or Checkpoint()
+
+        while True:
+            account = self._acquire(method, excluded)
+            items: int = 0
+
+            try:
+                for item in getattr(account, method)(*args, **kwargs):
+
+                    # Paginators yield None right before raising an error
+                    if item is None: continue
+
+                    items += 1
+                    yield item
+
+            except RateLimitedError:
+                self._release(account, items=items, rate_limited=True)
+                excluded.add(id(account))
+                continue
+
+            except BaseException:
+                self._release(account, items=items)
+                raise
+
+            self._release(account, items=items)
+            return None
+
+    def profile(self, username: str) -> Profile | None:
+        return self.call("profile", username)
+
+    def profiles(self, usernames: Iterable[str], concurrency: int = DEFAULT_CONCURRENCY) -> Generator[ProfileResult, None, None]:
+        for username, profile, error in run_batch(
+            self.profile,
+            usernames,
+            concurrency,
+            lambda each: str(each).replace(" ", "").lower()
+        ):
+            yield ProfileResult(identifier=username, profile=profile, error=error)
+
+    def get_uid(self, username: str) -> str | None:
+        return self.call("get_uid", username)
+
+    def get_username(self, uid: str | int) -> str | None:
+        return self.call("get_username", uid)
+
+    def followers(
+        self,
+        identifier: str | int,
+        count: int = 0,
+        stream: bool = False,
+        resume_from: Checkpoint | None = None,
+        autosave: Callable[[Checkpoint], None] | str | None = None,
+        autosave_every: int = 1,
+        prefetch: int = 0,
+        store: FollowPersonStore | None = None
+    ) -> Generator[FollowPerson, None, None]:
+
+        return self.paginate(
+            "followers", identifier, count, stream=stream,
+            resume_from=resume_from, autosave=autosave, autosave_every=autosave_every, prefetch=prefetch,
+            store=store
+        )
+
+    def followers_diff(
+        self,
+        identifier: str | int,
+        previous: Sequence[str | int],
+        known_run: int = DEFAULT_KNOWN_RUN,
+        full: bool = False
+    ) -> FollowersDiff:
+
+        return diff_followers(self.followers(identifier), previous, known_run, full)
+
+    def followings(
+        self,
+        identifier: str | int,
+        count: int = 0,
+        stream: bool = False,
+        resume_from: Checkpoint | None = None,
+        autosave: Callable[[Checkpoint], None] | str | None = None,
+        autosave_every: int = 1,
+        prefetch: int = 0,
+        store: FollowPersonStore | None = None
+    ) -> Generator[FollowPerson, None, None]:
+
+        return self.paginate(
+            "followings", identifier, count, stream=stream,
+            resume_from=resume_from, autosave=autosave, autosave_every=autosave_every, prefetch=prefetch,
+            store=store
+        )
+
+    def posts(
+        self,
+        username: str,
+        count: int = 0,
+        stream: bool = False,
+        resume_from: Checkpoint | None = None,
+        autosave: Callable[[Checkpoint], None] | str | None = None,
+        autosave_every: int = 1,
+        prefetch: int = 0,
+        lazy: bool = False
+    ) -> Generator[Post | PostView, None, None]:
+
+        return self.paginate(
+            "posts", username, count, stream=stream,
+            resume_from=resume_from, autosave=autosave, autosave_every=autosave_every, prefetch=prefetch, lazy=lazy
+        )
+
+    def iter_likers(
+        self,
+        post_id: str,
+        count: int = 0,
+        stream: bool = False,
+        resume_from: Checkpoint | None = None,
+        autosave: Callable[[Checkpoint], None] | str | None = None,
+        autosave_every: int = 1,
+        prefetch: int = 0,
+        store: LikerStore | None = None
+    ) -> Generator[Liker, None, None]:
+
+        return self.paginate(
+            "iter_likers", post_id, count, stream=stream,
+            resume_from=resume_from, autosave=autosave, autosave_every=autosave_every, prefetch=prefetch,
+            store=store
+        )
+
+    def comments(
+        self,
+        post_id: str,
+        count: int = 0,
+        replies: bool = False,
+        resume_from: Checkpoint | None = None,
+        autosave: Callable[[Checkpoint], None] | str | None = None,
+        autosave_every: int = 1,
+        prefetch: int = 0
+    ) -> Generator[Comment, None, None]:
+
+        return self.paginate(
+            "comments", post_id, count, replies=replies,
+            resume_from=resume_from, autosave=autosave, autosave_every=autosave_every, prefetch=prefetch
+        )
+
+    def healthy(self) -> list[SessionHost | Mobile]:
+        """
+        Returns the accounts which aren't benched right now.
+        :return: List of accounts
+        """
+
+        with self.lock:
+            now: float = time.monotonic()
+            return [account for account in self.accounts if self.stats[id(account)].benched_until <= now]
+
+    def throughput(self) -> float:
+        """
+        Returns how many results per second the whole pool delivered recently.
+        A call counts as one result, a paginated call counts each item it yielded.
+        :return: Results per second over the last 'window' seconds
+        """
+
+        with self.lock:
+            now: float = time.monotonic()
+
+            return sum(
+                items for stats in self.stats.values() for completed, items in stats.completed_at
+                if completed >= now - self.window
+            ) / self.window
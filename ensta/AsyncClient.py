@@ -0,0 +1,62 @@
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections.abc import AsyncGenerator, Callable, Generator
+
+_EXHAUSTED = object()
+
+
+class AsyncClient:
+    """
+    Base class of the asyncio clients (AsyncGuest, AsyncSessionHost, AsyncHost).
+
+    - Not a native async HTTP client: It wraps a regular (blocking) client and runs each of its calls on a
+      thread pool, so awaiting doesn't block the event loop. Every call in flight holds one OS thread.
+    - Generators are exposed as async generators, page fetches are run on the same threads.
+    - The wrapped client's Transport is sized to the number of workers, so every
+      request that is in flight gets its own keep-alive connection.
+    - The default of 8 workers is plenty for Instagram's rate limits. Raise it for many slow, unlimited requests.
+    """
+
+    client: any
+    executor: ThreadPoolExecutor
+    max_workers: int
+
+    DEFAULT_MAX_WORKERS: int = 8
+
+    def __init__(self, client: any, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        self.client = client
+        self.max_workers = max_workers
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ensta")
+
+    async def _run(self, function: Callable, *args, **kwargs) -> any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, lambda: function(*args, **kwargs))
+
+    async def _iterate(self, generator: Generator) -> AsyncGenerator:
+        pending: Future | None = None
+
+        try:
+            while True:
+                pending = self.executor.submit(next, generator, _EXHAUSTED)
+                item = await asyncio.wrap_future(pending)
+                if item is _EXHAUSTED: return
+                yield item
+
+        finally:
+            # Cancelled mid-'next': The generator is closed as soon as that call is over, on its worker thread
+            if pending is None: generator.close()
+            else: pending.add_done_callback(lambda _: generator.close())
+
+    def close(self) -> None:
+        """
+        Shuts down the worker pool. Requests which haven't started yet are cancelled.
+        :return: None
+        """
+
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        self.close()
@@ -0,0 +1,96 @@
+from collections.abc import AsyncGenerator, Callable
+from .Guest import Guest
+from .AsyncClient import AsyncClient
+from .Transport import Transport
+from .ProxyPool import ProxyPool
+from .containers.Profile import Profile
+from .containers.Post import Post
+from .containers.PostView import PostView
+from .containers.ProfileResult import ProfileResult
+from .Batch import DEFAULT_CONCURRENCY
+from .Checkpoint import Checkpoint
+
+
+class AsyncGuest(AsyncClient):
+    """
+    Asyncio counterpart of Guest. Every method is a coroutine (or an async generator)
+    so many lookups can be awaited concurrently, e.g. with asyncio.gather().
+    """
+
+    client: Guest
+
+    def __init__(
+        self,
+        proxy: dict[str, str] | ProxyPool | None = None,
+        max_workers: int = AsyncClient.DEFAULT_MAX_WORKERS
+    ) -> None:
+
+        """
+        :param proxy: (Optional) JSON Object of proxy, or a ProxyPool, to be used. See https://github.com/diezo/ensta
+        :param max_workers: (Optional) Threads running the calls, i.e. max number of requests kept in flight at the same time
+        """
+
+        super().__init__(Guest(proxy=proxy, transport=Transport.uniform(max_workers)), max_workers)
+
+    async def username_availability(self, username: str) -> bool | None:
+        return await self._run(self.client.username_availability, username)
+
+    async def profile(self, username: str) -> Profile | None:
+        return await self._run(self.client.profile, username)
+
+    async def profiles(
+        self,
+        usernames: list[str],
+        concurrency: int = DEFAULT_CONCURRENCY
+    ) -> AsyncGenerator[ProfileResult, None]:
+
+        """
+        Fetches many profiles at once.
+        :param usernames: Usernames of the targets. Duplicates are only fetched once
+        :param concurrency: (Optional) Max number of profiles fetched at the same time
+        :return: Async generator which yields a ProfileResult per username, as soon as each one is done
+        """
+
+        async for result in self._iterate(self.client.profiles(usernames, concurrency)):
+            yield result
+
+    async def get_uid(self, username: str) -> str | None:
+        return await self._run(self.client.get_uid, username)
+
+    async def get_username(self, uid: str | int) -> str | None:
+        return await self._run(self.client.get_username, uid)
+
+    async def posts(
+        self,
+        username: str,
+        count: int = 0,
+        stream: bool = False,
+        resume_from: Checkpoint | None = None,
+        autosave: Callable[[Checkpoint], None] | str | None = None,
+        autosave_every: int = 1,
+        prefetch: int = 0,
+        lazy: bool = False
+    ) -> AsyncGenerator[Post | PostView, None]:
+
+        """
+        Generates a list of target's posts of specified size.
+        :param username: Target's Username
+        :param count: Amount of posts to fetch
+        :param stream: (Optional) Yield each post as soon as it's downloaded, instead of once the whole page is in
+        :param resume_from: (Optional) Checkpoint to continue from. It's updated in place as posts are generated
+        :param autosave: (Optional) Function called with the checkpoint, or path of a JSON file to save it in
+        :param autosave_every: (Optional) Number of pages after which the checkpoint is autosaved
+        :param prefetch: (Optional) Number of pages fetched in the background, ahead of the ones being generated
+        :param lazy: (Optional) Yield read-only PostViews, which read each field when it's accessed, instead of Posts
+        :return: Async generator which yields each post's data
+        """
+
+        async for post in self._iterate(self.client.posts(
+            username, count, stream=stream,
+            resume_from=resume_from, autosave=autosave, autosave_every=autosave_every, prefetch=prefetch, lazy=lazy
+        )):
+            yield post
+
+    def close(self) -> None:
+        super().close()
+        self.client.request_session.close()
@@ -0,0 +1,43 @@
+from .Host import Host
+from .AsyncClient import AsyncClient
+from .AsyncSessionHost import AsyncSessionHost
+from .Transport import Transport
+from .ProxyPool import ProxyPool
+
+
+class AsyncHost(AsyncSessionHost):
+    """
+    Asyncio counterpart of Host. Logs in (or loads the stored session) once,
+    then exposes the same coroutines as AsyncSessionHost.
+    """
+
+    client: Host
+
+    def __init__(
+        self,
+        identifier: str,
+        password: str,
+        file: str = None,
+        save: any = None,
+        load: any = None,
+        proxy: dict[str, str] | ProxyPool = None,
+        totp_token: str = None,
+        max_workers: int = AsyncClient.DEFAULT_MAX_WORKERS
+    ) -> None:
+
+        """
+        Login using your username/email and password.
+        :param identifier: Your Instagram Username or Email
+        :param password: Your Instagram Password
+        :param file: (Optional) Name of file to store session_data in. Eg: "session.txt"
+        :param save: (Optional) Name of a function which will be called to save the generated session_data
+        :param load: (Optional) Name of a function which will be called to receive the session_data
+        :param proxy: (Optional) JSON Object of proxy, or a ProxyPool, to be used. See https://github.com/diezo/ensta
+        :param totp_token: (Optional) Your TOTP Key generated by Instagram while setting up 2FA (If 2FA is turned on)
+        :param max_workers: (Optional) Threads running the calls, i.e. max number of requests kept in flight at the same time
+        """
+
+        super().__init__(
+            Host(identifier, password, file, save, load, proxy, totp_token, Transport.uniform(max_workers)),
+            max_workers=max_workers
+        )
@@ -0,0 +1,288 @@
+from collections.abc import AsyncGenerator, Callable, Sequence
+from .SessionHost import SessionHost
+from .AsyncClient import AsyncClient
+from .Transport import Transport
+from .ProxyPool import ProxyPool
+from .containers.ProfileHost import ProfileHost
+from .containers.PrivateInfo import PrivateInfo
+from .containers.Comment import Comment
+from .containers.Liker import Liker
+from .containers.Likers import Likers
+from .containers.Post import Post
+from .containers.PostView import PostView
+from .containers.ProfileResult import ProfileResult
+from .Batch import DEFAULT_CONCURRENCY
+from .Checkpoint import Checkpoint
+from .FollowersDiffer import DEFAULT_KNOWN_RUN
+from .containers import (FollowedStatus, UnfollowedStatus, FollowPerson, FollowersDiff, PhotoUpload, ReelUpload)
+
+
+class AsyncSessionHost(AsyncClient):
+    """
+    Asyncio counterpart of SessionHost. Every method is a coroutine (or an async generator)
+    so many paginations and lookups can run concurrently on a single logged-in session.
+    """
+
+    client: SessionHost
+
+    def __init__(
+        self,
+        session_data: str | SessionHost,
+        proxy: dict[str, str] | ProxyPool = None,
+        skip_auth_verification: bool = False,
+        max_workers: int = AsyncClient.DEFAULT_MAX_WORKERS
+    ) -> None:
+
+        """
+        :param session_data: SessionData string, or an already created SessionHost to wrap (its Transport is kept)
+        :param proxy: (Optional) JSON Object of proxy, or a ProxyPool, to be used. See https://github.com/diezo/ensta
+        :param skip_auth_verification: (Optional) Don't check whether the session is still valid
+        :param max_workers: (Optional) Threads running the calls, i.e. max number of requests kept in flight at the same time
+        """
+
+        if not isinstance(session_data, SessionHost):
+            session_data = SessionHost(
+                session_data,
+                proxy,
+                skip_auth_verification,
+                transport=Transport.uniform(max_workers)
+            )
+
+        super().__init__(session_data, max_workers)
+
+    async def authenticated(self) -> bool:
+        return await self._run(self.client.authenticated)
+
+    async def follow(self, identifier: str | int) -> FollowedStatus | None:
+        return await self._run(self.client.follow, identifier)
+
+    async def unfollow(self, identifier: str | int) -> UnfollowedStatus | None:
+        return await self._run(self.client.unfollow, identifier)
+
+    async def followers(
+        self,
+        identifier: str | int,
+        count: int = 0,
+        stream: bool = False,
+        resume_from: Checkpoint | None = None,
+        autosave: Callable[[Checkpoint], None] | str | None = None,
+        autosave_every: int = 1,
+        prefetch: int = 0
+    ) -> AsyncGenerator[FollowPerson, None]:
+
+        """
+        Generates a list of target's followers of specified size.
+        :param identifier: Target's Username or UserID
+        :param count: Amount of followers to fetch
+        :param stream: (Optional) Yield each user as soon as it's downloaded, instead of once the whole page is in
+        :param resume_from: (Optional) Checkpoint to continue from. It's updated in place as users are generated
+        :param autosave: (Optional) Function called with the checkpoint, or path of a JSON file to save it in
+        :param autosave_every: (Optional) Number of pages after which the checkpoint is autosaved
+        :param prefetch: (Optional) Number of pages fetched in the background, ahead of the ones being generated
+        :return: Async generator which yields each user's details
+        """
+
+        async for user in self._iterate(self.client.followers(
+            identifier, count, stream=stream,
+            resume_from=resume_from, autosave=autosave, autosave_every=autosave_every, prefetch=prefetch
+        )):
+            yield user
+
+    async def followers_diff(
+        self,
+        identifier: str | int,
+        previous: Sequence[str | int],
+        known_run: int = DEFAULT_KNOWN_RUN,
+        full: bool = False
+    ) -> FollowersDiff:
+
+        return await self._run(self.client.followers_diff, identifier, previous, known_run, full)
+
+    async def followings(
+        self,
+        identifier: str | int,
+        count: int = 0,
+        stream: bool = False,
+        resume_from: Checkpoint | None = None,
+        autosave: Callable[[Checkpoint], None] | str | None = None,
+        autosave_every: int = 1,
+        prefetch: int = 0
+    ) -> AsyncGenerator[FollowPerson, None]:
+
+        """
+        Generates a list of users which the target follows, of specified size.
+        :param identifier: Target's Username or UserID
+        :param count: Amount of followings to fetch
+        :param stream: (Optional) Yield each user as soon as it's downloaded, instead of once the whole page is in
+        :param resume_from: (Optional) Checkpoint to continue from. It's updated in place as users are generated
+        :param autosave: (Optional) Function called with the checkpoint, or path of a JSON file to save it in
+        :param autosave_every: (Optional) Number of pages after which the checkpoint is autosaved
+        :param prefetch: (Optional) Number of pages fetched in the background, ahead of the ones being generated
+        :return: Async generator which yields each user's details
+        """
+
+        async for user in self._iterate(self.client.followings(
+            identifier, count, stream=stream,
+            resume_from=resume_from, autosave=autosave, autosave_every=autosave_every, prefetch=prefetch
+        )):
+            yield user
+
+    async def switch_to_private_account(self) -> bool:
+        return await self._run(self.client.switch_to_private_account)
+
+    async def switch_to_public_account(self) -> bool:
+        return await self._run(self.client.switch_to_public_account)
+
+    async def profile(self, username: str) -> ProfileHost | None:
+        return await self._run(self.client.profile, username)
+
+    async def profiles(
+        self,
+        usernames: list[str],
+        concurrency: int = DEFAULT_CONCURRENCY
+    ) -> AsyncGenerator[ProfileResult, None]:
+
+        """
+        Fetches many profiles at once.
+        :param usernames: Usernames of the targets. Duplicates are only fetched once
+        :param concurrency: (Optional) Max number of profiles fetched at the same time
+        :return: Async generator which yields a ProfileResult per username, as soon as each one is done
+        """
+
+        async for result in self._iterate(self.client.profiles(usernames, concurrency)):
+            yield result
+
+    async def get_username(self, uid: str | int) -> str | None:
+        return await self._run(self.client.get_username, uid)
+
+    async def get_uid(self, username: str) -> str | None:
+        return await self._run(self.client.get_uid, username)
+
+    async def posts(
+        self,
+        username: str,
+        count: int = 0,
+        stream: bool = False,
+        resume_from: Checkpoint | None = None,
+        autosave: Callable[[Checkpoint], None] | str | None = None,
+        autosave_every: int = 1,
+        prefetch: int = 0,
+        lazy: bool = False
+    ) -> AsyncGenerator[Post | PostView, None]:
+
+        """
+        Generates a list of target's posts of specified size.
+        :param username: Target's Username
+        :param count: Amount of posts to fetch
+        :param stream: (Optional) Yield each post as soon as it's downloaded, instead of once the whole page is in
+        :param resume_from: (Optional) Checkpoint to continue from. It's updated in place as posts are generated
+        :param autosave: (Optional) Function called with the checkpoint, or path of a JSON file to save it in
+        :param autosave_every: (Optional) Number of pages after which the checkpoint is autosaved
+        :param prefetch: (Optional) Number of pages fetched in the background, ahead of the ones being generated
+        :param lazy: (Optional) Yield read-only PostViews, which read each field when it's accessed, instead of Posts
+        :return: Async generator which yields each post's data
+        """
+
+        async for post in self._iterate(self.client.posts(
+            username, count, stream=stream,
+            resume_from=resume_from, autosave=autosave, autosave_every=autosave_every, prefetch=prefetch, lazy=lazy
+        )):
+            yield post
+
+    async def get_post_id(self, share_url: str) -> str:
+        return await self._run(self.client.get_post_id, share_url)
+
+    async def private_info(self) -> PrivateInfo:
+        return await self._run(self.client.private_info)
+
+    async def change_bio(self, biography: str) -> bool:
+        return await self._run(self.client.change_bio, biography)
+
+    async def change_display_name(self, display_name: str) -> bool:
+        return await self._run(self.client.change_display_name, display_name)
+
+    async def get_upload_id(self, media_path: str, arg_upload_id: str | None = None) -> str:
+        return await self._run(self.client.get_upload_id, media_path, arg_upload_id)
+
+    async def upload_photo(self, upload_id: str, **kwargs) -> PhotoUpload:
+        return await self._run(self.client.upload_photo, upload_id, **kwargs)
+
+    async def upload_photos(self, upload_ids: list[str], **kwargs) -> bool:
+        return await self._run(self.client.upload_photos, upload_ids, **kwargs)
+
+    async def upload_reel(self, video_path: str, thumbnail_path: str, **kwargs) -> ReelUpload:
+        return await self._run(self.client.upload_reel, video_path, thumbnail_path, **kwargs)
+
+    async def comment(self, text: str, post_id: str) -> bool:
+        return await self._run(self.client.comment, text, post_id)
+
+    async def like(self, post_id: str) -> bool:
+        return await self._run(self.client.like, post_id)
+
+    async def unlike(self, post_id: str) -> bool:
+        return await self._run(self.client.unlike, post_id)
+
+    async def likers(self, post_id: str) -> Likers | None:
+        return await self._run(self.client.likers, post_id)
+
+    async def iter_likers(
+        self,
+        post_id: str,
+        count: int = 0,
+        stream: bool = False,
+        resume_from: Checkpoint | None = None,
+        autosave: Callable[[Checkpoint], None] | str | None = None,
+        autosave_every: int = 1,
+        prefetch: int = 0
+    ) -> AsyncGenerator[Liker, None]:
+
+        """
+        Generates the users who liked the target post, page after page.
+        :param post_id: ID of target post, fetch using get_post_id() method
+        :param count: Amount of likers to fetch
+        :param stream: (Optional) Yield each user as soon as it's downloaded, instead of once the whole page is in
+        :param resume_from: (Optional) Checkpoint to continue from. It's updated in place as users are generated
+        :param autosave: (Optional) Function called with the checkpoint, or path of a JSON file to save it in
+        :param autosave_every: (Optional) Number of pages after which the checkpoint is autosaved
+        :param prefetch: (Optional) Number of pages fetched in the background, ahead of the ones being generated
+        :return: Async generator which yields each user's details
+        """
+
+        async for user in self._iterate(self.client.iter_likers(
+            post_id, count, stream=stream,
+            resume_from=resume_from, autosave=autosave, autosave_every=autosave_every, prefetch=prefetch
+        )):
+            yield user
+
+    async def comments(
+        self,
+        post_id: str,
+        count: int = 0,
+        replies: bool = False,
+        resume_from: Checkpoint | None = None,
+        autosave: Callable[[Checkpoint], None] | str | None = None,
+        autosave_every: int = 1,
+        prefetch: int = 0
+    ) -> AsyncGenerator[Comment, None]:
+
+        """
+        Generates the comments on the target post, page after page.
+        :param post_id: ID of target post, fetch using get_post_id() method
+        :param count: Amount of comments to fetch. Replies aren't counted
+        :param replies: (Optional) Also fetch each comment's replies, generated right after it
+        :param resume_from: (Optional) Checkpoint to continue from. It's updated in place as comments are generated
+        :param autosave: (Optional) Function called with the checkpoint, or path of a JSON file to save it in
+        :param autosave_every: (Optional) Number of pages after which the checkpoint is autosaved
+        :param prefetch: (Optional) Number of pages fetched in the background, ahead of the ones being generated
+        :return: Async generator which yields each comment
+        """
+
+        async for comment in self._iterate(self.client.comments(
+            post_id, count, replies=replies,
+            resume_from=resume_from, autosave=autosave, autosave_every=autosave_every, prefetch=prefetch
+        )):
+            yield comment
+
+    def close(self) -> None:
+        super().close()
+        self.client.request_session.close()
@@ -1,29 +1,33 @@
 import json
 import random
 import string
-import requests
 import pyotp
 import ntplib
 from requests import Session
 from requests import Response
 from json import JSONDecodeError
+from .JsonBackend import decode_response
 from .PasswordEncryption import PasswordEncryption
 from .lib.Exceptions import (AuthenticationError, NetworkError)
 from .SessionHost import SessionHost
+from .Transport import Transport
+from .ProxyPool import ProxyPool
 
 
 def new_session_id(
     user_identifier: str,  # Username or Email
     password: str,
-    proxy: dict[str, str],
-    totp_token: str = None
+    proxy: dict[str, str] | ProxyPool,
+    totp_token: str = None,
+    transport: Transport = None
 ) -> str:
     
-    request_session: Session = requests.Session()
+    transport: Transport = transport if transport is not None else Transport()
+    request_session: Session = transport.session()
     request_session.headers["user-agent"] = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 " \
                                             "(KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
 
-    if proxy is not None: request_session.proxies.update(proxy)
+    transport.apply_proxy(request_session, proxy)
 
     encryption = PasswordEncryption(request_session)
     encrypted_password = encryption.encrypt(password)
@@ -75,7 +79,7 @@ def new_session_id(
     )
 
     try:
-        response_json: dict = http_response.json()
+        response_json: dict = decode_response(http_response)
 
         if response_json.get("status", "") != "ok":
 
@@ -169,7 +173,7 @@ def new_session_id(
                         )
                     
                     try:
-                        tf_response_json: dict = tf_response.json()
+                        tf_response_json: dict = decode_response(tf_response)
                     
                         if tf_response_json.get("status", "") != "ok" \
                                 or tf_response_json.get("authenticated", False) is False:
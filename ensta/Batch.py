@@ -0,0 +1,65 @@
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from collections.abc import Callable, Generator, Iterable, Iterator
+
+# Requests kept in flight by default by batch methods, e.g. profiles()
+DEFAULT_CONCURRENCY: int = 8
+
+
+def run_batch(
+    function: Callable[[str], any],
+    identifiers: Iterable[str | int],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    normalize: Callable[[str | int], str] = str
+) -> Generator[tuple[str, any, Exception | None], None, None]:
+
+    """
+    Calls a function once per unique identifier, on up to 'concurrency' threads at the same time.
+
+    - Identifiers are read lazily, so a huge (or endless) iterable never gets queued up all at once.
+    - Results are yielded in completion order, as (identifier, result, None) or (identifier, None, error).
+    - A failing call doesn't stop the batch. Closing the generator cancels every call that hasn't started.
+
+    :param function: Function called with each normalized identifier
+    :param identifiers: Usernames, UserIDs, ... Duplicates (after normalizing) are only called once
+    :param concurrency: (Optional) Max number of calls running at the same time
+    :param normalize: (Optional) Function turning an identifier into its canonical form
+    :return: Generator which yields (identifier, result, error) tuples
+    """
+
+    if concurrency < 1: raise ValueError("Concurrency must be at least 1.")
+
+    pending: dict[Future, str] = {}
+    seen: set[str] = set()
+    remaining: Iterator[str | int] = iter(identifiers)
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="ensta-batch")
+
+    def submit_next() -> bool:
+        for each in remaining:
+            identifier: str = normalize(each)
+            if not identifier or identifier in seen: continue
+
+            seen.add(identifier)
+            pending[executor.submit(function, identifier)] = identifier
+            return True
+
+        return False
+
+    try:
+        while len(pending) < concurrency and submit_next(): pass
+
+        while len(pending) > 0:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                identifier: str = pending.pop(future)
+                error: BaseException | None = future.exception()
+
+                # Refill before yielding, so the pool stays busy while the caller handles this result
+                submit_next()
+
+                if error is None: yield identifier, future.result(), None
+                elif isinstance(error, Exception): yield identifier, None, error
+                else: raise error
+
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
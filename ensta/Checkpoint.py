@@ -0,0 +1,119 @@
+import os
+import json
+from dataclasses import dataclass, field, fields
+from collections.abc import Callable
+
+
+@dataclass
+class Checkpoint:
+    """
+    Cursor of a paginator (followers, followings, posts), so an interrupted crawl can carry on where it stopped.
+
+    - Pass one as 'resume_from': It's updated in place while items are generated.
+    - A fresh Checkpoint() starts from the first page, a saved one continues from the page it was on,
+      skipping the items of that page which were already generated.
+    - With an 'autosave' hook, it's persisted every 'autosave_every' pages, and once the crawl is over.
+    - 'nested' counts the items of the current item's thread (e.g. - a comment & its replies) already generated.
+    """
+
+    kind: str = ""
+    target: str = ""
+    max_id: str = ""
+    generated_count: int = 0
+    offset: int = 0
+    pages: int = 0
+    nested: int = 0
+    done: bool = False
+
+    autosave: Callable[["Checkpoint"], None] | None = field(default=None, repr=False, compare=False)
+    autosave_every: int = field(default=1, repr=False, compare=False)
+
+    def start(
+        self,
+        kind: str,
+        target: str,
+        autosave: Callable[["Checkpoint"], None] | str | None = None,
+        autosave_every: int = 1
+    ) -> None:
+
+        """
+        Binds the checkpoint to a crawl. Called by paginators before their first request.
+        :param kind: Paginator's name. e.g. - "followers"
+        :param target: UserID or Username being crawled
+        :param autosave: (Optional) Function called with the checkpoint, or path of a JSON file to save it in
+        :param autosave_every: (Optional) Number of pages after which it's saved
+        :return: None
+        """
+
+        if (self.kind or self.target) and (self.kind, self.target) != (kind, str(target)): raise ValueError(
+            f"Checkpoint belongs to {self.kind} of \"{self.target}\", it can't resume {kind} of \"{target}\"."
+        )
+
+        if autosave_every < 1: raise ValueError("autosave_every must be at least 1.")
+
+        self.kind, self.target = kind, str(target)
+
+        if isinstance(autosave, str):
+            path: str = autosave
+            autosave = lambda checkpoint: checkpoint.save(path)
+
+        if autosave is not None:
+            self.autosave = autosave
+            self.autosave_every = autosave_every
+
+    def advance(self, next_max_id: str) -> None:
+        """
+        Moves on to the next page.
+        :param next_max_id: Cursor of the next page
+        :return: None
+        """
+
+        self.max_id = next_max_id
+        self.offset = 0
+        self.nested = 0
+        self.pages += 1
+
+        if self.autosave is not None and self.pages % self.autosave_every == 0: self.autosave(self)
+
+    def stop(self, complete: bool) -> None:
+        """
+        Called when the paginator returns.
+        :param complete: True if every item was generated (resuming generates nothing), False if the count was
+                         reached (resuming with a larger count carries on from here)
+        :return: None
+        """
+
+        self.done = complete
+        if self.autosave is not None: self.autosave(self)
+
+    def to_dict(self) -> dict:
+        return {each.name: getattr(self, each.name) for each in fields(self) if each.compare}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Checkpoint":
+        names: set[str] = {each.name for each in fields(cls) if each.compare}
+        return cls(**{key: value for key, value in data.items() if key in names})
+
+    def save(self, path: str) -> None:
+        """
+        Saves the checkpoint as JSON. It's written to a temporary file first, so it's never left half-written.
+        :param path: JSON file
+        :return: None
+        """
+
+        temporary: str = f"{path}.tmp"
+
+        with open(temporary, "w") as file: json.dump(self.to_dict(), file)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str) -> "Checkpoint":
+        """
+        Loads a saved checkpoint.
+        :param path: JSON file
+        :return: Saved Checkpoint, or a fresh one if the file doesn't exist yet
+        """
+
+        if not os.path.isfile(path): return cls()
+
+        with open(path, "r") as file: return cls.from_dict(json.load(file))
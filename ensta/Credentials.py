@@ -1,5 +1,6 @@
 import json
 from json import JSONDecodeError
+from .JsonBackend import loads, decode_response
 from requests import Session, Response
 import os
 from uuid import uuid4
@@ -88,7 +89,7 @@ class Credentials:
             content: str = file.read().strip()
 
         # Is Content A Valid JSON?
-        try: return json.loads(content)
+        try: return loads(content)
 
         # File Content Not A Valid JSON
         except JSONDecodeError: return dict()
@@ -133,7 +134,7 @@ class Credentials:
             response_headers: CaseInsensitiveDict[str] | None = None
 
             # Parse Response Body Into A JSON
-            response_dict: dict = response.json()
+            response_dict: dict = decode_response(response)
 
             # Request Failed
             if response_dict.get("status", "fail") != "ok":
@@ -273,4 +274,4 @@ class Credentials:
         Error: CSRF Token missing or incorrect.
         """
 
-        raise Exception(response.json())
+        raise Exception(decode_response(response))
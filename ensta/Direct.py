@@ -5,6 +5,8 @@ import string
 import random
 from .lib.Exceptions import FileTypeError, NetworkError
 from json import JSONDecodeError
+from .JsonBackend import decode_response
+from .ResumableUpload import rupload
 from pathlib import Path
 from ensta.Utils import fb_uploader
 
@@ -58,7 +60,7 @@ class Direct:
         )
 
         try:
-            return response.json().get("status", "") == "ok"
+            return decode_response(response).get("status", "") == "ok"
 
         except JSONDecodeError:
             return False
@@ -77,29 +79,23 @@ class Direct:
                 "Only jpg and jpeg image types can be uploaded."
             )
 
-        with open(media_path, "rb") as file:
-            media_data: bytes = file.read()
-
         upload_name: str = fb_uploader()
-        media_length: str = str(len(media_data))
 
-        response: Response = self.session.post(
-            url=f"https://rupload.facebook.com/messenger_image/{upload_name}",
-            headers={
-                "content-length": media_length,
+        response: Response = rupload(
+            self.session,
+            f"https://rupload.facebook.com/messenger_image/{upload_name}",
+            media_path,
+            {
                 "content-type": "application/octet-stream",
                 "host": "rupload.facebook.com",
                 "x-entity-name": upload_name,
                 "x-entity-type": "image/jpeg",
-                "x-entity-length": media_length,
-                "offset": "0",
                 "image_type": "FILE_ATTACHMENT"
-            },
-            data=media_data
+            }
         )
 
         try:
-            return response.json().get("media_id")
+            return decode_response(response).get("media_id")
 
         except JSONDecodeError:
             raise NetworkError(
@@ -139,7 +135,7 @@ class Direct:
         )
 
         try:
-            return response.json().get("status", "") == "ok"
+            return decode_response(response).get("status", "") == "ok"
 
         except JSONDecodeError:
             return False
@@ -0,0 +1,335 @@
+import io
+import os
+import csv
+import json
+from dataclasses import fields, is_dataclass
+from collections.abc import Callable, Iterable
+from .Checkpoint import Checkpoint
+from .JsonBackend import loads
+from .containers.PostView import PostView
+
+try: import orjson
+except ImportError: orjson = None
+
+try: import pyarrow
+except ImportError: pyarrow = None
+
+NDJSON: str = "ndjson"  # One JSON Object per line, nested like the rows
+CSV: str = "csv"  # One column per field, nested rows flattened as "user.username"
+PARQUET: str = "parquet"  # Same columns as CSV, typed from the fields' annotations. Requires pyarrow
+
+FORMATS: tuple[str, ...] = (NDJSON, CSV, PARQUET)
+
+# File extension -> Format
+EXTENSIONS: dict[str, str] = {".ndjson": NDJSON, ".jsonl": NDJSON, ".csv": CSV, ".parquet": PARQUET}
+
+DEFAULT_BATCH_SIZE: int = 1000
+
+# Type -> Its fields' names, or None if it isn't a dataclass
+_field_names: dict[type, tuple[str, ...]] = {}
+
+# Annotation -> Column kind. Anything else (lists, dicts, ...) is stored as JSON text
+_KINDS: dict[type, str] = {bool: "bool", int: "int64", float: "float64", str: "string"}
+
+_CASTS: dict[str, Callable[[any], any]] = {"bool": bool, "int64": int, "float64": float, "string": str}
+
+if orjson is not None: _dumps: Callable[[any], bytes] = orjson.dumps
+else: _dumps: Callable[[any], bytes] = lambda value: json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class Exporter:
+    """
+    Writes the rows of any ensta generator (followers, followings, posts, likers, ...) to an NDJSON, CSV or Parquet file.
+
+    - Rows are written in batches of 'batch_size': That's all that is kept in memory, however long the crawl is.
+    - They go to "<path>.part" first. The file only appears at 'path' once every row is in.
+    - With a checkpoint (the one given to the paginator as 'resume_from'), each batch is committed together with
+      the checkpoint's position in "<path>.state". If the crawl is interrupted, running the same export again
+      carries on after the last committed batch: No row is written twice, or skipped.
+    - Parquet files can't be appended to, so its rows are spooled to the .part file and converted at the end.
+    """
+
+    path: str
+    format: str
+    batch_size: int
+    checkpoint: Checkpoint | None
+    rows: int
+
+    def __init__(
+        self,
+        path: str,
+        format: str | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        checkpoint: Checkpoint | None = None
+    ) -> None:
+
+        """
+        :param path: File to write
+        :param format: (Optional) NDJSON, CSV or PARQUET. By default, it's guessed from the path's extension
+        :param batch_size: (Optional) Number of rows written at once
+        :param checkpoint: (Optional) Checkpoint the rows' paginator resumes from, to make the export resumable
+        """
+
+        if format is None: format = EXTENSIONS.get(os.path.splitext(path)[1].lower())
+
+        if format not in FORMATS: raise ValueError(
+            f"Unknown export format \"{format}\". Available formats: {', '.join(FORMATS)}"
+        )
+
+        if batch_size < 1: raise ValueError("batch_size must be at least 1.")
+        if format == PARQUET and pyarrow is None: raise ImportError(
+            "pyarrow isn't installed. Install it using: pip install pyarrow"
+        )
+
+        self.path = path
+        self.format = format
+        self.batch_size = batch_size
+        self.checkpoint = checkpoint
+        self.rows = 0
+
+        self._columns: list[list[str]] | None = None
+        self._committed_bytes: int = 0
+
+        self._line = io.StringIO()
+        self._csv = csv.writer(self._line)
+
+    @property
+    def part_path(self) -> str:
+        return f"{self.path}.part"
+
+    @property
+    def state_path(self) -> str:
+        return f"{self.path}.state"
+
+    def write(self, rows: Iterable) -> int:
+        """
+        Writes every row, then moves the file into place.
+        :param rows: Rows. Paginators must not have been started yet. None items are skipped
+        :return: Number of rows in the file
+        """
+
+        file = self._open()
+        batch: list[bytes] = []
+        iterator = iter(rows)
+
+        try:
+            while True:
+                try: row = next(iterator)
+                except StopIteration: break
+
+                # Paginators raise their errors on the call after their last row: Those rows can be kept
+                except Exception:
+                    self._commit(file, batch)
+                    raise
+
+                if row is None: continue
+
+                # The paginator has moved past every buffered row, so the checkpoint matches them exactly
+                if len(batch) >= self.batch_size:
+                    self._commit(file, batch)
+                    batch = []
+
+                batch.append(self._encode(row))
+
+            self._commit(file, batch)
+
+        except BaseException:
+            # Nothing to resume from
+            if self.checkpoint is None:
+                file.close()
+                os.remove(self.part_path)
+
+            raise
+
+        finally: file.close()
+
+        self._finish()
+        return self.rows
+
+    def _open(self) -> io.BufferedWriter:
+        state: dict | None = None
+
+        if self.checkpoint is not None and os.path.isfile(self.state_path):
+            with open(self.state_path, "r") as file: state = json.load(file)
+
+            part_size: int = os.path.getsize(self.part_path) if os.path.isfile(self.part_path) else -1
+            if state.get("format") != self.format or part_size < state["bytes"]: state = None
+
+        if state is None:
+            if self.checkpoint is not None:
+                for name, value in Checkpoint().to_dict().items(): setattr(self.checkpoint, name, value)
+
+            return open(self.part_path, "wb")
+
+        # Rows written after the last commit are dropped: The checkpoint didn't count them
+        for name, value in Checkpoint.from_dict(state["checkpoint"]).to_dict().items():
+            setattr(self.checkpoint, name, value)
+
+        self.rows = state["rows"]
+        self._columns = state["columns"]
+        self._committed_bytes = state["bytes"]
+
+        file = open(self.part_path, "r+b")
+        file.truncate(self._committed_bytes)
+        file.seek(self._committed_bytes)
+
+        return file
+
+    def _encode(self, row: any) -> bytes:
+        if isinstance(row, PostView): row = row.to_post()
+        if self.format == NDJSON: return _dumps(_plain(row)) + b"\n"
+
+        header: bytes = b""
+
+        if self._columns is None:
+            self._columns = _columns(row)
+            if self.format == CSV: header = self._csv_line([name for name, _ in self._columns])
+
+        values: list = [_cast(_value(row, name), kind) for name, kind in self._columns]
+
+        if self.format == CSV: return header + self._csv_line(["" if value is None else value for value in values])
+        return _dumps(values) + b"\n"
+
+    def _csv_line(self, values: list) -> bytes:
+        self._line.seek(0)
+        self._line.truncate()
+        self._csv.writerow(values)
+
+        return self._line.getvalue().encode("utf-8")
+
+    def _commit(self, file: io.BufferedWriter, batch: list[bytes]) -> None:
+        if batch:
+            file.write(b"".join(batch))
+            file.flush()
+            os.fsync(file.fileno())
+
+            self.rows += len(batch)
+            self._committed_bytes = file.tell()
+
+        if self.checkpoint is None: return None
+
+        temporary: str = f"{self.state_path}.tmp"
+
+        with open(temporary, "w") as state: json.dump({
+            "format": self.format,
+            "rows": self.rows,
+            "bytes": self._committed_bytes,
+            "columns": self._columns,
+            "checkpoint": self.checkpoint.to_dict()
+        }, state)
+
+        os.replace(temporary, self.state_path)
+
+    def _finish(self) -> None:
+        if self.format == PARQUET: self._write_parquet()
+        else: os.replace(self.part_path, self.path)
+
+        if os.path.isfile(self.state_path): os.remove(self.state_path)
+
+    def _write_parquet(self) -> None:
+        import pyarrow.parquet
+
+        columns: list[list[str]] = self._columns or []
+        types: dict[str, any] = {
+            "bool": pyarrow.bool_(), "int64": pyarrow.int64(), "float64": pyarrow.float64(),
+            "string": pyarrow.string(), "json": pyarrow.string()
+        }
+
+        schema = pyarrow.schema([(name, types[kind]) for name, kind in columns])
+        temporary: str = f"{self.path}.tmp"
+
+        def write_batch(writer, batch: list[list]) -> None:
+            writer.write_table(pyarrow.Table.from_arrays(
+                [pyarrow.array(values, field.type) for values, field in zip(zip(*batch), schema)], schema=schema
+            ))
+
+        with open(self.part_path, "rb") as spool, pyarrow.parquet.ParquetWriter(temporary, schema) as writer:
+            batch: list[list] = []
+
+            for line in spool:
+                batch.append(loads(line))
+
+                if len(batch) == self.batch_size:
+                    write_batch(writer, batch)
+                    batch = []
+
+            if batch: write_batch(writer, batch)
+
+        os.replace(temporary, self.path)
+        os.remove(self.part_path)
+
+
+def export(
+    rows: Iterable,
+    path: str,
+    format: str | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    checkpoint: Checkpoint | None = None
+) -> int:
+
+    """
+    Writes the rows of an ensta generator to a file. e.g. - export(host.followers("leomessi"), "followers.csv")
+    :param rows: Rows. Pass 'checkpoint' to the paginator too (as 'resume_from') to make the export resumable
+    :param path: File to write
+    :param format: (Optional) NDJSON, CSV or PARQUET. By default, it's guessed from the path's extension
+    :param batch_size: (Optional) Number of rows written at once
+    :param checkpoint: (Optional) Checkpoint the rows' paginator resumes from
+    :return: Number of rows in the file
+    """
+
+    return Exporter(path, format, batch_size, checkpoint).write(rows)
+
+
+def _plain(value: any) -> any:
+    """
+    Turns rows into JSON Objects. Unlike dataclasses.asdict(), nothing is deep-copied.
+    """
+
+    names: tuple[str, ...] | None = _field_names.get(type(value), ())
+
+    if names == ():
+        dataclass: bool = is_dataclass(value) and not isinstance(value, type)
+        names = _field_names[type(value)] = tuple(field.name for field in fields(value)) if dataclass else None
+
+    if names is None: return value
+    return {name: _plain(getattr(value, name)) for name in names}
+
+
+def _kind(annotation: any) -> str:
+    return _KINDS.get(annotation, "json") if isinstance(annotation, type) else "json"
+
+
+def _columns(row: any) -> list[list[str]]:
+    """
+    Returns [name, kind] of each column. Nested dataclasses (e.g. - Post.user) get a column per field.
+    """
+
+    if isinstance(row, dict):
+        return [[key, _KINDS.get(type(value), "json") if value is not None else "json"] for key, value in row.items()]
+
+    columns: list[list[str]] = []
+
+    for field in fields(row):
+        if isinstance(field.type, type) and is_dataclass(field.type):
+            columns += [[f"{field.name}.{nested.name}", _kind(nested.type)] for nested in fields(field.type)]
+
+        else: columns.append([field.name, _kind(field.type)])
+
+    return columns
+
+
+def _value(row: any, name: str) -> any:
+    if isinstance(row, dict): return row.get(name)
+
+    for each in name.split("."):
+        if row is None: return None
+        row = getattr(row, each, None)
+
+    return row
+
+
+def _cast(value: any, kind: str) -> any:
+    if value is None: return None
+    if kind == "json": return _dumps(_plain(value)).decode()
+
+    return _CASTS[kind](value)
@@ -0,0 +1,87 @@
+from collections.abc import Iterable, Sequence
+from .containers.FollowPerson import FollowPerson
+from .containers.FollowersDiff import FollowersDiff
+
+# Consecutive known followers after which the rest of the list is assumed unchanged
+DEFAULT_KNOWN_RUN: int = 50
+
+
+def diff_followers(
+    followers: Iterable[FollowPerson | None],
+    previous: Sequence[str | int],
+    known_run: int = DEFAULT_KNOWN_RUN,
+    full: bool = False
+) -> FollowersDiff:
+
+    """
+    Compares current followers with a previous snapshot.
+
+    Followers are listed newest first, so new followers all come before the ones already known.
+    Pagination stops once 'known_run' known followers were seen in a row, which makes a daily diff
+    cost about as many pages as there were new followers, instead of the whole list.
+
+    :param followers: Current followers, newest first. e.g. - host.followers(uid)
+    :param previous: UserIDs of the previous snapshot, newest first (FollowersDiff.snapshot)
+    :param known_run: (Optional) Consecutive known followers after which pagination stops
+    :param full: (Optional) Read the whole list, to also catch old followers who left
+    :return: FollowersDiff
+    """
+
+    if known_run < 1: raise ValueError("known_run must be at least 1.")
+
+    previous: list[str] = [str(uid) for uid in previous]
+    positions: dict[str, int] = {}
+
+    for index, uid in enumerate(previous): positions.setdefault(uid, index)
+
+    current: list[str] = []
+    seen: set[str] = set()
+    added: list[str] = []
+
+    run: int = 0
+    deepest: int = -1
+    complete: bool = True
+
+    iterator = iter(followers)
+
+    try:
+        for person in iterator:
+
+            # Paginators yield None right before raising an error
+            if person is None: continue
+
+            uid: str = str(person.user_id)
+
+            # Pages can overlap while the list is changing
+            if uid in seen: continue
+
+            seen.add(uid)
+            current.append(uid)
+
+            index: int | None = positions.get(uid)
+
+            if index is None:
+                added.append(uid)
+                run = 0
+                continue
+
+            deepest = max(deepest, index)
+            run += 1
+
+            if not full and run >= known_run:
+                complete = False
+                break
+
+    finally:
+        if hasattr(iterator, "close"): iterator.close()
+
+    # Past the deepest known follower seen, the previous snapshot is carried over as it was
+    compared: list[str] = previous if complete else previous[:deepest + 1]
+    unchanged: list[str] = [] if complete else [uid for uid in previous[deepest + 1:] if uid not in seen]
+
+    return FollowersDiff(
+        added=added,
+        removed=[uid for uid in dict.fromkeys(compared) if uid not in seen],
+        snapshot=current + unchanged,
+        complete=complete
+    )
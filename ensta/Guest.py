@@ -5,14 +5,29 @@ import dataclasses
 from json import JSONDecodeError
 from .containers.Profile import Profile
 from .containers.ProfileHost import ProfileHost
+from .containers.ProfileResult import ProfileResult
 from .lib.Exceptions import APIError, NetworkError, RateLimitedError
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Iterable
 from .containers.Post import Post
 from .containers.PostUser import PostUser
+from .containers.PostView import PostView
+from .Transport import Transport
+from .ProxyPool import ProxyPool
+from .HeaderTemplate import HeaderTemplate, CSRF_TOKEN, WWW_CLAIM, REFERER
+from .JsonBackend import decode_response
+from .IdentifierCache import IdentifierCache, MISSING
+from .Checkpoint import Checkpoint
+from .Paginator import paginate
+from .Batch import run_batch, DEFAULT_CONCURRENCY
+from .RawPayload import KEEP, check_raw_payload, retain_raw
 
 
 class Guest:
     request_session: requests.Session = None
+    transport: Transport = None
+    identifier_cache: IdentifierCache = None
+    raw_payload: str = KEEP
+    header_templates: dict[str, HeaderTemplate] | None = None
     homepage_source: str = None
     insta_app_id: str = "936619743392459"
     preferred_color_scheme: str = "dark"
@@ -21,13 +36,39 @@ class Guest:
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 " \
                       "(KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
 
-    def __init__(self, proxy: dict[str, str] | None = None) -> None:
-        self.request_session = requests.Session()
+    def __init__(
+        self,
+        proxy: dict[str, str] | ProxyPool | None = None,
+        transport: Transport | None = None,
+        session: requests.Session | None = None,
+        identifier_cache: IdentifierCache | None = None,
+        raw_payload: str = KEEP
+    ) -> None:
+
+        """
+        :param proxy: (Optional) JSON Object of proxy, or a ProxyPool, to be used. See https://github.com/diezo/ensta
+        :param transport: (Optional) Connection pools to share with other clients
+        :param session: (Optional) Existing session (and cookie jar) to use instead of creating a new one
+        :param identifier_cache: (Optional) Username <-> UserID cache to share with other clients
+        :param raw_payload: (Optional) How much of the response profiles keep in 'raw': "keep", "trim" or "drop"
+        """
+
+        self.transport = transport if transport is not None else Transport()
+        self.identifier_cache = identifier_cache if identifier_cache is not None else IdentifierCache()
+        self.raw_payload = check_raw_payload(raw_payload)
         self.x_ig_www_claim = "hmac." + "".join(random.choices(string.ascii_letters + string.digits + "_-", k=48))
-        self.csrf_token = "".join(random.choices(string.ascii_letters + string.digits, k=32))
-        self.request_session.cookies.set("csrftoken", self.csrf_token)
 
-        if proxy is not None: self.request_session.proxies.update(proxy)
+        if session is not None: self.request_session = session
+        else: self.request_session = self.transport.session()
+
+        # Shared session? Reuse its csrf token, so that header & cookie always match
+        self.csrf_token = self.request_session.cookies.get("csrftoken")
+
+        if self.csrf_token is None:
+            self.csrf_token = "".join(random.choices(string.ascii_letters + string.digits, k=32))
+            self.request_session.cookies.set("csrftoken", self.csrf_token)
+
+        self.transport.apply_proxy(self.request_session, proxy)
 
     def username_availability(self, username: str) -> bool | None:
         username = username.replace(" ", "").lower()
@@ -38,29 +79,7 @@ class Guest:
             "first_name": username.capitalize(),
             "opt_into_one_tap": False
         }
-        request_headers = {
-            "accept": "*/*",
-            "accept-language": "en-US,en;q=0.9",
-            "content-type": "application/x-www-form-urlencoded",
-            "sec-ch-prefers-color-scheme": self.preferred_color_scheme,
-            "sec-ch-ua": self.user_agent,
-            "sec-ch-ua-full-version-list": self.user_agent,
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": "\"Windows\"",
-            "sec-ch-ua-platform-version": "\"15.0.0\"",
-            "sec-fetch-dest": "empty",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-site": "same-origin",
-            "viewport-width": "1475",
-            "x-asbd-id": "198387",
-            "x-csrftoken": self.csrf_token,
-            "x-ig-app-id": self.insta_app_id,
-            "x-ig-www-claim": "0",
-            "x-instagram-ajax": "1007614758",
-            "x-requested-with": "XMLHttpRequest",
-            "Referer": "https://www.instagram.com/accounts/emailsignup/",
-            "Referrer-Policy": "strict-origin-when-cross-origin"
-        }
+        request_headers = self._headers("signup")
 
         try:
             http_response = self.request_session.post(
@@ -68,7 +87,7 @@ class Guest:
                 headers=request_headers,
                 data=body_json
             )
-            response_json = http_response.json()
+            response_json = decode_response(http_response)
 
             if "errors" in response_json:
                 return "username" not in response_json["errors"]
@@ -78,27 +97,7 @@ class Guest:
     def profile(self, username: str, __session__: requests.Session | None = None) -> Profile | ProfileHost | None:
         username: str = username.replace(" ", "").lower()
 
-        request_headers: dict = {
-            "accept": "*/*",
-            "accept-language": "en-US,en;q=0.9",
-            "sec-ch-prefers-color-scheme": self.preferred_color_scheme,
-            "sec-ch-ua": self.user_agent,
-            "sec-ch-ua-full-version-list": self.user_agent,
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": "\"Windows\"",
-            "sec-ch-ua-platform-version": "\"15.0.0\"",
-            "sec-fetch-dest": "empty",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-site": "same-origin",
-            "viewport-width": "1475",
-            "x-asbd-id": "198387",
-            "x-csrftoken": self.csrf_token,
-            "x-ig-app-id": self.insta_app_id,
-            "x-ig-www-claim": "0",
-            "x-requested-with": "XMLHttpRequest",
-            "Referer": f"https://www.instagram.com/{username}/",
-            "Referrer-Policy": "strict-origin-when-cross-origin"
-        }
+        request_headers = self._headers("profile", referer=f"https://www.instagram.com/{username}/")
 
         session: requests.Session = __session__
         if __session__ is None: session: requests.Session = self.request_session
@@ -121,8 +120,10 @@ class Guest:
                 "And be careful next time to avoid a permanent ban."
             )
 
+        if http_response.status_code == 404: self.identifier_cache.put_missing(username)
+
         try:
-            response_json: dict = http_response.json()
+            response_json: dict = decode_response(http_response)
 
             if "status" in response_json:
                 if response_json["status"] == "ok" and "data" in response_json:
@@ -131,10 +132,13 @@ class Guest:
                             data: dict = response_json["data"]["user"]
 
                             if data is None:
+                                self.identifier_cache.put_missing(username)
                                 raise APIError("User object not found inside HTTP response.")
 
+                            self.identifier_cache.put(data.get("username", username), data.get("id"))
+
                             profile = Profile(
-                                raw=data,
+                                raw=retain_raw(data, self.raw_payload),
                                 biography=data["biography"],
                                 biography_links=data["bio_links"],
                                 country_block=data["country_block"],
@@ -169,8 +173,9 @@ class Guest:
                             if __session__ is not None:
                                 profile_host = ProfileHost()
 
-                                for key, value in dataclasses.asdict(profile).items():
-                                    setattr(profile_host, key, value)
+                                # Shallow: asdict() would deep-copy 'raw'
+                                for each in dataclasses.fields(profile):
+                                    setattr(profile_host, each.name, getattr(profile, each.name))
 
                                 profile_host.blocked_by_viewer = data["blocked_by_viewer"]
                                 profile_host.followed_by_viewer = data["followed_by_viewer"]
@@ -190,15 +195,46 @@ class Guest:
         except JSONDecodeError:
             raise NetworkError("HTTP Response is not a valid JSON.")
 
+    def profiles(
+        self,
+        usernames: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        __session__: requests.Session | None = None
+    ) -> Generator[ProfileResult, None, None]:
+
+        """
+        Fetches many profiles at once. Requests still go through the Transport's RateLimiter.
+        :param usernames: Usernames of the targets. Duplicates are only fetched once
+        :param concurrency: (Optional) Max number of profiles fetched at the same time
+        :return: Generator which yields a ProfileResult per username, as soon as each one is done
+        """
+
+        for username, profile, error in run_batch(
+            lambda each: self.profile(each, __session__),
+            usernames,
+            concurrency,
+            lambda each: str(each).replace(" ", "").lower()
+        ):
+            yield ProfileResult(identifier=username, profile=profile, error=error)
+
     def get_uid(self, username: str, __session__: requests.Session | None = None) -> str | None:
         username: str = username.strip().lower().replace(" ", "")
+
+        cached_uid: str | None = self.identifier_cache.get_uid(username)
+
+        if cached_uid == MISSING: return None
+        if cached_uid is not None: return cached_uid
+
         response: Profile | None = self.profile(username, __session__)
 
-        if response.user_id is not None:
+        if response is not None and response.user_id is not None:
             return response.user_id.replace(" ", "")
 
     def get_username(self, uid: str | int, __session__: requests.Session | None = None) -> str | None:
-        uid = uid.replace(" ", "")
+        uid = str(uid).replace(" ", "")
+
+        cached_username: str | None = self.identifier_cache.get_username(uid)
+        if cached_username is not None: return cached_username
 
         request_headers = {
             "User-Agent": "Instagram 76.0.0.15.395 Android (24/7.0; 640dpi; 1440x2560; "
@@ -210,105 +246,173 @@ class Guest:
             if __session__ is None: session: requests.Session = self.request_session
 
             http_response = session.get(f"https://i.instagram.com/api/v1/users/{uid}/info/", headers=request_headers)
-            response_json = http_response.json()
+            response_json = decode_response(http_response)
 
             if "status" in response_json \
                     and response_json["status"] == "ok" \
                     and "user" in response_json \
                     and "username" in response_json["user"]:
 
-                return response_json["user"]["username"].replace(" ", "").lower()
+                username: str = response_json["user"]["username"].replace(" ", "").lower()
+                self.identifier_cache.put(username, uid)
+
+                return username
 
         except JSONDecodeError:
             raise NetworkError("HTTP Response is not a valid JSON.")
 
-    def posts(self, username: str, count: int = 0, __session__: requests.Session | None = None) -> Generator[Post, None, None]:
+    def posts(
+        self,
+        username: str,
+        count: int = 0,
+        __session__: requests.Session | None = None,
+        stream: bool = False,
+        resume_from: Checkpoint | None = None,
+        autosave: Callable[[Checkpoint], None] | str | None = None,
+        autosave_every: int = 1,
+        prefetch: int = 0,
+        lazy: bool = False
+    ) -> Generator[Post | PostView, None, None]:
+
         """
         Generates a list of target's posts of specified size.
         :param username: Target's Username
         :param count: Amount of posts to fetch
+        :param stream: (Optional) Yield each post as soon as it's downloaded, instead of once the whole page is in
         :param __session__: (Optional) Custom request session object
+        :param resume_from: (Optional) Checkpoint to continue from. It's updated in place as posts are generated
+        :param autosave: (Optional) Function called with the checkpoint, or path of a JSON file to save it in
+        :param autosave_every: (Optional) Number of pages after which the checkpoint is autosaved
+        :param prefetch: (Optional) Number of pages fetched in the background, ahead of the ones being generated
+        :param lazy: (Optional) Yield read-only PostViews, which read each field when it's accessed, instead of Posts
         :return: Generator which yields each post's data
         """
 
         username = username.replace(" ", "").lower()
 
-        request_headers = {
-            "accept": "*/*",
-            "accept-language": "en-US,en;q=0.9",
-            "sec-ch-prefers-color-scheme": self.preferred_color_scheme,
-            "sec-ch-ua": self.user_agent,
-            "sec-ch-ua-full-version-list": self.user_agent,
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": "\"Windows\"",
-            "sec-ch-ua-platform-version": "\"15.0.0\"",
-            "sec-fetch-dest": "empty",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-site": "same-origin",
-            "viewport-width": "1475",
-            "x-asbd-id": "129477",
-            "x-csrftoken": self.csrf_token,
-            "x-ig-app-id": self.insta_app_id,
-            "x-ig-www-claim": self.x_ig_www_claim,
-            "x-requested-with": "XMLHttpRequest",
-            "Referer": f"https://www.instagram.com/{username}/",
-            "Referrer-Policy": "strict-origin-when-cross-origin"
-        }
+        request_headers = self._headers("feed", referer=f"https://www.instagram.com/{username}/")
 
-        current_max_id = ""
-        generated_count = 0
+        session: requests.Session = __session__
+        if __session__ is None: session: requests.Session = self.request_session
 
-        while True:
-            current_max_id_text = ""
+        checkpoint: Checkpoint = resume_from if resume_from is not None else Checkpoint()
+        checkpoint.start("posts", username, autosave, autosave_every)
 
-            if current_max_id != "":
-                current_max_id_text = f"&max_id={current_max_id}"
+        count_text = 35 if count >= 35 else count
 
-            try:
-                count_text = 35
+        def request_page(max_id: str) -> requests.Response:
+            return session.get(
+                f"https://www.instagram.com/api/v1/feed/user/{username}/username/?count={count_text}"
+                f"{f'&max_id={max_id}' if max_id != '' else ''}",
+                headers=request_headers,
+                stream=stream
+            )
 
-                if count < 35:
-                    count_text = count
+        def build(each_item: dict) -> Post | PostView:
+            # From the raw item: Building the user view would defeat lazy=True
+            user: dict = each_item.get("user") or {}
+            self.identifier_cache.put(user.get("username"), user.get("pk"))
 
-                session: requests.Session = __session__
-                if __session__ is None: session: requests.Session = self.request_session
+            return PostView(each_item) if lazy else self.__process_post_data(each_item)
 
-                http_response = session.get(
-                    f"https://www.instagram.com/api/v1/feed/user/{username}/username/?count={count_text}"
-                    f"{current_max_id_text}",
-                    headers=request_headers
-                )
-                
-                response_json = http_response.json()
+        yield from paginate(
+            request_page, "items", build, checkpoint, count, stream, prefetch, raise_status_error=self.__raise_posts_error
+        )
 
-                if "status" not in response_json or "items" not in response_json:
-                    yield None
-                    raise NetworkError("HTTP response doesn't include 'status' or 'items' node.")
+    @staticmethod
+    def __raise_posts_error(response_json: dict) -> None:
+        if response_json.get("message", "") == "checkpoint_required":
+            raise RateLimitedError(
+                "IP Temporarily Flagged: Wait for some time, or switch "
+                "to a different WiFi Network, or use proxies."
+            )
 
-                if response_json["status"] != "ok":
-                    yield None
-                    
-                    if response_json.get("message", "") == "checkpoint_required":
-                        raise RateLimitedError(
-                            "IP Temporarily Flagged: Wait for some time, or switch "
-                            "to a different WiFi Network, or use proxies."
-                        )
+        raise NetworkError("Request failed.")
 
-                    raise NetworkError("Request failed.")
+    def _headers(self, name: str, referer: str = None) -> dict[str, str]:
+        """
+        Returns the headers of an endpoint, built from the template that's cached on this instance.
+        :param name: Template name, see _build_header_templates()
+        :param referer: Referer to fill in, if the template doesn't have a fixed one
+        :return: Headers
+        """
 
-                for each_item in response_json["items"]:
-                    if generated_count < count or count == 0:
+        if self.header_templates is None: self.header_templates = self._build_header_templates()
 
-                        yield self.__process_post_data(each_item)
-                        generated_count += 1
+        return self.header_templates[name].render(
+            csrf_token=self.csrf_token,
+            www_claim=self.x_ig_www_claim,
+            referer=referer
+        )
 
-                if (generated_count < count or count == 0) and "next_max_id" in response_json:
-                    current_max_id = response_json["next_max_id"]
-                else:
-                    return None
-            except JSONDecodeError:
-                yield None
-                raise NetworkError("HTTP Response is not a valid JSON.")
+    def _build_header_templates(self) -> dict[str, HeaderTemplate]:
+        return {
+            "signup": HeaderTemplate({
+                "accept": "*/*",
+                "accept-language": "en-US,en;q=0.9",
+                "content-type": "application/x-www-form-urlencoded",
+                "sec-ch-prefers-color-scheme": self.preferred_color_scheme,
+                "sec-ch-ua": self.user_agent,
+                "sec-ch-ua-full-version-list": self.user_agent,
+                "sec-ch-ua-mobile": "?0",
+                "sec-ch-ua-platform": "\"Windows\"",
+                "sec-ch-ua-platform-version": "\"15.0.0\"",
+                "sec-fetch-dest": "empty",
+                "sec-fetch-mode": "cors",
+                "sec-fetch-site": "same-origin",
+                "viewport-width": "1475",
+                "x-asbd-id": "198387",
+                "x-csrftoken": CSRF_TOKEN,
+                "x-ig-app-id": self.insta_app_id,
+                "x-ig-www-claim": "0",
+                "x-instagram-ajax": "1007614758",
+                "x-requested-with": "XMLHttpRequest",
+                "Referer": "https://www.instagram.com/accounts/emailsignup/",
+                "Referrer-Policy": "strict-origin-when-cross-origin"
+            }),
+            "profile": HeaderTemplate({
+                "accept": "*/*",
+                "accept-language": "en-US,en;q=0.9",
+                "sec-ch-prefers-color-scheme": self.preferred_color_scheme,
+                "sec-ch-ua": self.user_agent,
+                "sec-ch-ua-full-version-list": self.user_agent,
+                "sec-ch-ua-mobile": "?0",
+                "sec-ch-ua-platform": "\"Windows\"",
+                "sec-ch-ua-platform-version": "\"15.0.0\"",
+                "sec-fetch-dest": "empty",
+                "sec-fetch-mode": "cors",
+                "sec-fetch-site": "same-origin",
+                "viewport-width": "1475",
+                "x-asbd-id": "198387",
+                "x-csrftoken": CSRF_TOKEN,
+                "x-ig-app-id": self.insta_app_id,
+                "x-ig-www-claim": "0",
+                "x-requested-with": "XMLHttpRequest",
+                "Referer": REFERER,
+                "Referrer-Policy": "strict-origin-when-cross-origin"
+            }),
+            "feed": HeaderTemplate({
+                "accept": "*/*",
+                "accept-language": "en-US,en;q=0.9",
+                "sec-ch-prefers-color-scheme": self.preferred_color_scheme,
+                "sec-ch-ua": self.user_agent,
+                "sec-ch-ua-full-version-list": self.user_agent,
+                "sec-ch-ua-mobile": "?0",
+                "sec-ch-ua-platform": "\"Windows\"",
+                "sec-ch-ua-platform-version": "\"15.0.0\"",
+                "sec-fetch-dest": "empty",
+                "sec-fetch-mode": "cors",
+                "sec-fetch-site": "same-origin",
+                "viewport-width": "1475",
+                "x-asbd-id": "129477",
+                "x-csrftoken": CSRF_TOKEN,
+                "x-ig-app-id": self.insta_app_id,
+                "x-ig-www-claim": WWW_CLAIM,
+                "x-requested-with": "XMLHttpRequest",
+                "Referer": REFERER,
+                "Referrer-Policy": "strict-origin-when-cross-origin"
+            })
+        }
 
     @staticmethod
     def __process_post_data(data: dict) -> Post:
@@ -0,0 +1,49 @@
+class HeaderField:
+    """
+    Placeholder for a header value which is only known when the request is sent.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+CSRF_TOKEN = HeaderField("csrf_token")
+WWW_CLAIM = HeaderField("www_claim")
+REFERER = HeaderField("referer")
+
+
+class HeaderTemplate:
+    """
+    Request headers of one endpoint, built once per client.
+
+    - Static values are stored as they are, and the dict is copied for every request.
+    - HeaderField placeholders (csrf token, claim, referer) are filled in by render().
+    - Header order is preserved, placeholders keep their position.
+    """
+
+    __slots__ = ("static", "fields")
+
+    static: dict[str, str]
+    fields: tuple[tuple[str, str], ...]
+
+    def __init__(self, headers: dict[str, str | HeaderField]) -> None:
+        self.static = {key: ("" if isinstance(value, HeaderField) else value) for key, value in headers.items()}
+        self.fields = tuple(
+            (key, value.name) for key, value in headers.items() if isinstance(value, HeaderField)
+        )
+
+    def render(self, **values: str) -> dict[str, str]:
+        """
+        Returns a fresh headers dict with every placeholder filled in.
+        :param values: Value of each placeholder, by name. e.g. - csrf_token="...", referer="..."
+        :return: Headers
+        """
+
+        headers: dict[str, str] = self.static.copy()
+
+        for key, name in self.fields:
+            headers[key] = values[name]
+
+        return headers
@@ -3,6 +3,10 @@ import json
 from .SessionHost import SessionHost
 from .lib.Exceptions import SessionError
 from .Authentication import new_session_id
+from .Transport import Transport
+from .ProxyPool import ProxyPool
+from .IdentifierCache import IdentifierCache
+from .RawPayload import KEEP
 
 
 # noinspection PyMissingConstructor
@@ -17,8 +21,11 @@ class Host(SessionHost):
     load: any = None
     file: str | None = None
 
-    proxy: dict[str, str] = None
+    proxy: dict[str, str] | ProxyPool = None
     totp_token: str = None
+    transport: Transport = None
+    identifier_cache: IdentifierCache = None
+    raw_payload: str = KEEP
 
     def __init__(
         self,
@@ -27,8 +34,11 @@ class Host(SessionHost):
         file: str = None,
         save: any = None,
         load: any = None,
-        proxy: dict[str, str] = None,
-        totp_token: str = None
+        proxy: dict[str, str] | ProxyPool = None,
+        totp_token: str = None,
+        transport: Transport = None,
+        identifier_cache: IdentifierCache = None,
+        raw_payload: str = KEEP
     ) -> None:
 
         """
@@ -38,8 +48,11 @@ class Host(SessionHost):
         :param file: (Optional) Name of file to store session_data in. Eg: "session.txt"
         :param save: (Optional) Name of a function which will be called to save the generated session_data
         :param load: (Optional) Name of a function which will be called to receive the session_data
-        :param proxy: (Optional) JSON Object of proxy to be used. See https://github.com/diezo/ensta
+        :param proxy: (Optional) JSON Object of proxy, or a ProxyPool, to be used. See https://github.com/diezo/ensta
         :param totp_token: (Optional) Your TOTP Key generated by Instagram while setting up 2FA (If 2FA is turned on)
+        :param transport: (Optional) Connection pools to use. See ensta.Transport
+        :param identifier_cache: (Optional) Username <-> UserID cache to use. See ensta.IdentifierCache
+        :param raw_payload: (Optional) How much of the response profiles keep in 'raw': "keep", "trim" or "drop"
         """
 
         self.identifier: str = identifier
@@ -47,8 +60,11 @@ class Host(SessionHost):
         self.file: str = file
         self.save: any = save
         self.load: any = load
-        self.proxy: dict[str, str] = proxy
+        self.proxy: dict[str, str] | ProxyPool = proxy
         self.totp_token = totp_token
+        self.transport = transport if transport is not None else Transport()
+        self.identifier_cache = identifier_cache if identifier_cache is not None else IdentifierCache()
+        self.raw_payload = raw_payload
 
         if self.file is None and self.load is None: self.file: str = self.DEFAULT_FILE
         self.load_session()
@@ -58,7 +74,7 @@ class Host(SessionHost):
             raise Exception("Neither Load Function nor File Name was passed to load SessionId.")
 
         if sid:
-            try: super().__init__(sid, self.proxy)
+            try: super().__init__(sid, self.proxy, transport=self.transport, identifier_cache=self.identifier_cache, raw_payload=self.raw_payload)
             except SessionError: return self.new_session()
 
         elif self.load:
@@ -66,7 +82,7 @@ class Host(SessionHost):
 
             if session_data == "": return self.new_session()
             else:
-                try: super().__init__(session_data, self.proxy)
+                try: super().__init__(session_data, self.proxy, transport=self.transport, identifier_cache=self.identifier_cache, raw_payload=self.raw_payload)
                 except SessionError: return self.new_session()
 
         elif self.file:
@@ -79,7 +95,7 @@ class Host(SessionHost):
                     # noinspection PyBroadException
                     try:
                         if json.loads(session_data)["identifier"] != self.identifier: raise Exception()
-                        super().__init__(session_data, self.proxy)
+                        super().__init__(session_data, self.proxy, transport=self.transport, identifier_cache=self.identifier_cache, raw_payload=self.raw_payload)
                     except Exception: return self.new_session()
 
     def new_session(self) -> None:
@@ -87,7 +103,8 @@ class Host(SessionHost):
             user_identifier=self.identifier,
             password=self.password,
             proxy=self.proxy,
-            totp_token=self.totp_token
+            totp_token=self.totp_token,
+            transport=self.transport
         )
         
         if self.save: self.save(session_data)
@@ -0,0 +1,195 @@
+import os
+import json
+import time
+import threading
+from collections import OrderedDict
+
+# Returned by get_uid() for usernames which are known not to exist
+MISSING: str = ""
+
+
+class IdentifierCache:
+    """
+    Remembers which username belongs to which UserID, in both directions.
+
+    - Filled from every profile, follower, following, liker and post that's already been parsed,
+      so most username <-> UserID conversions don't need a request.
+    - Least recently used entries are dropped once there are more than 'max_size' of them.
+    - Entries expire after 'ttl' seconds (usernames can change hands), and usernames which don't
+      exist are remembered for 'missing_ttl' seconds.
+    - With a 'file', entries are loaded from it, and saved to it every 'save_every' new entries and on save().
+    """
+
+    max_size: int
+    ttl: float
+    missing_ttl: float
+    file: str | None
+    save_every: int
+
+    uids: OrderedDict[str, tuple[str, float]]
+    usernames: OrderedDict[str, tuple[str, float]]
+    lock: threading.RLock
+    unsaved: int
+
+    def __init__(
+        self,
+        max_size: int = 100_000,
+        ttl: float = 86400.0,
+        missing_ttl: float = 3600.0,
+        file: str | None = None,
+        save_every: int = 1000
+    ) -> None:
+
+        """
+        :param max_size: (Optional) Max number of usernames remembered. Set to 0 to turn caching off
+        :param ttl: (Optional) Seconds after which a username <-> UserID pair is looked up again
+        :param missing_ttl: (Optional) Seconds after which a username that didn't exist is looked up again
+        :param file: (Optional) JSON file to persist entries in, e.g. - "ensta-identifiers.json"
+        :param save_every: (Optional) Number of new entries after which the file is saved
+        """
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.missing_ttl = missing_ttl
+        self.file = file
+        self.save_every = save_every
+
+        # Username -> (UserID or MISSING, Expiry) and UserID -> (Username, Expiry)
+        self.uids = OrderedDict()
+        self.usernames = OrderedDict()
+        self.lock = threading.RLock()
+        self.unsaved = 0
+
+        if file is not None and os.path.isfile(file): self.load()
+
+    def get_uid(self, username: str) -> str | None:
+        """
+        :param username: Username (lowercase)
+        :return: UserID, MISSING if the username doesn't exist, or None if it isn't cached
+        """
+
+        return self._get(self.uids, username)
+
+    def get_username(self, uid: str | int) -> str | None:
+        """
+        :param uid: UserID
+        :return: Username, or None if it isn't cached
+        """
+
+        return self._get(self.usernames, str(uid))
+
+    def put(self, username: str | None, uid: str | int | None) -> None:
+        """
+        Remembers a username <-> UserID pair. Incomplete pairs are ignored.
+        :param username: Username
+        :param uid: UserID
+        :return: None
+        """
+
+        if not username or not uid or self.max_size <= 0: return None
+
+        username: str = username.lower()
+        uid: str = str(uid)
+        expiry: float = time.time() + self.ttl
+
+        with self.lock:
+            # Username moved to another account, or account changed its username
+            previous_uid: tuple[str, float] | None = self.uids.get(username)
+            previous_username: tuple[str, float] | None = self.usernames.get(uid)
+
+            if previous_uid is not None and previous_uid[0] != uid: self.usernames.pop(previous_uid[0], None)
+            if previous_username is not None and previous_username[0] != username: self.uids.pop(previous_username[0], None)
+
+            self._set(self.uids, username, (uid, expiry))
+            self._set(self.usernames, uid, (username, expiry))
+
+            self._saved_later()
+
+    def put_missing(self, username: str) -> None:
+        """
+        Remembers that a username doesn't exist.
+        :param username: Username
+        :return: None
+        """
+
+        if not username or self.max_size <= 0: return None
+
+        with self.lock:
+            self._set(self.uids, username.lower(), (MISSING, time.time() + self.missing_ttl))
+            self._saved_later()
+
+    def invalidate(self, username: str | None = None, uid: str | int | None = None) -> None:
+        """
+        Forgets a username, a UserID, or both.
+        :param username: (Optional) Username
+        :param uid: (Optional) UserID
+        :return: None
+        """
+
+        with self.lock:
+            if username is not None:
+                entry: tuple[str, float] | None = self.uids.pop(username.lower(), None)
+                if entry is not None: self.usernames.pop(entry[0], None)
+
+            if uid is not None:
+                entry: tuple[str, float] | None = self.usernames.pop(str(uid), None)
+                if entry is not None: self.uids.pop(entry[0], None)
+
+    def _get(self, entries: OrderedDict[str, tuple[str, float]], key: str) -> str | None:
+        with self.lock:
+            entry: tuple[str, float] | None = entries.get(key)
+            if entry is None: return None
+
+            if entry[1] < time.time():
+                del entries[key]
+                return None
+
+            entries.move_to_end(key)
+            return entry[0]
+
+    def _set(self, entries: OrderedDict[str, tuple[str, float]], key: str, entry: tuple[str, float]) -> None:
+        entries[key] = entry
+        entries.move_to_end(key)
+
+        while len(entries) > self.max_size: entries.popitem(last=False)
+
+    def _saved_later(self) -> None:
+        self.unsaved += 1
+        if self.file is not None and self.unsaved >= self.save_every: self.save()
+
+    def load(self) -> None:
+        """
+        Loads entries from the file, skipping the ones that have expired.
+        :return: None
+        """
+
+        try:
+            with open(self.file, "r") as file: stored: dict = json.load(file)
+
+        # File Content Not A Valid JSON
+        except (OSError, ValueError): return None
+
+        now: float = time.time()
+
+        with self.lock:
+            for username, (uid, expiry) in stored.get("uids", {}).items():
+                if expiry < now: continue
+
+                self._set(self.uids, username, (uid, expiry))
+                if uid != MISSING: self._set(self.usernames, uid, (username, expiry))
+
+    def save(self) -> None:
+        """
+        Saves every entry to the file. It's written to a temporary file first, so it's never left half-written.
+        :return: None
+        """
+
+        if self.file is None: return None
+
+        temporary: str = f"{self.file}.tmp"
+
+        with self.lock:
+            with open(temporary, "w") as file: json.dump({"uids": self.uids}, file)
+
+            os.replace(temporary, self.file)
+            self.unsaved = 0
@@ -0,0 +1,83 @@
+import json
+from json import JSONDecodeError
+from collections.abc import Callable
+from requests import Response
+
+try: import orjson
+except ImportError: orjson = None
+
+# Backend Name -> Function decoding str / bytes into Python objects
+BACKENDS: dict[str, Callable[[str | bytes], any]] = {"json": json.loads}
+if orjson is not None: BACKENDS["orjson"] = orjson.loads
+
+_decoder: Callable[[str | bytes], any] = BACKENDS.get("orjson", json.loads)
+
+# Response attribute holding its already decoded body, until decode_response() hands it over
+_DECODED: str = "_ensta_decoded"
+_MISSING: object = object()
+
+
+def use_json_backend(backend: str | Callable[[str | bytes], any]) -> None:
+    """
+    Sets how every response is decoded. By default, orjson is used when it's installed.
+    :param backend: "json", "orjson", or any function which decodes str / bytes. e.g. - ujson.loads
+    :return: None
+    """
+
+    global _decoder
+
+    if callable(backend):
+        _decoder = backend
+        return
+
+    if backend not in BACKENDS: raise ValueError(
+        f"JSON backend \"{backend}\" isn't available. Available backends: {', '.join(BACKENDS)}"
+    )
+
+    _decoder = BACKENDS[backend]
+
+
+def json_backend() -> str:
+    for name, decoder in BACKENDS.items():
+        if decoder is _decoder: return name
+
+    return getattr(_decoder, "__module__", None) or repr(_decoder)
+
+
+def loads(content: str | bytes) -> any:
+    """
+    Decodes JSON using the configured backend.
+    :param content: JSON document
+    :return: Decoded object
+    """
+
+    try: return _decoder(content)
+    except JSONDecodeError: raise
+
+    # Custom backends raise their own errors: Callers only have to catch JSONDecodeError
+    except ValueError as error: raise JSONDecodeError(str(error), "", 0) from error
+
+
+def keep_decoded(response: Response, decoded: any) -> None:
+    """
+    Keeps a body decoded before the caller got the response (e.g. - by the RetryPolicy), so it isn't decoded twice.
+    :param response: Response
+    :param decoded: Its decoded body
+    :return: None
+    """
+
+    response.__dict__[_DECODED] = decoded
+
+
+def decode_response(response: Response) -> any:
+    """
+    Decodes a response's body using the configured backend. Drop-in replacement for response.json()
+    A body kept with keep_decoded() is handed over once instead: Later calls decode it again.
+    :param response: Response
+    :return: Decoded object
+    """
+
+    decoded: any = response.__dict__.pop(_DECODED, _MISSING)
+    if decoded is not _MISSING: return decoded
+
+    return loads(response.content)
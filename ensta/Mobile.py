@@ -9,11 +9,21 @@ import json
 from .parser.ProfileParser import parse_profile
 from .structures import Profile
 from .Direct import Direct
+from .Transport import Transport
+from .ProxyPool import ProxyPool
+from .IdentifierCache import IdentifierCache
+from .Batch import run_batch, DEFAULT_CONCURRENCY
+from .containers.ProfileResult import ProfileResult
+from collections.abc import Generator, Iterable
+from .JsonBackend import loads, decode_response
+from .ResumableUpload import rupload
 from ensta.Utils import time_id, fb_uploader
 
 class Mobile:
 
     session: Session
+    transport: Transport
+    identifier_cache: IdentifierCache
     credentials: Credentials
 
     bearer: str
@@ -34,17 +44,21 @@ class Mobile:
         self,
         identifier: str = None,
         password: str = None,
-        proxy: dict[str, str] = None,
+        proxy: dict[str, str] | ProxyPool = None,
         save_file: str = "ensta-mobile-session.txt",
         skip_authorization: bool = False,
         logging: bool = False,
         totp_token : str = None,
-        session_data: str = None
+        session_data: str = None,
+        transport: Transport = None,
+        identifier_cache: IdentifierCache = None
     ) -> None:
 
-        self.session = Session()
+        self.transport = transport if transport is not None else Transport()
+        self.identifier_cache = identifier_cache if identifier_cache is not None else IdentifierCache()
+        self.session = self.transport.session()
 
-        if proxy: self.session.proxies.update(proxy)
+        self.transport.apply_proxy(self.session, proxy)
 
         self.refresh_credentials(
             cycle=1,
@@ -152,30 +166,24 @@ class Mobile:
             "image_compression": json.dumps({"lib_name": "moz", "lib_version": "3.1.m", "quality": 80})
         }
 
-        with open(media_path, "rb") as file:
-            photo_data = file.read()
-            photo_length = str(len(photo_data))
-
         request_headers = {
             "accept-encoding": "gzip",
             "x-instagram-rupload-params": json.dumps(rupload_params),
             "x_fb_photo_waterfall_id": str(uuid4()),
             "x-entity-type": "image/jpeg",
-            "offset": "0",
             "x-entity-name": upload_name,
-            "x-entity-length": photo_length,
-            "content-type": "application/octet-stream",
-            "content-length": photo_length
+            "content-type": "application/octet-stream"
         }
 
-        http_response = self.session.post(
-            url=f"https://i.instagram.com/rupload_igphoto/{upload_name}",
-            data=photo_data,
-            headers=request_headers
+        http_response = rupload(
+            self.session,
+            f"https://i.instagram.com/rupload_igphoto/{upload_name}",
+            media_path,
+            request_headers
         )
 
         try:
-            response_dict: dict = http_response.json()
+            response_dict: dict = decode_response(http_response)
 
             if response_dict.get("status", "") != "ok": raise NetworkError("Response json key 'status' not ok.")
             if response_dict.get("upload_id") is None:
@@ -222,7 +230,8 @@ class Mobile:
                 headers=headers
             )
 
-            return response.json().get("status", "") == "ok"
+            self._invalidate_cache()
+            return decode_response(response).get("status", "") == "ok"
 
         except JSONDecodeError: return False
 
@@ -255,9 +264,9 @@ class Mobile:
 
         try:
             # Response actually returns two JSON Objects with profile information,
-            # but we'll only use the 1st one for now.
+            # but we'll only use the 1st one for now, so the 2nd one isn't decoded at all.
 
-            information: dict = tuple(json.loads(data) for data in response.text.strip().split("\n"))[0]
+            information: dict = loads(response.content.strip().split(b"\n", 1)[0])
 
             if information.get("status", "") != "ok":
                 raise NetworkError(
@@ -266,7 +275,10 @@ class Mobile:
                     "this one may has been flagged."
                 )
 
-            return parse_profile(information)
+            profile: Profile = parse_profile(information)
+            self.identifier_cache.put(profile.username, profile.user_id)
+
+            return profile
 
         except JSONDecodeError:
             raise NetworkError(
@@ -275,6 +287,41 @@ class Mobile:
                 "been flagged."
             )
 
+    def profiles(
+        self,
+        identifiers: Iterable[str | int],
+        concurrency: int = DEFAULT_CONCURRENCY
+    ) -> Generator[ProfileResult, None, None]:
+
+        """
+        Fetches many profiles at once. Requests still go through the Transport's RateLimiter.
+        :param identifiers: Usernames or UserIDs of the targets. Duplicates are only fetched once
+        :param concurrency: (Optional) Max number of profiles fetched at the same time
+        :return: Generator which yields a ProfileResult per identifier, as soon as each one is done
+        """
+
+        for identifier, profile, error in run_batch(
+            self.profile,
+            identifiers,
+            concurrency,
+            lambda each: str(each).strip().lower()
+        ):
+            yield ProfileResult(identifier=identifier, profile=profile, error=error)
+
+    def _invalidate_cache(self, *uids: str) -> None:
+        """
+        Drops cached responses made stale by a write: Your own profile, and the given users'.
+        :param uids: UserIDs of the users affected by the write
+        :return: None
+        """
+
+        if self.transport.response_cache is None: return None
+
+        subjects: list[str] = [self.user_id, self.username]
+        for uid in uids: subjects += [uid, self.identifier_cache.get_username(uid)]
+
+        self.transport.response_cache.invalidate(*subjects)
+
     @staticmethod
     def is_username(identifier: str) -> bool:
         """
@@ -317,7 +364,9 @@ class Mobile:
             )
         )
 
-        try: return response.json().get("status", "") == "ok"
+        self._invalidate_cache(user_id)
+
+        try: return decode_response(response).get("status", "") == "ok"
 
         except JSONDecodeError:
             raise NetworkError(
@@ -346,7 +395,9 @@ class Mobile:
             )
         )
 
-        try: return response.json().get("status", "") == "ok"
+        self._invalidate_cache(user_id)
+
+        try: return decode_response(response).get("status", "") == "ok"
 
         except JSONDecodeError:
             raise NetworkError(
@@ -376,7 +427,9 @@ class Mobile:
             )
         )
 
-        try: return response.json().get("status", "") == "ok"
+        self._invalidate_cache(user_id)
+
+        try: return decode_response(response).get("status", "") == "ok"
 
         except JSONDecodeError:
             raise NetworkError(
@@ -404,7 +457,9 @@ class Mobile:
             )
         )
 
-        try: return response.json().get("status", "") == "ok"
+        self._invalidate_cache(user_id)
+
+        try: return decode_response(response).get("status", "") == "ok"
 
         except JSONDecodeError:
             raise NetworkError(
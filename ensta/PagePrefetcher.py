@@ -0,0 +1,132 @@
+import queue
+import weakref
+import threading
+from collections.abc import Callable
+
+# Seconds a blocked producer waits before checking whether it was stopped
+_POLL_INTERVAL: float = 0.1
+
+_END = object()
+
+
+class PagePrefetcher:
+    """
+    Fetches the pages of a paginator on a background thread, up to 'depth' pages ahead of the consumer.
+
+    - Each page's cursor comes from the previous page, so pages are fetched one after another,
+      but the consumer's per-item work overlaps with the next pages' requests.
+    - At most 'depth' fetched pages are buffered. Once the buffer is full, the background thread waits.
+    - The thread stops after the last page, after an error (raised again when its page is asked for),
+      once 'needed' items were fetched, and when the prefetcher is closed or garbage collected.
+    """
+
+    array_key: str
+    cursor_key: str
+    depth: int
+
+    def __init__(
+        self,
+        fetch: Callable[[str], dict],
+        max_id: str,
+        depth: int,
+        array_key: str,
+        needed: int = 0,
+        cursor_key: str = "next_max_id"
+    ) -> None:
+
+        """
+        :param fetch: Function which requests & decodes the page at a cursor. e.g. - fetch("") is the first page
+        :param max_id: Cursor of the first page to fetch
+        :param depth: Max number of pages fetched ahead of the consumer
+        :param array_key: Key of the items' array in each page. e.g. - "users"
+        :param needed: (Optional) Number of items after which there's no point fetching more pages. 0 means all
+        :param cursor_key: (Optional) Key of the next page's cursor in each page. e.g. - "next_min_id"
+        """
+
+        if depth < 1: raise ValueError("Prefetch depth must be at least 1.")
+
+        self.array_key = array_key
+        self.cursor_key = cursor_key
+        self.depth = depth
+
+        self._fetch = fetch
+        self._pages = queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+
+        # The thread doesn't reference the prefetcher, so an abandoned paginator still stops it
+        threading.Thread(
+            target=self._produce,
+            args=(fetch, max_id, array_key, cursor_key, needed, self._pages, self._stop),
+            name="ensta-prefetch",
+            daemon=True
+        ).start()
+
+        weakref.finalize(self, self._stop.set)
+
+    @staticmethod
+    def _produce(
+        fetch: Callable[[str], dict],
+        max_id: str,
+        array_key: str,
+        cursor_key: str,
+        needed: int,
+        pages: queue.Queue,
+        stop: threading.Event
+    ) -> None:
+
+        fetched: int = 0
+
+        while not stop.is_set():
+            try: entry = (max_id, fetch(max_id), None)
+            except Exception as error: entry = (max_id, None, error)
+
+            while not stop.is_set():
+                try:
+                    pages.put(entry, timeout=_POLL_INTERVAL)
+                    break
+
+                except queue.Full: continue
+
+            page: dict | None = entry[1]
+
+            if not isinstance(page, dict) or page.get("status") != "ok" or not page.get(cursor_key): break
+
+            fetched += len(page.get(array_key) or [])
+            if 0 < needed <= fetched: break
+
+            max_id = page[cursor_key]
+
+        # Consumer may still ask for a page: It's fetched right away instead
+        while not stop.is_set():
+            try:
+                pages.put((None, _END, None), timeout=_POLL_INTERVAL)
+                return
+
+            except queue.Full: continue
+
+    def page(self, max_id: str) -> dict:
+        """
+        Returns the page at a cursor, waiting for it if it hasn't been fetched yet.
+        :param max_id: Cursor of the page. Pages must be asked for in order
+        :return: Decoded page
+        """
+
+        if self._stop.is_set(): return self._fetch(max_id)
+
+        fetched_max_id, page, error = self._pages.get()
+
+        # Past the prefetched pages, or asked out of order
+        if page is _END or fetched_max_id != max_id:
+            self.close()
+            return self._fetch(max_id)
+
+        if error is not None: raise error
+        return page
+
+    def close(self) -> None:
+        """
+        Stops the background thread. Pages that were fetched but not consumed are dropped.
+        :return: None
+        """
+
+        self._stop.set()
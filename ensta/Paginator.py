@@ -0,0 +1,173 @@
+from json import JSONDecodeError
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections.abc import Callable, Generator, Iterable
+from requests import Response
+from .Checkpoint import Checkpoint
+from .JsonBackend import decode_response
+from .PagePrefetcher import PagePrefetcher
+from .StreamingPage import StreamingPage
+from .lib.Exceptions import NetworkError
+
+
+def paginate(
+    request_page: Callable[[str], Response],
+    array_key: str,
+    build: Callable[[dict], any],
+    checkpoint: Checkpoint,
+    count: int = 0,
+    stream: bool = False,
+    prefetch: int = 0,
+    cursor_key: str = "next_max_id",
+    thread: Callable[[any], Iterable] | None = None,
+    raise_status_error: Callable[[dict], None] | None = None,
+    sink: Callable[[dict], None] | None = None
+) -> Generator[any, None, None]:
+
+    """
+    Generates the items of a cursor paginated endpoint (followers, followings, posts, likers, comments, ...).
+
+    - Carries on from the checkpoint, which the caller has start()ed: Items of its page already generated are skipped.
+    - With 'stream', each page is parsed while it's being downloaded, and the next page is requested as soon
+      as its cursor is parsed, while the rest of the page is still being read.
+    - With 'prefetch', pages are fetched in the background by a PagePrefetcher.
+    - Stops once 'count' items were generated, or at the first page without a cursor.
+    - With 'sink', each element is handed to it as is: Nothing is built nor yielded, but 'count' & the checkpoint still apply.
+    - Like every paginator, None is yielded right before an error is raised.
+
+    :param request_page: Function sending the request of the page at a cursor ("" for the first page),
+                         with stream=True if 'stream' is set
+    :param array_key: Key of the items' array in each page. e.g. - "users"
+    :param build: Function turning an element of that array into the item generated for it
+    :param checkpoint: Checkpoint of the crawl. It's updated in place as items are generated
+    :param count: (Optional) Amount of items to generate. 0 means all
+    :param stream: (Optional) Yield each item as soon as it's downloaded, instead of once the whole page is in
+    :param prefetch: (Optional) Number of pages fetched in the background, ahead of the one being generated
+    :param cursor_key: (Optional) Key of the next page's cursor in each page. e.g. - "next_min_id"
+    :param thread: (Optional) Function returning the items generated for an item, itself first.
+                   e.g. - A comment & its replies. Only the first one counts towards 'count'
+    :param raise_status_error: (Optional) Function raising the error of a page whose status isn't 'ok'
+    :param sink: (Optional) Function taking each element of the items' array instead of 'build'. e.g. - store.append_json
+    :return: Generator which yields each item
+    """
+
+    cursor: str = checkpoint.max_id
+    generated_count: int = checkpoint.generated_count
+    skip: int = checkpoint.offset
+
+    if checkpoint.done or (count != 0 and generated_count >= count): return None
+
+    if stream and prefetch > 0: raise ValueError("Streamed pages can't be prefetched: Use either stream or prefetch.")
+
+    # Only fetches as many pages as the remaining items need
+    pages: PagePrefetcher | None = None if prefetch <= 0 else PagePrefetcher(
+        lambda each_cursor: decode_response(request_page(each_cursor)),
+        cursor,
+        prefetch,
+        array_key,
+        0 if count == 0 else count - generated_count + skip,
+        cursor_key=cursor_key
+    )
+
+    # Streamed pages: Cursor -> Request of that page, sent early. At most one at a time
+    ahead: dict[str, Future] = {}
+    executor: ThreadPoolExecutor | None = None
+
+    def on_field(key: str, value: any) -> None:
+        nonlocal executor
+
+        if key != cursor_key or not value or ahead or (count != 0 and generated_count >= count): return None
+
+        if executor is None: executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ensta-next-page")
+        ahead[value] = executor.submit(request_page, value)
+
+    try:
+        while True:
+            try:
+                if stream:
+                    early: Future | None = ahead.pop(cursor, None)
+
+                    # Status & cursor usually come after the items: They're checked once the page is over
+                    http_response: Response = early.result() if early is not None else request_page(cursor)
+                    page: StreamingPage = StreamingPage(http_response, array_key, on_field)
+                    elements, response_json = page, page.fields
+
+                else:
+                    if pages is not None: response_json = pages.page(cursor)
+                    else: response_json = decode_response(request_page(cursor))
+
+                    if "status" not in response_json or array_key not in response_json:
+                        yield None
+                        raise NetworkError(f"HTTP response doesn't include 'status' or '{array_key}' node.")
+
+                    if response_json["status"] != "ok":
+                        yield None
+                        if raise_status_error is not None: raise_status_error(response_json)
+                        raise NetworkError("HTTP response status not 'ok'.")
+
+                    elements = response_json[array_key]
+
+                for each_item in elements:
+                    # Generated before the crawl was interrupted
+                    if skip > 0:
+                        skip -= 1
+                        continue
+
+                    # Don't download the rest of the page
+                    if count != 0 and generated_count >= count: break
+
+                    if sink is not None: sink(each_item)
+
+                    elif thread is None: yield build(each_item)
+
+                    else:
+                        # Items of this thread generated before the crawl was interrupted (0 for every other thread)
+                        generated_in_thread: int = checkpoint.nested
+
+                        try:
+                            for position, each in enumerate(thread(build(each_item))):
+                                if position < generated_in_thread: continue
+
+                                yield each
+                                checkpoint.nested = position + 1
+
+                        except NetworkError:
+                            yield None
+                            raise
+
+                    generated_count += 1
+                    checkpoint.generated_count = generated_count
+                    checkpoint.offset += 1
+                    checkpoint.nested = 0
+
+                if stream:
+                    http_response.close()
+
+                    if (generated_count < count or count == 0) and (not page.found or response_json.get("status") != "ok"):
+                        yield None
+                        if raise_status_error is not None: raise_status_error(response_json)
+                        raise NetworkError(f"HTTP response doesn't include '{array_key}' node, or its status isn't 'ok'.")
+
+                # Single pages come without a cursor (or a null / empty one)
+                if (generated_count < count or count == 0) and response_json.get(cursor_key):
+                    cursor = response_json[cursor_key]
+                    checkpoint.advance(cursor)
+
+                else:
+                    checkpoint.stop(complete=generated_count < count or count == 0)
+                    return None
+
+            except JSONDecodeError:
+                yield None
+                raise NetworkError("HTTP Response is not a valid JSON.")
+
+    # Also when the consumer stops early, or on errors
+    finally:
+        if pages is not None: pages.close()
+
+        # e.g. - 'count' was reached on the page after the cursor
+        for each in ahead.values(): each.add_done_callback(_close_response)
+        if executor is not None: executor.shutdown(wait=False)
+
+
+def _close_response(future: Future) -> None:
+    if future.exception() is None: future.result().close()
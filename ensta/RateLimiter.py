@@ -0,0 +1,126 @@
+import time
+import threading
+from .Utils import endpoint_family
+from .lib.Exceptions import RateLimitedError
+
+
+class TokenBucket:
+    """
+    Lets through at most 'requests' requests per 'period' seconds, with bursts of at most 'burst' requests.
+    Requests over the limit are queued: each one waits for its turn, in the order they arrived.
+    """
+
+    rate: float
+    capacity: float
+    tokens: float
+    updated: float
+    lock: threading.Lock
+
+    def __init__(self, requests: int, period: float, burst: int = 1) -> None:
+        """
+        :param requests: Max number of requests per period
+        :param period: Length of the period in seconds
+        :param burst: Max number of requests that can be sent back to back
+        """
+
+        self.rate = requests / period
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self) -> float:
+        """
+        Takes a token, possibly one that will only be available in the future.
+        :return: Seconds to wait before the request can be sent
+        """
+
+        with self.lock:
+            self._refill(time.monotonic())
+            self.tokens -= 1
+
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def try_acquire(self) -> bool:
+        """
+        Takes a token only if one is available right now.
+        :return: Boolean (Whether a token was taken)
+        """
+
+        with self.lock:
+            self._refill(time.monotonic())
+            if self.tokens < 1: return False
+
+            self.tokens -= 1
+            return True
+
+
+class RateLimiter:
+    """
+    Throttles requests per endpoint family (see ensta.Utils.ENDPOINT_FAMILIES) before they're sent.
+
+    - One RateLimiter belongs to one Transport, i.e. to one account.
+    - Families without a bucket aren't limited. Set a 'default' bucket to limit every other request.
+    - block=True queues requests until they can be sent, block=False raises RateLimitedError instead.
+    """
+
+    DEFAULT_BUCKETS: dict[str, tuple[int, float, int]] = {
+        # Family: (requests, period, burst)
+        "friendships": (20, 60.0, 3),
+        "web_profile_info": (30, 60.0, 5),
+        "feed": (30, 60.0, 5),
+        "rupload": (10, 60.0, 2),
+        "direct_v2": (15, 60.0, 3)
+    }
+
+    buckets: dict[str, TokenBucket]
+    block: bool
+
+    def __init__(self, buckets: dict[str, TokenBucket | tuple[int, float, int]] | None = None, block: bool = True) -> None:
+        """
+        :param buckets: (Optional) Bucket per family, overriding the defaults. e.g. - {"feed": TokenBucket(60, 60.0, 10)}
+        :param block: (Optional) Wait until a request can be sent (True), or raise RateLimitedError (False)
+        """
+
+        self.block = block
+        self.buckets = {}
+
+        for family, bucket in {**self.DEFAULT_BUCKETS, **(buckets or {})}.items():
+            if bucket is None: continue
+            self.buckets[family] = bucket if isinstance(bucket, TokenBucket) else TokenBucket(*bucket)
+
+    @classmethod
+    def unlimited(cls) -> "RateLimiter":
+        """
+        Creates a RateLimiter which lets every request through.
+        :return: RateLimiter
+        """
+
+        return cls({family: None for family in cls.DEFAULT_BUCKETS})
+
+    def acquire(self, url: str) -> None:
+        """
+        Waits until a request to the given url is allowed to be sent.
+        :param url: Request URL
+        :return: None
+        """
+
+        family: str = endpoint_family(url)
+        bucket: TokenBucket | None = self.buckets.get(family)
+
+        if bucket is None: return
+
+        if not self.block:
+            if bucket.try_acquire(): return
+
+            raise RateLimitedError(
+                f"Request to '{family}' endpoints would exceed the configured rate limit. "
+                "Wait for some time or raise the limit."
+            )
+
+        wait: float = bucket.reserve()
+        if wait > 0: time.sleep(wait)
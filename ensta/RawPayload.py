@@ -0,0 +1,30 @@
+# How much of a response's JSON Object containers keep in their 'raw' field
+KEEP: str = "keep"  # All of it
+TRIM: str = "trim"  # Top-level values only, without nested objects & arrays (posts, edges, ...)
+DROP: str = "drop"  # None of it: 'raw' is None
+
+MODES: tuple[str, ...] = (KEEP, TRIM, DROP)
+
+
+def check_raw_payload(mode: str) -> str:
+    """
+    :param mode: KEEP, TRIM or DROP
+    :return: Same mode
+    """
+
+    if mode not in MODES: raise ValueError(f"Unknown raw_payload \"{mode}\". Available: {', '.join(MODES)}")
+    return mode
+
+
+def retain_raw(data: dict | None, mode: str) -> dict | None:
+    """
+    Returns what a container should keep of a response's JSON Object.
+    :param data: JSON Object
+    :param mode: KEEP, TRIM or DROP
+    :return: JSON Object, trimmed copy of it, or None
+    """
+
+    if data is None or mode == DROP: return None
+    if mode == KEEP: return data
+
+    return {key: value for key, value in data.items() if not isinstance(value, (dict, list))}
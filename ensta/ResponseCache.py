@@ -0,0 +1,320 @@
+import re
+import json
+import time
+import sqlite3
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from collections.abc import Generator
+from datetime import timedelta
+from dataclasses import dataclass
+from collections import OrderedDict
+from requests import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+
+# True while the current thread / task's requests must go to the network. See ResponseCache.bypass()
+_bypassed: ContextVar[bool] = ContextVar("ensta_response_cache_bypassed", default=False)
+
+
+@dataclass
+class CacheEntry:
+
+    subject: str
+    family: str
+    expires: float
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+
+class MemoryCacheBackend:
+    """
+    Keeps entries in memory. The least recently used ones are dropped once there are more than 'max_entries'.
+    """
+
+    max_entries: int
+    entries: OrderedDict[str, CacheEntry]
+    lock: threading.Lock
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self.lock:
+            entry: CacheEntry | None = self.entries.get(key)
+            if entry is None: return None
+
+            if entry.expires < time.time():
+                del self.entries[key]
+                return None
+
+            self.entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.max_entries: self.entries.popitem(last=False)
+
+    def delete(self, subjects: frozenset[str] | None = None, family: str | None = None) -> None:
+        with self.lock:
+            for key in [
+                key for key, entry in self.entries.items()
+                if (subjects is None or entry.subject in subjects) and (family is None or entry.family == family)
+            ]:
+                del self.entries[key]
+
+
+class SQLiteCacheBackend:
+    """
+    Keeps entries in an SQLite database, so they survive restarts and can be shared by many processes.
+    """
+
+    path: str
+    connection: sqlite3.Connection
+    lock: threading.Lock
+    writes: int
+
+    # Expired entries are purged every this many writes
+    PURGE_EVERY: int = 1000
+
+    def __init__(self, path: str = "ensta-cache.sqlite3") -> None:
+        """
+        :param path: (Optional) Database file
+        """
+
+        self.path = path
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.lock = threading.Lock()
+        self.writes = 0
+
+        with self.lock:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, subject TEXT, family TEXT, expires REAL, status INTEGER, headers TEXT, body BLOB)"
+            )
+            self.connection.execute("CREATE INDEX IF NOT EXISTS responses_subject ON responses (subject)")
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self.lock:
+            row: tuple | None = self.connection.execute(
+                "SELECT subject, family, expires, status, headers, body FROM responses WHERE key = ? AND expires >= ?",
+                (key, time.time())
+            ).fetchone()
+
+        if row is None: return None
+
+        subject, family, expires, status, headers, body = row
+        return CacheEntry(subject, family, expires, status, json.loads(headers), body)
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, entry.subject, entry.family, entry.expires, entry.status, json.dumps(entry.headers), entry.body)
+            )
+
+            self.writes += 1
+            if self.writes % self.PURGE_EVERY == 0: self.connection.execute(
+                "DELETE FROM responses WHERE expires < ?", (time.time(),)
+            )
+
+    def delete(self, subjects: frozenset[str] | None = None, family: str | None = None) -> None:
+        conditions: list[str] = []
+        parameters: list[str] = []
+
+        if subjects is not None:
+            conditions.append(f"subject IN ({', '.join('?' * len(subjects))})")
+            parameters.extend(subjects)
+
+        if family is not None:
+            conditions.append("family = ?")
+            parameters.append(family)
+
+        with self.lock:
+            self.connection.execute(
+                f"DELETE FROM responses{' WHERE ' + ' AND '.join(conditions) if conditions else ''}", parameters
+            )
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+class ResponseCache:
+    """
+    Read-through cache for profile, feed and private info responses. Opt-in: pass it to a Transport.
+
+    - Entries are keyed by account, method & url, so one account never sees another's viewer-specific fields.
+    - Each family has its own TTL. A family without a TTL (or a TTL of 0) isn't cached.
+    - SessionHost & Mobile invalidate the affected users' entries after writes (follow, unfollow, edits, uploads).
+    - Requests sent with a 'cache-control: no-cache' header, or inside 'with ResponseCache.bypass()', always go
+      to the network. Their fresh responses are still cached.
+    """
+
+    # Family -> URL fragments of the endpoints cached under it
+    CACHEABLE_ENDPOINTS: dict[str, tuple[str, ...]] = {
+        "web_profile_info": ("/users/web_profile_info/", "info_stream/", "/info/"),
+        "feed": ("/feed/user/",),
+        "private_info": ("/accounts/edit/web_form_data/",)
+    }
+
+    DEFAULT_TTLS: dict[str, float] = {
+        "web_profile_info": 300.0,
+        "feed": 120.0,
+        "private_info": 600.0
+    }
+
+    # Endpoints which read data, although they're requested with POST
+    READ_ONLY_POSTS: tuple[str, ...] = ("info_stream/",)
+
+    # Username or UserID a url is about, e.g. - ?username=leomessi, /feed/user/leomessi/, /users/427553890/info/
+    SUBJECT_PATTERNS: tuple[re.Pattern, ...] = (
+        re.compile(r"[?&]username=([^&]+)"),
+        re.compile(r"/feed/user/([^/]+)/"),
+        re.compile(r"/users/([^/]+?)/(?:username)?info")
+    )
+
+    ACCOUNT_PATTERN: re.Pattern = re.compile(r"ds_user_id=(\d+)")
+
+    backend: MemoryCacheBackend | SQLiteCacheBackend
+    ttls: dict[str, float]
+
+    def __init__(
+        self,
+        backend: MemoryCacheBackend | SQLiteCacheBackend | None = None,
+        ttls: dict[str, float] | None = None
+    ) -> None:
+
+        """
+        :param backend: (Optional) Where entries are kept. Default: MemoryCacheBackend()
+        :param ttls: (Optional) Seconds each family is cached for, overriding the defaults. e.g. - {"feed": 600}
+        """
+
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.ttls = {**self.DEFAULT_TTLS, **(ttls or {})}
+
+    @classmethod
+    def sqlite(cls, path: str = "ensta-cache.sqlite3", ttls: dict[str, float] | None = None) -> "ResponseCache":
+        """
+        Creates a ResponseCache which keeps its entries in an SQLite database.
+        :param path: (Optional) Database file
+        :param ttls: (Optional) Seconds each family is cached for
+        :return: ResponseCache
+        """
+
+        return cls(SQLiteCacheBackend(path), ttls)
+
+    @staticmethod
+    @contextmanager
+    def bypass() -> Generator[None, None, None]:
+        """
+        Sends the requests made inside the block (in this thread / task) to the network, without changing them.
+        e.g. - with ResponseCache.bypass(): session.get(url)
+        """
+
+        token = _bypassed.set(True)
+
+        try: yield
+        finally: _bypassed.reset(token)
+
+    def _family(self, request: PreparedRequest) -> str | None:
+        if request.method == "POST":
+            if not any(fragment in request.url for fragment in self.READ_ONLY_POSTS): return None
+
+        elif request.method != "GET": return None
+
+        for family, fragments in self.CACHEABLE_ENDPOINTS.items():
+            for fragment in fragments:
+                if fragment in request.url: return family if self.ttls.get(family) else None
+
+        return None
+
+    def _account(self, request: PreparedRequest) -> str:
+        match = self.ACCOUNT_PATTERN.search(request.headers.get("cookie", ""))
+        if match is not None: return match.group(1)
+
+        return request.headers.get("ig-u-ds-user-id", "")
+
+    def _subject(self, request: PreparedRequest, family: str) -> str:
+        if family == "private_info": return self._account(request)
+
+        for pattern in self.SUBJECT_PATTERNS:
+            match = pattern.search(request.url)
+            if match is not None: return match.group(1).lower()
+
+        return ""
+
+    def _key(self, request: PreparedRequest) -> str:
+        return f"{self._account(request)}:{request.method}:{request.url}"
+
+    def lookup(self, request: PreparedRequest) -> Response | None:
+        """
+        Returns the cached response of a request, if there's a fresh one.
+        :param request: Request about to be sent
+        :return: Response, or None
+        """
+
+        if self._family(request) is None: return None
+        if _bypassed.get() or "no-cache" in request.headers.get("cache-control", ""): return None
+
+        entry: CacheEntry | None = self.backend.get(self._key(request))
+        if entry is None: return None
+
+        response = Response()
+        response.status_code = entry.status
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response.url = request.url
+        response.request = request
+        response.elapsed = timedelta(0)
+        response._content = entry.body
+        response._content_consumed = True
+
+        return response
+
+    def store(self, request: PreparedRequest, response: Response) -> None:
+        """
+        Caches a successful response. Its body is read, so it mustn't be a streamed one.
+        :param request: Request that was sent
+        :param response: Response received
+        :return: None
+        """
+
+        family: str | None = self._family(request)
+
+        if family is None or response.status_code != 200: return None
+
+        self.backend.set(self._key(request), CacheEntry(
+            subject=self._subject(request, family),
+            family=family,
+            expires=time.time() + self.ttls[family],
+            status=response.status_code,
+            headers={key: value for key, value in response.headers.items() if key.lower() != "set-cookie"},
+            body=response.content
+        ))
+
+    def invalidate(self, *subjects: str | int | None, family: str | None = None) -> None:
+        """
+        Drops the entries about the given users (of every account), and / or of a whole family.
+        :param subjects: Usernames and UserIDs. e.g. - host.invalidate("leomessi", 427553890)
+        :param family: (Optional) Family to drop. e.g. - "feed"
+        :return: None
+        """
+
+        subjects: frozenset[str] = frozenset(str(subject).lower() for subject in subjects if subject)
+        if len(subjects) == 0 and family is None: return None
+
+        self.backend.delete(subjects if len(subjects) > 0 else None, family)
+
+    def clear(self) -> None:
+        """
+        Drops every entry.
+        :return: None
+        """
+
+        self.backend.delete()
@@ -0,0 +1,103 @@
+import os
+import time
+from json import JSONDecodeError
+from requests import Session, Response
+from requests.exceptions import ConnectionError, Timeout, ChunkedEncodingError
+from .JsonBackend import decode_response
+from .RetryPolicy import RetryPolicy, RETRYABLE
+from .Transport import TransportAdapter
+
+
+def committed_offset(response: Response) -> int:
+    """
+    Reads how many bytes of an upload a rupload endpoint already has, from its answer to a GET.
+    :param response: Response of the GET request
+    :return: Offset to carry on from. 0 if it's unknown
+    """
+
+    try:
+        offset = decode_response(response).get("offset", 0)
+        return int(offset) if offset else 0
+
+    except (JSONDecodeError, AttributeError, TypeError, ValueError):
+        return 0
+
+
+def session_retry_policy(session: Session, url: str) -> RetryPolicy | None:
+    """
+    Returns the RetryPolicy of the Transport the session sends 'url' through, if any.
+    """
+
+    adapter = session.get_adapter(url)
+    return adapter.transport.retry_policy if isinstance(adapter, TransportAdapter) else None
+
+
+def rupload(
+    session: Session,
+    url: str,
+    path: str | os.PathLike,
+    headers: dict[str, str],
+    offset: int = 0,
+    retry_policy: RetryPolicy | None = None
+) -> Response:
+
+    """
+    Uploads a file to a rupload endpoint (rupload_igphoto, rupload_igvideo, rupload.facebook.com).
+
+    - The file is streamed from disk: It's never read into memory as a whole.
+    - If the connection drops (or the server answers 5xx), the endpoint is asked with a GET how many bytes
+      it committed, and the upload carries on from there instead of from byte zero.
+    - Resumptions follow the session's RetryPolicy (max_retries, backoff, Retry-After). The Transport doesn't
+      retry these requests on its own meanwhile, so retries never stack.
+
+    :param session: Session to send the requests with
+    :param url: Upload URL. e.g. - https://i.instagram.com/rupload_igvideo/fb_uploader_...
+    :param path: File to upload
+    :param headers: Upload headers. 'offset', 'x-entity-length' & 'content-length' are filled in
+    :param offset: (Optional) Byte to start from. e.g. - committed_offset() of a GET sent beforehand
+    :param retry_policy: (Optional) Policy to resume by. Default: The session's Transport's. Without one, it's sent once
+    :return: Response of the last POST request
+    """
+
+    if retry_policy is None: retry_policy = session_retry_policy(session, url)
+
+    length: int = os.path.getsize(path)
+    attempt: int = 0
+
+    with RetryPolicy.suspended():
+        while True:
+            # e.g. - A previous process' offset, for a file that changed since
+            if not 0 <= offset <= length: offset = 0
+
+            error: Exception | None = None
+            response: Response | None = None
+
+            with open(path, "rb") as file:
+                file.seek(offset)
+
+                try: response = session.post(url, data=file, headers={
+                    **headers,
+                    "offset": str(offset),
+                    "x-entity-length": str(length),
+                    "content-length": str(length - offset)
+                })
+
+                except (ConnectionError, Timeout, ChunkedEncodingError) as exception: error = exception
+
+            if response is not None and response.status_code < 500: return response
+
+            if retry_policy is None or attempt >= retry_policy.max_retries:
+                if retry_policy is not None: retry_policy.record(url, retried=False)
+                if error is not None: raise error
+
+                return response
+
+            retry_policy.record(url, retried=True)
+            delay: float = retry_policy.delay(RETRYABLE, attempt, response)
+
+            if response is not None: response.close()
+            time.sleep(delay)
+            attempt += 1
+
+            try: offset = committed_offset(session.get(url, headers=headers))
+            except (ConnectionError, Timeout): offset = 0
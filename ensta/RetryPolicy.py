@@ -0,0 +1,192 @@
+import time
+import random
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from collections import Counter
+from collections.abc import Generator
+from email.utils import parsedate_to_datetime
+from requests import PreparedRequest, Response
+from .Utils import endpoint_family
+from .JsonBackend import loads, keep_decoded
+
+OK, RETRYABLE, RATE_LIMITED, FATAL = "ok", "retryable", "rate_limited", "fatal"
+
+# True while the current thread / task's requests must not be retried. See RetryPolicy.suspended()
+_suspended: ContextVar[bool] = ContextVar("ensta_retry_policy_suspended", default=False)
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed request should be sent again, and when.
+
+    - Responses are classified as OK, RETRYABLE (5xx, connection errors, truncated JSON),
+      RATE_LIMITED (429, checkpoint_required, spam, 302 away from web_profile_info / feed) or FATAL.
+    - Bodies are judged by their top-level 'message' & 'spam' keys only: A caption or biography quoting
+      "checkpoint_required" doesn't make a page rate limited. The decoded body is handed to decode_response().
+    - Retries use exponential backoff with jitter, and respect the Retry-After header.
+    - Only idempotent requests are retried, and they're sent again as they are. So a paginated GET
+      continues from the same max_id instead of restarting the crawl.
+    - Retries are counted per endpoint family in 'retries', and requests that ran out of retries in 'failures'.
+    """
+
+    IDEMPOTENT_METHODS: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+
+    # Families where a redirect means "temporarily flagged", instead of "logged out"
+    REDIRECT_RATE_LIMITED_FAMILIES: frozenset[str] = frozenset({"web_profile_info", "feed"})
+
+    # Starts of the top-level 'message' of rate limited responses
+    RATE_LIMITED_MESSAGES: tuple[str, ...] = (
+        "checkpoint_required",
+        "Please wait a few minutes"
+    )
+
+    max_retries: int
+    max_rate_limited_retries: int
+    backoff: float
+    rate_limited_backoff: float
+    max_backoff: float
+
+    retries: Counter
+    failures: Counter
+    lock: threading.Lock
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        max_rate_limited_retries: int = 0,
+        backoff: float = 1.0,
+        rate_limited_backoff: float = 30.0,
+        max_backoff: float = 300.0
+    ) -> None:
+
+        """
+        :param max_retries: (Optional) Max number of retries after a RETRYABLE failure
+        :param max_rate_limited_retries: (Optional) Max number of retries after being RATE_LIMITED.
+            By default, the response is returned at once (and RateLimitedError raised), without waiting
+        :param backoff: (Optional) First delay in seconds after a RETRYABLE failure, doubled on each retry
+        :param rate_limited_backoff: (Optional) First delay in seconds after being RATE_LIMITED, doubled on each retry
+        :param max_backoff: (Optional) Upper bound of any delay, Retry-After included
+        """
+
+        self.max_retries = max_retries
+        self.max_rate_limited_retries = max_rate_limited_retries
+        self.backoff = backoff
+        self.rate_limited_backoff = rate_limited_backoff
+        self.max_backoff = max_backoff
+
+        self.retries = Counter()
+        self.failures = Counter()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    @contextmanager
+    def suspended() -> Generator[None, None, None]:
+        """
+        Sends the requests made inside the block (in this thread / task) once, for callers retrying on their own.
+        e.g. - rupload(), which resumes uploads from the committed offset
+        """
+
+        token = _suspended.set(True)
+
+        try: yield
+        finally: _suspended.reset(token)
+
+    @classmethod
+    def disabled(cls) -> "RetryPolicy":
+        """
+        Creates a RetryPolicy which never retries.
+        :return: RetryPolicy
+        """
+
+        return cls(max_retries=0, max_rate_limited_retries=0)
+
+    def classify(self, request: PreparedRequest, response: Response, stream: bool = False) -> str:
+        """
+        Classifies the response of a request.
+        :param request: Request that was sent
+        :param response: Response received
+        :param stream: Whether the response body is streamed (it won't be read then)
+        :return: OK, RETRYABLE, RATE_LIMITED or FATAL
+        """
+
+        status: int = response.status_code
+
+        if status == 429: return RATE_LIMITED
+        if status >= 500: return RETRYABLE
+
+        if status in (301, 302, 303, 307, 308):
+            return RATE_LIMITED if endpoint_family(request.url) in self.REDIRECT_RATE_LIMITED_FAMILIES else OK
+
+        if status >= 400: return FATAL
+        if stream or "/api/v1/" not in request.url: return OK
+
+        # Some endpoints stream one JSON object per line: The first one must be complete
+        first, separator, rest = response.content.partition(b"\n")
+
+        try: decoded: any = loads(first)
+        except ValueError: return RETRYABLE
+
+        if not (separator and rest.strip()): keep_decoded(response, decoded)
+        if not isinstance(decoded, dict): return OK
+
+        message: any = decoded.get("message")
+
+        if decoded.get("spam") is True: return RATE_LIMITED
+        if isinstance(message, str) and message.startswith(self.RATE_LIMITED_MESSAGES): return RATE_LIMITED
+
+        return OK
+
+    def should_retry(self, method: str, verdict: str, attempt: int) -> bool:
+        """
+        :param method: HTTP method of the request
+        :param verdict: Classification of the last attempt
+        :param attempt: Number of retries done so far
+        :return: Boolean (Whether the request should be sent again)
+        """
+
+        if method not in self.IDEMPOTENT_METHODS or _suspended.get(): return False
+        if verdict == RETRYABLE: return attempt < self.max_retries
+        if verdict == RATE_LIMITED: return attempt < self.max_rate_limited_retries
+
+        return False
+
+    def delay(self, verdict: str, attempt: int, response: Response | None = None) -> float:
+        """
+        Returns how long to wait before the next attempt.
+        :param verdict: Classification of the last attempt
+        :param attempt: Number of retries done so far
+        :param response: (Optional) Last response, to read its Retry-After header
+        :return: Seconds
+        """
+
+        retry_after: float | None = self.retry_after(response) if response is not None else None
+        if retry_after is not None: return min(retry_after, self.max_backoff)
+
+        base: float = self.rate_limited_backoff if verdict == RATE_LIMITED else self.backoff
+        delay: float = min(base * (2 ** attempt), self.max_backoff)
+
+        # Equal jitter: Keeps at least half the delay, spreads out retries of parallel workers
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    @staticmethod
+    def retry_after(response: Response) -> float | None:
+        value: str | None = response.headers.get("retry-after")
+        if value is None: return None
+
+        try: return max(float(value), 0.0)
+        except ValueError: pass
+
+        try: return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError): return None
+
+    def record(self, url: str, retried: bool) -> None:
+        """
+        Counts a retry (or a request that ran out of retries) for the url's endpoint family.
+        :param url: Request URL
+        :param retried: True for a retry, False for a failure
+        :return: None
+        """
+
+        with self.lock:
+            (self.retries if retried else self.failures)[endpoint_family(url)] += 1
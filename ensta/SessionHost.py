@@ -1,21 +1,38 @@
 import time
+import itertools
 import mimetypes
 import json
 import random
 import string
 import requests
-import moviepy.editor
 from uuid import uuid4
 from .Guest import Guest
+from .Transport import Transport
+from .ProxyPool import ProxyPool
+from .HeaderTemplate import HeaderTemplate, CSRF_TOKEN, WWW_CLAIM, REFERER
+from .JsonBackend import decode_response
+from .ResumableUpload import rupload, committed_offset
+from .ResponseCache import ResponseCache
+from .VideoProbe import probe_video
+from .IdentifierCache import IdentifierCache
+from .Checkpoint import Checkpoint
+from .Paginator import paginate
+from .UserStore import FollowPersonStore, LikerStore
+from .FollowersDiffer import diff_followers, DEFAULT_KNOWN_RUN
+from .RawPayload import KEEP
+from .Batch import DEFAULT_CONCURRENCY
 from pathlib import Path
 from json import JSONDecodeError
+from .containers.Comment import Comment
 from .containers.Liker import Liker
 from .containers.Likers import Likers
 from .containers.Post import Post
-from collections.abc import Generator
+from .containers.PostView import PostView
+from collections.abc import Callable, Generator, Iterable, Sequence
 from .containers.ProfileHost import ProfileHost
+from .containers.ProfileResult import ProfileResult
 from .containers.PrivateInfo import PrivateInfo
-from .containers import (FollowedStatus, UnfollowedStatus, FollowPerson, PhotoUpload, ReelUpload)
+from .containers import (FollowedStatus, UnfollowedStatus, FollowPerson, FollowersDiff, PhotoUpload, ReelUpload)
 from .lib import (
     SessionError,
     NetworkError,
@@ -23,9 +40,10 @@ from .lib import (
     DevelopmentError,
     APIError,
     ConversionError,
-    FileTypeError
+    FileTypeError,
+    RateLimitedError
 )
-from ensta.Utils import time_id, fb_uploader
+from ensta.Utils import time_id, fb_uploader, shortcode_from_url, shortcode_to_media_id
 
 USERNAME, UID = 0, 1
 
@@ -34,11 +52,14 @@ class SessionHost:
 
     session_data: str
     request_session: requests.Session
+    transport: Transport
+    identifier_cache: IdentifierCache
     insta_app_id: str = "936619743392459"
     preferred_color_scheme: str = "dark"
     x_ig_www_claim: str
     csrf_token: str
     guest: Guest
+    header_templates: dict[str, HeaderTemplate] | None = None
     user_id: str
     username: str
     identifier: str
@@ -47,25 +68,31 @@ class SessionHost:
     private_user_agent: str = "Instagram 269.0.0.18.75 Android (26/8.0.0; 480dpi; 1080x1920; " \
                               "OnePlus; 6T Dev; devitron; qcom; en_US; 314665256)"
 
+    # Random usernames for fake Referer headers, generated once instead of on every request
+    fake_usernames: tuple[str, ...] = tuple("".join(random.choices(string.ascii_lowercase, k=6)) for _ in range(256))
+
     def __init__(
         self,
         session_data: str,
-        proxy: dict[str, str] = None,
-        skip_auth_verification: bool = False
+        proxy: dict[str, str] | ProxyPool = None,
+        skip_auth_verification: bool = False,
+        transport: Transport = None,
+        identifier_cache: IdentifierCache = None,
+        raw_payload: str = KEEP
     ) -> None:
 
         self.session_data = session_data
+        self.identifier_cache = identifier_cache if identifier_cache is not None else IdentifierCache()
         self.x_ig_www_claim = "hmac." + "".join(random.choices(string.ascii_letters + string.digits + "_-", k=48))
         self.csrf_token = "".join(random.choices(string.ascii_letters + string.digits, k=32))
-        self.request_session = requests.Session()
+        self.transport = transport if transport is not None else Transport()
+        self.request_session = self.transport.session()
         self.request_session.headers["user-agent"] = self.user_agent
 
-        if proxy is not None: self.request_session.proxies.update(proxy)
+        self.transport.apply_proxy(self.request_session, proxy)
 
         session_data_json: dict = json.loads(session_data)
 
-        self.guest = Guest(proxy=proxy)
-
         self.user_id = session_data_json.get("user_id")
         self.username = session_data_json.get("username")
         self.identifier = session_data_json.get("identifier")
@@ -77,6 +104,15 @@ class SessionHost:
         self.request_session.cookies.set("ig_did", session_data_json.get("ig_did"))
         self.request_session.cookies.set("csrftoken", self.csrf_token)
 
+        # Guest shares this session: One cookie jar & one set of connections per account
+        self.guest = Guest(
+            proxy=proxy,
+            transport=self.transport,
+            session=self.request_session,
+            identifier_cache=self.identifier_cache,
+            raw_payload=raw_payload
+        )
+
         if not skip_auth_verification and not self.authenticated():
             raise SessionError(
                 "SessionID expired. If you used a saved session, delete ensta-session.txt file and try again"
@@ -89,34 +125,17 @@ class SessionHost:
         :return: Boolean (True / False)
         """
 
-        request_headers = {
-            "accept": "*/*",
-            "accept-language": "en-US,en;q=0.9",
-            "sec-ch-prefers-color-scheme": self.preferred_color_scheme,
-            "sec-ch-ua": self.user_agent,
-            "sec-ch-ua-full-version-list": self.user_agent,
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": "\"Windows\"",
-            "sec-ch-ua-platform-version": "\"15.0.0\"",
-            "sec-fetch-dest": "empty",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-site": "same-origin",
-            "viewport-width": "1475",
-            "x-asbd-id": "198387",
-            "x-csrftoken": self.csrf_token,
-            "x-ig-app-id": self.insta_app_id,
-            "x-ig-www-claim": self.x_ig_www_claim,
-            "x-requested-with": "XMLHttpRequest",
-            "Referer": "https://www.instagram.com/accounts/edit/",
-            "Referrer-Policy": "strict-origin-when-cross-origin"
-        }
-        http_response = self.request_session.get(
-            "https://www.instagram.com/api/v1/accounts/edit/web_form_data/",
-            headers=request_headers
-        )
+        request_headers = self._headers("web", referer="https://www.instagram.com/accounts/edit/")
+
+        # Never answered from a ResponseCache: The session may have expired since
+        with ResponseCache.bypass():
+            http_response = self.request_session.get(
+                "https://www.instagram.com/api/v1/accounts/edit/web_form_data/",
+                headers=request_headers
+            )
 
         try:
-            http_response.json()
+            decode_response(http_response)
             return True
         except JSONDecodeError:
             return False
@@ -137,29 +156,7 @@ class SessionHost:
             "nav_chain": f"PolarisProfileNestedContentRoot:profilePage:1:via_cold_start",
             "user_id": identifier
         }
-        request_headers = {
-            "accept": "*/*",
-            "accept-language": "en-US,en;q=0.9",
-            "content-type": "application/x-www-form-urlencoded",
-            "sec-ch-prefers-color-scheme": self.preferred_color_scheme,
-            "sec-ch-ua": self.user_agent,
-            "sec-ch-ua-full-version-list": self.user_agent,
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": "\"Windows\"",
-            "sec-ch-ua-platform-version": "\"15.0.0\"",
-            "sec-fetch-dest": "empty",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-site": "same-origin",
-            "viewport-width": "1475",
-            "x-asbd-id": "198387",
-            "x-csrftoken": self.csrf_token,
-            "x-ig-app-id": self.insta_app_id,
-            "x-ig-www-claim": self.x_ig_www_claim,
-            "x-instagram-ajax": "1007616494",
-            "x-requested-with": "XMLHttpRequest",
-            "Referer": f"https://www.instagram.com/{''.join(random.choices(string.ascii_lowercase, k=5))}/",
-            "Referrer-Policy": "strict-origin-when-cross-origin"
-        }
+        request_headers = self._headers("web_form", referer=self._fake_referer())
 
         try:
             http_response = self.request_session.post(
@@ -167,7 +164,8 @@ class SessionHost:
                 headers=request_headers,
                 data=body_json
             )
-            response_json = http_response.json()
+            self._invalidate_cache(identifier)
+            response_json = decode_response(http_response)
 
             if "status" in response_json:
                 if response_json["status"] == "ok" and "friendship_status" in response_json:
@@ -210,29 +208,7 @@ class SessionHost:
             "nav_chain": f"PolarisProfileRoot:profilePage:1:via_cold_start",
             "user_id": identifier
         }
-        request_headers = {
-            "accept": "*/*",
-            "accept-language": "en-US,en;q=0.9",
-            "content-type": "application/x-www-form-urlencoded",
-            "sec-ch-prefers-color-scheme": self.preferred_color_scheme,
-            "sec-ch-ua": self.user_agent,
-            "sec-ch-ua-full-version-list": self.user_agent,
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": "\"Windows\"",
-            "sec-ch-ua-platform-version": "\"15.0.0\"",
-            "sec-fetch-dest": "empty",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-site": "same-origin",
-            "viewport-width": "1475",
-            "x-asbd-id": "198387",
-            "x-csrftoken": self.csrf_token,
-            "x-ig-app-id": self.insta_app_id,
-            "x-ig-www-claim": self.x_ig_www_claim,
-            "x-instagram-ajax": "1007616494",
-            "x-requested-with": "XMLHttpRequest",
-            "Referer": f"https://www.instagram.com/{''.join(random.choices(string.ascii_lowercase, k=6))}/",
-            "Referrer-Policy": "strict-origin-when-cross-origin"
-        }
+        request_headers = self._headers("web_form", referer=self._fake_referer())
 
         try:
             http_response = self.request_session.post(
@@ -240,7 +216,8 @@ class SessionHost:
                 headers=request_headers,
                 data=body_json
             )
-            response_json = http_response.json()
+            self._invalidate_cache(identifier)
+            response_json = decode_response(http_response)
 
             if "status" in response_json:
                 if response_json["status"] == "ok" and "friendship_status" in response_json:
@@ -264,12 +241,30 @@ class SessionHost:
         except JSONDecodeError:
             raise NetworkError("HTTP Response is not a valid JSON.")
 
-    def followers(self, identifier: str | int, count: int = 0) -> Generator[FollowPerson, None, None]:
+    def followers(
+        self,
+        identifier: str | int,
+        count: int = 0,
+        stream: bool = False,
+        resume_from: Checkpoint | None = None,
+        autosave: Callable[[Checkpoint], None] | str | None = None,
+        autosave_every: int = 1,
+        prefetch: int = 0,
+        store: FollowPersonStore | None = None
+    ) -> Generator[FollowPerson, None, None]:
+
         """
         Generates a list of target's followers of specified size.
 
         :param identifier: Target's Username or UserID
         :param count: Amount of followers to fetch
+        :param stream: (Optional) Yield each user as soon as it's downloaded, instead of once the whole page is in
+        :param resume_from: (Optional) Checkpoint to continue from. It's updated in place as users are generated
+        :param autosave: (Optional) Function called with the checkpoint, or path of a JSON file to save it in
+        :param autosave_every: (Optional) Number of pages after which the checkpoint is autosaved
+        :param prefetch: (Optional) Number of pages fetched in the background, ahead of the ones being generated
+        :param store: (Optional) FollowPersonStore the users are appended to, straight from the API's JSON.
+                      No FollowPerson objects are built, and nothing is yielded: Exhaust the generator to fill it
         :return: Generator which yields each user's details
         """
 
@@ -279,92 +274,88 @@ class SessionHost:
             raise ConversionError(f"Can't convert identifier \"{identifier}\" into 'UID'.")
 
         # Actual Request
-        request_headers: dict = {
-            "accept": "*/*",
-            "accept-language": "en-US,en;q=0.9",
-            "sec-ch-prefers-color-scheme": self.preferred_color_scheme,
-            "sec-ch-ua": self.user_agent,
-            "sec-ch-ua-full-version-list": self.user_agent,
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": "\"Windows\"",
-            "sec-ch-ua-platform-version": "\"15.0.0\"",
-            "sec-fetch-dest": "empty",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-site": "same-origin",
-            "viewport-width": "1475",
-            "x-asbd-id": "198387",
-            "x-csrftoken": self.csrf_token,
-            "x-ig-app-id": self.insta_app_id,
-            "x-ig-www-claim": self.x_ig_www_claim,
-            "x-requested-with": "XMLHttpRequest",
-            "Referer": f"https://www.instagram.com/{''.join(random.choices(string.ascii_lowercase, k=6))}/followers/",
-            "Referrer-Policy": "strict-origin-when-cross-origin"
-        }
+        request_headers = self._headers("web", referer=self._fake_referer("followers/"))
 
-        current_max_id: str = ""
-        generated_count: int = 0
+        checkpoint: Checkpoint = resume_from if resume_from is not None else Checkpoint()
+        checkpoint.start("followers", identifier, autosave, autosave_every)
 
-        while True:
-            current_max_id_text: str = ""
+        count_text = 35 if count >= 35 else count
 
-            if current_max_id != "":
-                current_max_id_text: str = f"&max_id={current_max_id}"
+        def request_page(max_id: str) -> requests.Response:
+            return self.request_session.get(
+                f"https://www.instagram.com/api/v1/friendships/{identifier}/followers/?count={count_text}"
+                f"{f'&max_id={max_id}' if max_id != '' else ''}&search_surface=follow_list_page",
+                headers=request_headers,
+                stream=stream
+            )
 
+        def build(each_item: dict) -> FollowPerson:
             try:
-                count_text = 35
+                person = FollowPerson(
+                    has_anonymous_profile_picture=each_item["has_anonymous_profile_picture"],
+                    user_id=each_item["pk"],
+                    username=each_item["username"],
+                    full_name=each_item["full_name"],
+                    is_private=each_item["is_private"],
+                    is_verified=each_item["is_verified"],
+                    profile_picture_url=each_item["profile_pic_url"],
+                    badges=each_item["account_badges"],
+                    third_party_downloads_enabled=each_item["third_party_downloads_enabled"]
+                )
 
-                if count < 35:
-                    count_text = count
+            except KeyError:
+                raise APIError()
 
-                http_response = self.request_session.get(
-                    f"https://www.instagram.com/api/v1/friendships/{identifier}/followers/?count={str(count_text)}"
-                    f"{current_max_id_text}&search_surface=follow_list_page",
-                    headers=request_headers
-                )
-                response_json = http_response.json()
-
-                if "status" not in response_json or "users" not in response_json:
-                    yield None
-                    raise NetworkError("HTTP response doesn't include 'status' or 'users' node.")
-
-                if response_json["status"] != "ok":
-                    yield None
-                    raise NetworkError("HTTP response status not 'ok'.")
-
-                for each_item in response_json["users"]:
-                    if generated_count < count or count == 0:
-
-                        try:
-                            yield FollowPerson(
-                                has_anonymous_profile_picture=each_item["has_anonymous_profile_picture"],
-                                user_id=each_item["pk"],
-                                username=each_item["username"],
-                                full_name=each_item["full_name"],
-                                is_private=each_item["is_private"],
-                                is_verified=each_item["is_verified"],
-                                profile_picture_url=each_item["profile_pic_url"],
-                                badges=each_item["account_badges"],
-                                third_party_downloads_enabled=each_item["third_party_downloads_enabled"]
-                            )
-
-                        except KeyError:
-                            raise APIError()
-
-                        generated_count += 1
-
-                if (generated_count < count or count == 0) and "next_max_id" in response_json:
-                    current_max_id = response_json["next_max_id"]
-                else:
-                    return None
-            except JSONDecodeError:
-                yield None
-                raise NetworkError("HTTP Response is not a valid JSON.")
+            self.identifier_cache.put(person.username, person.user_id)
+            return person
+
+        yield from paginate(
+            request_page, "users", build, checkpoint, count, stream, prefetch,
+            raise_status_error=self.__raise_users_error, sink=None if store is None else store.append_json
+        )
+
+    def followers_diff(
+        self,
+        identifier: str | int,
+        previous: Sequence[str | int],
+        known_run: int = DEFAULT_KNOWN_RUN,
+        full: bool = False
+    ) -> FollowersDiff:
+
+        """
+        Finds new and lost followers since a previous snapshot, stopping early once known followers are reached.
+        :param identifier: Target's Username or UserID
+        :param previous: UserIDs of the previous snapshot, newest first. e.g. - last diff's snapshot
+        :param known_run: (Optional) Consecutive known followers after which pagination stops
+        :param full: (Optional) Read the whole list, to also catch old followers who left
+        :return: FollowersDiff (added, removed, snapshot)
+        """
+
+        return diff_followers(self.followers(identifier), previous, known_run, full)
+
+    def followings(
+        self,
+        identifier: str | int,
+        count: int = 0,
+        stream: bool = False,
+        resume_from: Checkpoint | None = None,
+        autosave: Callable[[Checkpoint], None] | str | None = None,
+        autosave_every: int = 1,
+        prefetch: int = 0,
+        store: FollowPersonStore | None = None
+    ) -> Generator[FollowPerson, None, None]:
 
-    def followings(self, identifier: str | int, count: int = 0) -> Generator[FollowPerson, None, None]:
         """
         Generates a list of users which the target follows, of specified size.
         :param identifier: Target's Username or UserID
         :param count: Amount of followings to fetch
+        :param stream: (Optional) Yield each user as soon as it's downloaded, instead of once the whole page is in
+        :param resume_from: (Optional) Checkpoint to continue from. It's updated in place as users are generated
+        :param autosave: (Optional) Function called with the checkpoint, or path of a JSON file to save it in
+        :param autosave_every: (Optional) Number of pages after which the checkpoint is autosaved
+        :param prefetch: (Optional) Number of pages fetched in the background, ahead of the ones being generated
+        :param store: (Optional) FollowPersonStore the users are appended to, straight from the API's JSON.
+                      No FollowPerson objects are built, and nothing is yielded: Exhaust the generator to fill it
         :return: Generator which yields each user's details
         """
 
@@ -374,83 +365,53 @@ class SessionHost:
             raise ConversionError(f"Can't convert identifier \"{identifier}\" into 'UID'.")
 
         # Actual Request
-        request_headers = {
-            "accept": "*/*",
-            "accept-language": "en-US,en;q=0.9",
-            "sec-ch-prefers-color-scheme": self.preferred_color_scheme,
-            "sec-ch-ua": self.user_agent,
-            "sec-ch-ua-full-version-list": self.user_agent,
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": "\"Windows\"",
-            "sec-ch-ua-platform-version": "\"15.0.0\"",
-            "sec-fetch-dest": "empty",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-site": "same-origin",
-            "viewport-width": "1475",
-            "x-asbd-id": "198387",
-            "x-csrftoken": self.csrf_token,
-            "x-ig-app-id": self.insta_app_id,
-            "x-ig-www-claim": self.x_ig_www_claim,
-            "x-requested-with": "XMLHttpRequest",
-            "Referer": f"https://www.instagram.com/{''.join(random.choices(string.ascii_lowercase, k=6))}/following/",
-            "Referrer-Policy": "strict-origin-when-cross-origin"
-        }
+        request_headers = self._headers("web", referer=self._fake_referer("following/"))
 
-        current_max_id = ""
-        generated_count = 0
+        checkpoint: Checkpoint = resume_from if resume_from is not None else Checkpoint()
+        checkpoint.start("followings", identifier, autosave, autosave_every)
 
-        while True:
-            current_max_id_text = ""
+        count_text = 35 if count >= 35 else count
 
-            if current_max_id != "":
-                current_max_id_text = f"&max_id={current_max_id}"
+        def request_page(max_id: str) -> requests.Response:
+            return self.request_session.get(
+                f"https://www.instagram.com/api/v1/friendships/{identifier}/following/?count={count_text}"
+                f"{f'&max_id={max_id}' if max_id != '' else ''}",
+                headers=request_headers,
+                stream=stream
+            )
 
+        def build(each_item: dict) -> FollowPerson:
             try:
-                count_text = 35
-
-                if count < 35:
-                    count_text = count
-
-                http_response = self.request_session.get(
-                    f"https://www.instagram.com/api/v1/friendships/{identifier}/following/?count={str(count_text)}"
-                    f"{current_max_id_text}",
-                    headers=request_headers)
-                response_json = http_response.json()
-
-                if "status" not in response_json or "users" not in response_json:
-                    yield None
-                    raise NetworkError("HTTP response doesn't include 'status' or 'users' node.")
-
-                if response_json["status"] != "ok":
-                    yield None
-                    raise NetworkError("HTTP response status not 'ok'.")
-
-                for each_item in response_json["users"]:
-                    if generated_count < count or count == 0:
-
-                        try:
-                            yield FollowPerson(
-                                has_anonymous_profile_picture=each_item["has_anonymous_profile_picture"],
-                                user_id=each_item["pk"],
-                                username=each_item["username"],
-                                full_name=each_item["full_name"],
-                                is_private=each_item["is_private"],
-                                is_verified=each_item["is_verified"],
-                                profile_picture_url=each_item["profile_pic_url"]
-                            )
-
-                        except KeyError:
-                            raise APIError()
-
-                        generated_count += 1
-
-                if (generated_count < count or count == 0) and "next_max_id" in response_json:
-                    current_max_id = response_json["next_max_id"]
-                else:
-                    return None
-            except JSONDecodeError:
-                yield None
-                raise NetworkError("HTTP Response is not a valid JSON.")
+                person = FollowPerson(
+                    has_anonymous_profile_picture=each_item["has_anonymous_profile_picture"],
+                    user_id=each_item["pk"],
+                    username=each_item["username"],
+                    full_name=each_item["full_name"],
+                    is_private=each_item["is_private"],
+                    is_verified=each_item["is_verified"],
+                    profile_picture_url=each_item["profile_pic_url"]
+                )
+
+            except KeyError:
+                raise APIError()
+
+            self.identifier_cache.put(person.username, person.user_id)
+            return person
+
+        yield from paginate(
+            request_page, "users", build, checkpoint, count, stream, prefetch,
+            raise_status_error=self.__raise_users_error, sink=None if store is None else store.append_json
+        )
+
+    @staticmethod
+    def __raise_users_error(response_json: dict) -> None:
+        # Streamed pages aren't read by the RetryPolicy: Rate limits are only noticed here.
+        # Anything else falls through to the paginator's NetworkError
+        if response_json.get("message", "") == "checkpoint_required" or response_json.get("spam") is True:
+            raise RateLimitedError(
+                "Spam Detected: Your actions are being limited by Instagram. "
+                "Wait for some time, or use another account."
+            )
 
     def _identifier(self, identifier: str | int, required: str | int):
         identifier = str(identifier).lower().replace(" ", "")
@@ -490,6 +451,20 @@ class SessionHost:
         else:
             raise DevelopmentError()
 
+    def _invalidate_cache(self, *uids: str) -> None:
+        """
+        Drops cached responses made stale by a write: Your own profile, feed & private info, and the given users'.
+        :param uids: UserIDs of the users affected by the write
+        :return: None
+        """
+
+        if self.transport.response_cache is None: return None
+
+        subjects: list[str] = [self.user_id, self.username]
+        for uid in uids: subjects += [uid, self.identifier_cache.get_username(uid)]
+
+        self.transport.response_cache.invalidate(*subjects)
+
     def _set_account_privacy(self, privacy: str) -> bool:
         is_private = (privacy == "private")
 
@@ -499,29 +474,7 @@ class SessionHost:
         body_json = {
             "is_private": is_private
         }
-        request_headers = {
-            "accept": "*/*",
-            "accept-language": "en-US,en;q=0.9",
-            "content-type": "application/x-www-form-urlencoded",
-            "sec-ch-prefers-color-scheme": self.preferred_color_scheme,
-            "sec-ch-ua": self.user_agent,
-            "sec-ch-ua-full-version-list": self.user_agent,
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": "\"Windows\"",
-            "sec-ch-ua-platform-version": "\"15.0.0\"",
-            "sec-fetch-dest": "empty",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-site": "same-origin",
-            "viewport-width": "1475",
-            "x-asbd-id": "198387",
-            "x-csrftoken": self.csrf_token,
-            "x-ig-app-id": self.insta_app_id,
-            "x-ig-www-claim": self.x_ig_www_claim,
-            "x-instagram-ajax": "1007616494",
-            "x-requested-with": "XMLHttpRequest",
-            "Referer": "https://www.instagram.com/accounts/who_can_see_your_content/",
-            "Referrer-Policy": "strict-origin-when-cross-origin"
-        }
+        request_headers = self._headers("web_form", referer="https://www.instagram.com/accounts/who_can_see_your_content/")
 
         try:
             http_response = self.request_session.post(
@@ -529,7 +482,8 @@ class SessionHost:
                 headers=request_headers,
                 data=body_json
             )
-            response_json = http_response.json()
+            self._invalidate_cache()
+            response_json = decode_response(http_response)
 
             if "status" not in response_json:
                 return False
@@ -566,6 +520,16 @@ class SessionHost:
 
         return self.guest.profile(username, __session__=self.request_session)
 
+    def profiles(self, usernames: Iterable[str], concurrency: int = DEFAULT_CONCURRENCY) -> Generator[ProfileResult, None, None]:
+        """
+        Fetches many profiles at once. Requests still go through the Transport's RateLimiter.
+        :param usernames: Usernames of the targets. Duplicates are only fetched once
+        :param concurrency: (Optional) Max number of profiles fetched at the same time
+        :return: Generator which yields a ProfileResult per username, as soon as each one is done
+        """
+
+        return self.guest.profiles(usernames, concurrency, __session__=self.request_session)
+
     def get_username(self, uid: str | int) -> str | None:
         """
         Returns the username of the target user, when given their userid.
@@ -584,15 +548,42 @@ class SessionHost:
 
         return self.guest.get_uid(username, __session__=self.request_session)
 
-    def posts(self, username: str, count: int = 0) -> Generator[Post, None, None]:
+    def posts(
+        self,
+        username: str,
+        count: int = 0,
+        stream: bool = False,
+        resume_from: Checkpoint | None = None,
+        autosave: Callable[[Checkpoint], None] | str | None = None,
+        autosave_every: int = 1,
+        prefetch: int = 0,
+        lazy: bool = False
+    ) -> Generator[Post | PostView, None, None]:
+
         """
         Generates a list of target's posts of specified size.
         :param username: Target's Username
         :param count: Amount of posts to fetch
+        :param stream: (Optional) Yield each post as soon as it's downloaded, instead of once the whole page is in
+        :param resume_from: (Optional) Checkpoint to continue from. It's updated in place as posts are generated
+        :param autosave: (Optional) Function called with the checkpoint, or path of a JSON file to save it in
+        :param autosave_every: (Optional) Number of pages after which the checkpoint is autosaved
+        :param prefetch: (Optional) Number of pages fetched in the background, ahead of the ones being generated
+        :param lazy: (Optional) Yield read-only PostViews, which read each field when it's accessed, instead of Posts
         :return: Generator which yields each post's data
         """
 
-        return self.guest.posts(username, count, __session__=self.request_session)
+        return self.guest.posts(
+            username,
+            count,
+            __session__=self.request_session,
+            stream=stream,
+            resume_from=resume_from,
+            autosave=autosave,
+            autosave_every=autosave_every,
+            prefetch=prefetch,
+            lazy=lazy
+        )
 
     def get_post_id(self, share_url: str) -> str:
         """
@@ -603,40 +594,37 @@ class SessionHost:
 
         share_url: str = share_url.strip()
 
-        request_headers = {
-            "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif"
-                      ",image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-            "accept-language": "en-US,en;q=0.9",
-            "cache-control": "max-age=0",
-            "sec-ch-prefers-color-scheme": "dark",
-            "sec-ch-ua": self.user_agent,
-            "sec-ch-ua-full-version-list": self.user_agent,
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": "\"Windows\"",
-            "sec-ch-ua-platform-version": "\"15.0.0\"",
-            "sec-fetch-dest": "document",
-            "sec-fetch-mode": "navigate",
-            "sec-fetch-site": "same-origin",
-            "sec-fetch-user": "?1",
-            "upgrade-insecure-requests": "1",
-            "viewport-width": "1475",
-            "referrerPolicy": "strict-origin-when-cross-origin"
-        }
+        # Shortcode in the url is the post_id itself, just encoded differently
+        shortcode: str | None = shortcode_from_url(share_url)
+
+        if shortcode is not None:
+            try: return shortcode_to_media_id(shortcode)
+            except ConversionError: pass
+
+        # Fallback: Find it in the post's page, and stop downloading as soon as it's there
+        request_headers = self._headers("document")
+
+        http_response = self.request_session.get(share_url, headers=request_headers, stream=True)
 
-        http_response = self.request_session.get(share_url, headers=request_headers)
-        response_text = http_response.text
+        required_text = b"instagram://images?id="
+        response_bytes = b""
 
-        required_text = "instagram://images?id="
+        try:
+            for chunk in http_response.iter_content(8192):
+                response_bytes = response_bytes[-(len(required_text) + 25):] + chunk
+
+                initial_index = response_bytes.find(required_text)
+                if initial_index == -1: continue
 
-        initial_index = response_text.find(required_text)
-        if initial_index == -1: raise APIError()
+                rest_bytes = response_bytes[initial_index + len(required_text): initial_index + len(required_text) + 25]
 
-        rest_text = response_text[initial_index + len(required_text): initial_index + len(required_text) + 25]
+                end_index = rest_bytes.find(b'"')
+                if end_index != -1: return rest_bytes[:end_index].decode()
 
-        end_index = rest_text.find('"')
-        if end_index == -1: raise APIError()
+        finally:
+            http_response.close()
 
-        return rest_text[:end_index]
+        raise APIError()
 
     def private_info(self) -> PrivateInfo:
         """
@@ -644,25 +632,7 @@ class SessionHost:
         :return: Object which contains your private info
         """
 
-        request_headers = {
-            "accept": "*/*",
-            "dpr": "1.30208",
-            "sec-ch-prefers-color-scheme": "dark",
-            "sec-ch-ua": self.user_agent,
-            "sec-ch-ua-full-version-list": self.user_agent,
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-model": "\"\"",
-            "sec-ch-ua-platform": "\"Windows\"",
-            "sec-ch-ua-platform-version": "\"15.0.0\"",
-            "viewport-width": "1475",
-            "x-asbd-id": "129477",
-            "x-csrftoken": self.csrf_token,
-            "x-ig-app-id": self.insta_app_id,
-            "x-ig-www-claim": self.x_ig_www_claim,
-            "x-requested-with": "XMLHttpRequest",
-            "Referer": "https://www.instagram.com/accounts/edit/",
-            "Referrer-Policy": "strict-origin-when-cross-origin"
-        }
+        request_headers = self._headers("form_data")
 
         http_response = self.request_session.get(
             f"https://www.instagram.com/api/v1/accounts/edit/web_form_data/",
@@ -670,7 +640,7 @@ class SessionHost:
         )
 
         try:
-            response_json: dict = http_response.json()
+            response_json: dict = decode_response(http_response)
 
             if "status" not in response_json: raise NetworkError("Key 'status' not in response json.")
             if response_json.get("status") != "ok": raise NetworkError("Key 'status' not 'ok' in response json.")
@@ -712,27 +682,7 @@ class SessionHost:
 
         private_info = self.private_info()
 
-        request_headers = {
-            "accept": "*/*",
-            "content-type": "application/x-www-form-urlencoded",
-            "dpr": "1.30208",
-            "sec-ch-prefers-color-scheme": "dark",
-            "sec-ch-ua": self.user_agent,
-            "sec-ch-ua-full-version-list": self.user_agent,
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-model": "\"\"",
-            "sec-ch-ua-platform": "\"Windows\"",
-            "sec-ch-ua-platform-version": "\"15.0.0\"",
-            "viewport-width": "1475",
-            "x-asbd-id": "129477",
-            "x-csrftoken": self.csrf_token,
-            "x-ig-app-id": self.insta_app_id,
-            "x-ig-www-claim": self.x_ig_www_claim,
-            "x-instagram-ajax": "1009841815",
-            "x-requested-with": "XMLHttpRequest",
-            "Referer": "https://www.instagram.com/accounts/edit/",
-            "Referrer-Policy": "strict-origin-when-cross-origin"
-        }
+        request_headers = self._headers("edit_profile")
 
         body_json = {
             "biography": biography,
@@ -749,9 +699,10 @@ class SessionHost:
             headers=request_headers,
             data=body_json
         )
+        self._invalidate_cache()
 
         try:
-            response_json: dict = http_response.json()
+            response_json: dict = decode_response(http_response)
 
             if "status" not in response_json: raise NetworkError(
                 "Key 'status' not in response json. Possibly it's a fault from your side."
@@ -770,27 +721,7 @@ class SessionHost:
 
         private_info = self.private_info()
 
-        request_headers = {
-            "accept": "*/*",
-            "content-type": "application/x-www-form-urlencoded",
-            "dpr": "1.30208",
-            "sec-ch-prefers-color-scheme": "dark",
-            "sec-ch-ua": self.user_agent,
-            "sec-ch-ua-full-version-list": self.user_agent,
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-model": "\"\"",
-            "sec-ch-ua-platform": "\"Windows\"",
-            "sec-ch-ua-platform-version": "\"15.0.0\"",
-            "viewport-width": "1475",
-            "x-asbd-id": "129477",
-            "x-csrftoken": self.csrf_token,
-            "x-ig-app-id": self.insta_app_id,
-            "x-ig-www-claim": self.x_ig_www_claim,
-            "x-instagram-ajax": "1009841815",
-            "x-requested-with": "XMLHttpRequest",
-            "Referer": "https://www.instagram.com/accounts/edit/",
-            "Referrer-Policy": "strict-origin-when-cross-origin"
-        }
+        request_headers = self._headers("edit_profile")
 
         body_json = {
             "biography": private_info.biography,
@@ -807,9 +738,10 @@ class SessionHost:
             headers=request_headers,
             data=body_json
         )
+        self._invalidate_cache()
 
         try:
-            response_json: dict = http_response.json()
+            response_json: dict = decode_response(http_response)
 
             if "status" not in response_json: raise NetworkError(
                 "Key 'status' not in response json. Possibly it's a fault from your side."
@@ -844,30 +776,24 @@ class SessionHost:
             "image_compression": json.dumps({"lib_name": "moz", "lib_version": "3.1.m", "quality": 80})
         }
 
-        with open(media_path, "rb") as file:
-            photo_data = file.read()
-            photo_length = str(len(photo_data))
-
         request_headers = {
             "accept-encoding": "gzip",
             "x-instagram-rupload-params": json.dumps(rupload_params),
             "x_fb_photo_waterfall_id": waterfall_id,
             "x-entity-type": mimetype,
-            "offset": "0",
             "x-entity-name": upload_name,
-            "x-entity-length": photo_length,
-            "content-type": mimetype,
-            "content-length": photo_length
+            "content-type": mimetype
         }
 
-        http_response = self.request_session.post(
+        http_response = rupload(
+            self.request_session,
             f"https://i.instagram.com/rupload_igphoto/{upload_name}",
-            data=photo_data,
-            headers=request_headers
+            media_path,
+            request_headers
         )
 
         try:
-            response_json: dict = http_response.json()
+            response_json: dict = decode_response(http_response)
 
             if response_json.get("status", "") != "ok": raise NetworkError("Response json key 'status' not ok.")
             if response_json.get("upload_id", "") == "": raise NetworkError(
@@ -880,7 +806,7 @@ class SessionHost:
             raise NetworkError("Response not a valid json.")
 
     def __upload_video(self, path: str, arg_upload_id: str | None = None) -> tuple[bool, any, any, any]:
-        video_editor = moviepy.editor.VideoFileClip(path)
+        video_info = probe_video(path)
 
         path: Path = Path(path)
         waterfall_id = str(uuid4())
@@ -894,9 +820,9 @@ class SessionHost:
             "media_type": "2",
             "xsharing_user_ids": json.dumps([self.user_id]),
             "upload_id": upload_id,
-            "upload_media_duration_ms": str(int(video_editor.duration * 1000)),
-            "upload_media_width": str(video_editor.size[0]),
-            "upload_media_height": str(video_editor.size[1])
+            "upload_media_duration_ms": str(int(video_info.duration * 1000)),
+            "upload_media_width": str(video_info.width),
+            "upload_media_height": str(video_info.height)
         }
 
         request_headers__get = {
@@ -915,34 +841,29 @@ class SessionHost:
             "Video Upload 'GET' Request failed. Status code not 200."
         )
 
-        # POST Request
-
-        with open(path, "rb") as file:
-            video_data = file.read()
-            video_length = str(len(video_data))
+        # POST Request: Carries on from whatever the server already has of this upload_id
 
         request_headers = {
-            "offset": "0",
             "x-entity-name": upload_name,
-            "x-entity-length": video_length,
             "content-type": "application/octet-stream",
-            "content-length": video_length,
             **request_headers__get
         }
 
-        http_response = self.request_session.post(
+        http_response = rupload(
+            self.request_session,
             f"https://i.instagram.com/rupload_igvideo/{upload_name}",
-            data=video_data,
-            headers=request_headers
+            path,
+            request_headers,
+            offset=committed_offset(http_response__get)
         )
 
         try:
-            response_json: dict = http_response.json()
+            response_json: dict = decode_response(http_response)
 
             return response_json.get("status", "") == "ok",\
-                video_editor.duration,\
-                video_editor.size[0],\
-                video_editor.size[1]
+                video_info.duration,\
+                video_info.width,\
+                video_info.height
 
         except JSONDecodeError:
             raise NetworkError("Response not a valid json.")
@@ -967,31 +888,7 @@ class SessionHost:
         :return: PostUpload
         """
 
-        request_headers: dict = {
-            "accept": "*/*",
-            "accept-language": "en-US,en;q=0.9",
-            "content-type": "application/x-www-form-urlencoded",
-            "dpr": "1.30208",
-            "sec-ch-prefers-color-scheme": "dark",
-            "sec-ch-ua": self.user_agent,
-            "sec-ch-ua-full-version-list": self.user_agent,
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-model": "\"\"",
-            "sec-ch-ua-platform": "\"Windows\"",
-            "sec-ch-ua-platform-version": "\"15.0.0\"",
-            "sec-fetch-dest": "empty",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-site": "same-origin",
-            "viewport-width": "1475",
-            "x-asbd-id": "129477",
-            "x-csrftoken": self.csrf_token,
-            "x-ig-app-id": self.insta_app_id,
-            "x-ig-www-claim": self.x_ig_www_claim,
-            "x-instagram-ajax": "1009848613",
-            "x-requested-with": "XMLHttpRequest",
-            "Referer": "https://www.instagram.com/",
-            "Referrer-Policy": "strict-origin-when-cross-origin"
-        }
+        request_headers = self._headers("configure")
 
         body_json = {
             "archive_only": archive_only,
@@ -1015,10 +912,10 @@ class SessionHost:
             headers=request_headers,
             data=body_json
         )
+        self._invalidate_cache()
 
         try:
-            response_json: dict = http_response.json()
-            return PhotoUpload.from_response_data(response_json)
+            return PhotoUpload.from_response_content(http_response.content)
 
         except JSONDecodeError:
             raise NetworkError("Response not a valid json.")
@@ -1042,31 +939,7 @@ class SessionHost:
         :return: Boolean (Whether post was successfully created or not)
         """
 
-        request_headers: dict = {
-            "accept": "*/*",
-            "accept-language": "en-US,en;q=0.9",
-            "content-type": "application/x-www-form-urlencoded",
-            "dpr": "1.30208",
-            "sec-ch-prefers-color-scheme": "dark",
-            "sec-ch-ua": self.user_agent,
-            "sec-ch-ua-full-version-list": self.user_agent,
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-model": "\"\"",
-            "sec-ch-ua-platform": "\"Windows\"",
-            "sec-ch-ua-platform-version": "\"15.0.0\"",
-            "sec-fetch-dest": "empty",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-site": "same-origin",
-            "viewport-width": "1475",
-            "x-asbd-id": "129477",
-            "x-csrftoken": self.csrf_token,
-            "x-ig-app-id": self.insta_app_id,
-            "x-ig-www-claim": self.x_ig_www_claim,
-            "x-instagram-ajax": "1009848613",
-            "x-requested-with": "XMLHttpRequest",
-            "Referer": "https://www.instagram.com/",
-            "Referrer-Policy": "strict-origin-when-cross-origin"
-        }
+        request_headers = self._headers("configure")
 
         body_json = {
             "archive_only": archive_only,
@@ -1083,9 +956,10 @@ class SessionHost:
             headers=request_headers,
             data=json.dumps(body_json)
         )
+        self._invalidate_cache()
 
         try:
-            response_json: dict = http_response.json()
+            response_json: dict = decode_response(http_response)
 
             return response_json.get("status", "") == "ok"
 
@@ -1134,31 +1008,7 @@ class SessionHost:
                 "sure your image is JPG or try with a different one."
             )
 
-        request_headers: dict = {
-            "accept": "*/*",
-            "accept-language": "en-US,en;q=0.9",
-            "content-type": "application/x-www-form-urlencoded",
-            "dpr": "1.30208",
-            "sec-ch-prefers-color-scheme": "dark",
-            "sec-ch-ua": self.user_agent,
-            "sec-ch-ua-full-version-list": self.user_agent,
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-model": "\"\"",
-            "sec-ch-ua-platform": "\"Windows\"",
-            "sec-ch-ua-platform-version": "\"15.0.0\"",
-            "sec-fetch-dest": "empty",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-site": "same-origin",
-            "viewport-width": "1475",
-            "x-asbd-id": "129477",
-            "x-csrftoken": self.csrf_token,
-            "x-ig-app-id": self.insta_app_id,
-            "x-ig-www-claim": self.x_ig_www_claim,
-            "x-instagram-ajax": "1009848613",
-            "x-requested-with": "XMLHttpRequest",
-            "Referer": "https://www.instagram.com/",
-            "Referrer-Policy": "strict-origin-when-cross-origin"
-        }
+        request_headers = self._headers("configure")
 
         body_json = {
             "archive_only": archive_only,
@@ -1182,10 +1032,10 @@ class SessionHost:
             headers=request_headers,
             data=body_json
         )
+        self._invalidate_cache()
 
         try:
-            response_json: dict = http_response.json()
-            return ReelUpload.from_response_data(response_json)
+            return ReelUpload.from_response_content(http_response.content)
 
         except JSONDecodeError:
             raise NetworkError("Response not a valid json.")
@@ -1198,28 +1048,7 @@ class SessionHost:
         :return: Boolean (Whether comment was successfully added or not)
         """
 
-        request_headers: json = {
-            "accept": "*/*",
-            "accept-language": "en-US,en;q=0.9",
-            "sec-ch-prefers-color-scheme": self.preferred_color_scheme,
-            "sec-ch-ua": "\"Not.A/Brand\";v=\"8\", \"Chromium\";v=\"114\", \"Google Chrome\";v=\"114\"",
-            "sec-ch-ua-full-version-list": "\"Not.A/Brand\";v=\"8.0.0.0\", \"Chromium\";v=\"114.0.5735.134\", "
-                                           "\"Google Chrome\";v=\"114.0.5735.134\"",
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": "\"Windows\"",
-            "sec-ch-ua-platform-version": "\"15.0.0\"",
-            "sec-fetch-dest": "empty",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-site": "same-origin",
-            "viewport-width": "1475",
-            "x-asbd-id": "129477",
-            "x-csrftoken": self.csrf_token,
-            "x-ig-app-id": self.insta_app_id,
-            "x-ig-www-claim": self.x_ig_www_claim,
-            "x-requested-with": "XMLHttpRequest",
-            "Referer": f"https://www.instagram.com/",
-            "Referrer-Policy": "strict-origin-when-cross-origin"
-        }
+        request_headers = self._headers("media")
 
         body_json: json = {"comment_text": text}
 
@@ -1230,7 +1059,7 @@ class SessionHost:
         )
 
         try:
-            response_json: dict = http_response.json()
+            response_json: dict = decode_response(http_response)
 
             return response_json.get("status", "") == "ok"
 
@@ -1239,30 +1068,7 @@ class SessionHost:
 
     def __like_action(self, post_id: str, action: str = "like") -> bool:
 
-        request_headers = {
-            "accept": "*/*",
-            "accept-language": "en-US,en;q=0.9",
-            "content-type": "application/x-www-form-urlencoded",
-            "sec-ch-prefers-color-scheme": self.preferred_color_scheme,
-            "sec-ch-ua": "\"Not.A/Brand\";v=\"8\", \"Chromium\";v=\"114\", \"Google Chrome\";v=\"114\"",
-            "sec-ch-ua-full-version-list": "\"Not.A/Brand\";v=\"8.0.0.0\", \"Chromium\";v=\"114.0.5735.110\", "
-                                           "\"Google Chrome\";v=\"114.0.5735.110\"",
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": "\"Windows\"",
-            "sec-ch-ua-platform-version": "\"15.0.0\"",
-            "sec-fetch-dest": "empty",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-site": "same-origin",
-            "viewport-width": "1475",
-            "x-asbd-id": "129477",
-            "x-csrftoken": self.csrf_token,
-            "x-ig-app-id": self.insta_app_id,
-            "x-ig-www-claim": self.x_ig_www_claim,
-            "x-instagram-ajax": "1007670408",
-            "x-requested-with": "XMLHttpRequest",
-            "Referer": f"https://www.instagram.com/",
-            "Referrer-Policy": "strict-origin-when-cross-origin"
-        }
+        request_headers = self._headers("like")
 
         try:
             http_response = self.request_session.post(
@@ -1270,7 +1076,7 @@ class SessionHost:
                 headers=request_headers
             )
 
-            response_json = http_response.json()
+            response_json = decode_response(http_response)
 
             if "status" in response_json:
                 return response_json["status"] == "ok"
@@ -1299,33 +1105,12 @@ class SessionHost:
 
     def likers(self, post_id: str) -> Likers | None:
         """
-        Generates a list of users who liked the target post of specified size.
+        Returns the first page of users who liked the target post. Use iter_likers() to go through all of them.
         :param post_id: ID of target post, fetch using get_post_id() method
-        :return: Generator which yields each user's data
+        :return: Likers
         """
 
-        request_headers = {
-            "accept": "*/*",
-            "accept-language": "en-US,en;q=0.9",
-            "sec-ch-prefers-color-scheme": self.preferred_color_scheme,
-            "sec-ch-ua": "\"Not.A/Brand\";v=\"8\", \"Chromium\";v=\"114\", \"Google Chrome\";v=\"114\"",
-            "sec-ch-ua-full-version-list": "\"Not.A/Brand\";v=\"8.0.0.0\", \"Chromium\";v=\"114.0.5735.134\", "
-                                           "\"Google Chrome\";v=\"114.0.5735.134\"",
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-platform": "\"Windows\"",
-            "sec-ch-ua-platform-version": "\"15.0.0\"",
-            "sec-fetch-dest": "empty",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-site": "same-origin",
-            "viewport-width": "1475",
-            "x-asbd-id": "129477",
-            "x-csrftoken": self.csrf_token,
-            "x-ig-app-id": self.insta_app_id,
-            "x-ig-www-claim": self.x_ig_www_claim,
-            "x-requested-with": "XMLHttpRequest",
-            "Referer": f"https://www.instagram.com/",
-            "Referrer-Policy": "strict-origin-when-cross-origin"
-        }
+        request_headers = self._headers("media")
 
         try:
             http_response = self.request_session.get(
@@ -1333,7 +1118,7 @@ class SessionHost:
                 headers=request_headers
             )
 
-            response_json: dict = http_response.json()
+            response_json: dict = decode_response(http_response)
 
             if "status" not in response_json or "users" not in response_json:
                 return None
@@ -1343,19 +1128,9 @@ class SessionHost:
 
             likers_list = []
             for user in response_json["users"]:
-                user: dict
-                liker = Liker(
-                    user_id=user.get("pk", ""),
-                    username=user.get("username", ""),
-                    full_name=user.get("full_name", ""),
-                    is_private=user.get("is_private", False),
-                    badges=user.get("account_badges", []),
-                    is_verified=user.get("is_verified", False),
-                    profile_picture_id=user.get("profile_pic_id", ""),
-                    profile_picture_url=user.get("pprofile_pic_url", ""),
-                    latest_reel_media=user.get("latest_reel_media", 0)
-                )
+                liker: Liker = self.__process_liker_data(user)
                 likers_list.append(liker)
+                self.identifier_cache.put(liker.username, liker.user_id)
 
             return Likers(
                 user_count=response_json.get("user_count", 0),
@@ -1363,3 +1138,356 @@ class SessionHost:
             )
         except JSONDecodeError:
             return None
+
+    def iter_likers(
+        self,
+        post_id: str,
+        count: int = 0,
+        stream: bool = False,
+        resume_from: Checkpoint | None = None,
+        autosave: Callable[[Checkpoint], None] | str | None = None,
+        autosave_every: int = 1,
+        prefetch: int = 0,
+        store: LikerStore | None = None
+    ) -> Generator[Liker, None, None]:
+
+        """
+        Generates the users who liked the target post, page after page.
+        :param post_id: ID of target post, fetch using get_post_id() method
+        :param count: Amount of likers to fetch
+        :param stream: (Optional) Yield each user as soon as it's downloaded, instead of once the whole page is in
+        :param resume_from: (Optional) Checkpoint to continue from. It's updated in place as users are generated
+        :param autosave: (Optional) Function called with the checkpoint, or path of a JSON file to save it in
+        :param autosave_every: (Optional) Number of pages after which the checkpoint is autosaved
+        :param prefetch: (Optional) Number of pages fetched in the background, ahead of the ones being generated
+        :param store: (Optional) LikerStore the users are appended to, straight from the API's JSON.
+                      No Liker objects are built, and nothing is yielded: Exhaust the generator to fill it
+        :return: Generator which yields each user's details
+        """
+
+        request_headers = self._headers("media")
+
+        checkpoint: Checkpoint = resume_from if resume_from is not None else Checkpoint()
+        checkpoint.start("likers", post_id, autosave, autosave_every)
+
+        def request_page(max_id: str) -> requests.Response:
+            return self.request_session.get(
+                f"https://www.instagram.com/api/v1/media/{post_id}/likers/"
+                f"{f'?max_id={max_id}' if max_id != '' else ''}",
+                headers=request_headers,
+                stream=stream
+            )
+
+        def build(each_item: dict) -> Liker:
+            liker: Liker = self.__process_liker_data(each_item)
+            self.identifier_cache.put(liker.username, liker.user_id)
+
+            return liker
+
+        yield from paginate(
+            request_page, "users", build, checkpoint, count, stream, prefetch,
+            raise_status_error=self.__raise_users_error, sink=None if store is None else store.append_json
+        )
+
+    def comments(
+        self,
+        post_id: str,
+        count: int = 0,
+        replies: bool = False,
+        resume_from: Checkpoint | None = None,
+        autosave: Callable[[Checkpoint], None] | str | None = None,
+        autosave_every: int = 1,
+        prefetch: int = 0
+    ) -> Generator[Comment, None, None]:
+
+        """
+        Generates the comments on the target post, page after page.
+        :param post_id: ID of target post, fetch using get_post_id() method
+        :param count: Amount of comments to fetch. Replies aren't counted
+        :param replies: (Optional) Also fetch each comment's replies, generated right after it
+        :param resume_from: (Optional) Checkpoint to continue from. It's updated in place as comments are generated
+        :param autosave: (Optional) Function called with the checkpoint, or path of a JSON file to save it in
+        :param autosave_every: (Optional) Number of pages after which the checkpoint is autosaved
+        :param prefetch: (Optional) Number of pages fetched in the background, ahead of the ones being generated
+        :return: Generator which yields each comment
+        """
+
+        request_headers = self._headers("media")
+
+        checkpoint: Checkpoint = resume_from if resume_from is not None else Checkpoint()
+        checkpoint.start("comments", post_id, autosave, autosave_every)
+
+        def request_page(min_id: str) -> requests.Response:
+            # Cursors are JSON documents: They're passed as params to get them encoded
+            return self.request_session.get(
+                f"https://www.instagram.com/api/v1/media/{post_id}/comments/",
+                params={"can_support_threading": "true", "permalink_enabled": "false", **({"min_id": min_id} if min_id != "" else {})},
+                headers=request_headers
+            )
+
+        def build(each_item: dict) -> Comment:
+            return self.__process_comment_data(each_item, post_id)
+
+        def thread(comment: Comment) -> Generator[Comment, None, None]:
+            each_comment: Comment
+
+            for each_comment in itertools.chain(
+                (comment,),
+                self.__child_comments(post_id, comment.comment_id, request_headers) if replies and comment.child_comment_count else ()
+            ):
+                self.identifier_cache.put(each_comment.username, each_comment.user_id)
+                yield each_comment
+
+        yield from paginate(
+            request_page, "comments", build, checkpoint, count, prefetch=prefetch, cursor_key="next_min_id", thread=thread
+        )
+
+    def __child_comments(self, post_id: str, comment_id: str, request_headers: dict[str, str]) -> Generator[Comment, None, None]:
+        max_id: str = ""
+
+        while True:
+            response_json: dict = decode_response(self.request_session.get(
+                f"https://www.instagram.com/api/v1/media/{post_id}/comments/{comment_id}/child_comments/",
+                params={"max_id": max_id} if max_id != "" else None,
+                headers=request_headers
+            ))
+
+            if response_json.get("status") != "ok" or "child_comments" not in response_json:
+                raise NetworkError("HTTP response doesn't include 'child_comments' node, or its status isn't 'ok'.")
+
+            for each_item in response_json["child_comments"]: yield self.__process_comment_data(each_item, post_id)
+
+            max_id = response_json.get("next_max_child_cursor") or ""
+            if not response_json.get("has_more_tail_child_comments") or max_id == "": return None
+
+    @staticmethod
+    def __process_comment_data(data: dict, post_id: str) -> Comment:
+        user: dict = data.get("user") or {}
+
+        return Comment(
+            comment_id=str(data.get("pk", "")),
+            post_id=str(post_id),
+            parent_comment_id=data.get("parent_comment_id"),
+            text=data.get("text", ""),
+            created_at=data.get("created_at", 0),
+            like_count=data.get("comment_like_count", 0),
+            child_comment_count=data.get("child_comment_count", 0),
+            user_id=str(user.get("pk", "")),
+            username=user.get("username", ""),
+            full_name=user.get("full_name", ""),
+            is_private=user.get("is_private", False),
+            is_verified=user.get("is_verified", False),
+            profile_picture_url=user.get("profile_pic_url", "")
+        )
+
+    @staticmethod
+    def __process_liker_data(user: dict) -> Liker:
+        return Liker(
+            user_id=user.get("pk", ""),
+            username=user.get("username", ""),
+            full_name=user.get("full_name", ""),
+            is_private=user.get("is_private", False),
+            badges=user.get("account_badges", []),
+            is_verified=user.get("is_verified", False),
+            profile_picture_id=user.get("profile_pic_id", ""),
+            profile_picture_url=user.get("profile_pic_url", ""),
+            latest_reel_media=user.get("latest_reel_media", 0)
+        )
+
+    def _headers(self, name: str, referer: str = None) -> dict[str, str]:
+        """
+        Returns the headers of an endpoint, built from the template that's cached on this instance.
+        :param name: Template name, see _build_header_templates()
+        :param referer: Referer to fill in, if the template doesn't have a fixed one
+        :return: Headers
+        """
+
+        if self.header_templates is None: self.header_templates = self._build_header_templates()
+
+        return self.header_templates[name].render(
+            csrf_token=self.csrf_token,
+            www_claim=self.x_ig_www_claim,
+            referer=referer
+        )
+
+    @classmethod
+    def _fake_referer(cls, path: str = "") -> str:
+        return f"https://www.instagram.com/{cls.fake_usernames[random.getrandbits(8)]}/{path}"
+
+    def _build_header_templates(self) -> dict[str, HeaderTemplate]:
+        return {
+            "web": HeaderTemplate({
+                "accept": "*/*",
+                "accept-language": "en-US,en;q=0.9",
+                "sec-ch-prefers-color-scheme": self.preferred_color_scheme,
+                "sec-ch-ua": self.user_agent,
+                "sec-ch-ua-full-version-list": self.user_agent,
+                "sec-ch-ua-mobile": "?0",
+                "sec-ch-ua-platform": "\"Windows\"",
+                "sec-ch-ua-platform-version": "\"15.0.0\"",
+                "sec-fetch-dest": "empty",
+                "sec-fetch-mode": "cors",
+                "sec-fetch-site": "same-origin",
+                "viewport-width": "1475",
+                "x-asbd-id": "198387",
+                "x-csrftoken": CSRF_TOKEN,
+                "x-ig-app-id": self.insta_app_id,
+                "x-ig-www-claim": WWW_CLAIM,
+                "x-requested-with": "XMLHttpRequest",
+                "Referer": REFERER,
+                "Referrer-Policy": "strict-origin-when-cross-origin"
+            }),
+            "web_form": HeaderTemplate({
+                "accept": "*/*",
+                "accept-language": "en-US,en;q=0.9",
+                "content-type": "application/x-www-form-urlencoded",
+                "sec-ch-prefers-color-scheme": self.preferred_color_scheme,
+                "sec-ch-ua": self.user_agent,
+                "sec-ch-ua-full-version-list": self.user_agent,
+                "sec-ch-ua-mobile": "?0",
+                "sec-ch-ua-platform": "\"Windows\"",
+                "sec-ch-ua-platform-version": "\"15.0.0\"",
+                "sec-fetch-dest": "empty",
+                "sec-fetch-mode": "cors",
+                "sec-fetch-site": "same-origin",
+                "viewport-width": "1475",
+                "x-asbd-id": "198387",
+                "x-csrftoken": CSRF_TOKEN,
+                "x-ig-app-id": self.insta_app_id,
+                "x-ig-www-claim": WWW_CLAIM,
+                "x-instagram-ajax": "1007616494",
+                "x-requested-with": "XMLHttpRequest",
+                "Referer": REFERER,
+                "Referrer-Policy": "strict-origin-when-cross-origin"
+            }),
+            "document": HeaderTemplate({
+                "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif"
+                          ",image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
+                "accept-language": "en-US,en;q=0.9",
+                "cache-control": "max-age=0",
+                "sec-ch-prefers-color-scheme": "dark",
+                "sec-ch-ua": self.user_agent,
+                "sec-ch-ua-full-version-list": self.user_agent,
+                "sec-ch-ua-mobile": "?0",
+                "sec-ch-ua-platform": "\"Windows\"",
+                "sec-ch-ua-platform-version": "\"15.0.0\"",
+                "sec-fetch-dest": "document",
+                "sec-fetch-mode": "navigate",
+                "sec-fetch-site": "same-origin",
+                "sec-fetch-user": "?1",
+                "upgrade-insecure-requests": "1",
+                "viewport-width": "1475",
+                "referrerPolicy": "strict-origin-when-cross-origin"
+            }),
+            "form_data": HeaderTemplate({
+                "accept": "*/*",
+                "dpr": "1.30208",
+                "sec-ch-prefers-color-scheme": "dark",
+                "sec-ch-ua": self.user_agent,
+                "sec-ch-ua-full-version-list": self.user_agent,
+                "sec-ch-ua-mobile": "?0",
+                "sec-ch-ua-model": "\"\"",
+                "sec-ch-ua-platform": "\"Windows\"",
+                "sec-ch-ua-platform-version": "\"15.0.0\"",
+                "viewport-width": "1475",
+                "x-asbd-id": "129477",
+                "x-csrftoken": CSRF_TOKEN,
+                "x-ig-app-id": self.insta_app_id,
+                "x-ig-www-claim": WWW_CLAIM,
+                "x-requested-with": "XMLHttpRequest",
+                "Referer": "https://www.instagram.com/accounts/edit/",
+                "Referrer-Policy": "strict-origin-when-cross-origin"
+            }),
+            "edit_profile": HeaderTemplate({
+                "accept": "*/*",
+                "content-type": "application/x-www-form-urlencoded",
+                "dpr": "1.30208",
+                "sec-ch-prefers-color-scheme": "dark",
+                "sec-ch-ua": self.user_agent,
+                "sec-ch-ua-full-version-list": self.user_agent,
+                "sec-ch-ua-mobile": "?0",
+                "sec-ch-ua-model": "\"\"",
+                "sec-ch-ua-platform": "\"Windows\"",
+                "sec-ch-ua-platform-version": "\"15.0.0\"",
+                "viewport-width": "1475",
+                "x-asbd-id": "129477",
+                "x-csrftoken": CSRF_TOKEN,
+                "x-ig-app-id": self.insta_app_id,
+                "x-ig-www-claim": WWW_CLAIM,
+                "x-instagram-ajax": "1009841815",
+                "x-requested-with": "XMLHttpRequest",
+                "Referer": "https://www.instagram.com/accounts/edit/",
+                "Referrer-Policy": "strict-origin-when-cross-origin"
+            }),
+            "configure": HeaderTemplate({
+                "accept": "*/*",
+                "accept-language": "en-US,en;q=0.9",
+                "content-type": "application/x-www-form-urlencoded",
+                "dpr": "1.30208",
+                "sec-ch-prefers-color-scheme": "dark",
+                "sec-ch-ua": self.user_agent,
+                "sec-ch-ua-full-version-list": self.user_agent,
+                "sec-ch-ua-mobile": "?0",
+                "sec-ch-ua-model": "\"\"",
+                "sec-ch-ua-platform": "\"Windows\"",
+                "sec-ch-ua-platform-version": "\"15.0.0\"",
+                "sec-fetch-dest": "empty",
+                "sec-fetch-mode": "cors",
+                "sec-fetch-site": "same-origin",
+                "viewport-width": "1475",
+                "x-asbd-id": "129477",
+                "x-csrftoken": CSRF_TOKEN,
+                "x-ig-app-id": self.insta_app_id,
+                "x-ig-www-claim": WWW_CLAIM,
+                "x-instagram-ajax": "1009848613",
+                "x-requested-with": "XMLHttpRequest",
+                "Referer": "https://www.instagram.com/",
+                "Referrer-Policy": "strict-origin-when-cross-origin"
+            }),
+            "media": HeaderTemplate({
+                "accept": "*/*",
+                "accept-language": "en-US,en;q=0.9",
+                "sec-ch-prefers-color-scheme": self.preferred_color_scheme,
+                "sec-ch-ua": "\"Not.A/Brand\";v=\"8\", \"Chromium\";v=\"114\", \"Google Chrome\";v=\"114\"",
+                "sec-ch-ua-full-version-list": "\"Not.A/Brand\";v=\"8.0.0.0\", \"Chromium\";v=\"114.0.5735.134\", "
+                                               "\"Google Chrome\";v=\"114.0.5735.134\"",
+                "sec-ch-ua-mobile": "?0",
+                "sec-ch-ua-platform": "\"Windows\"",
+                "sec-ch-ua-platform-version": "\"15.0.0\"",
+                "sec-fetch-dest": "empty",
+                "sec-fetch-mode": "cors",
+                "sec-fetch-site": "same-origin",
+                "viewport-width": "1475",
+                "x-asbd-id": "129477",
+                "x-csrftoken": CSRF_TOKEN,
+                "x-ig-app-id": self.insta_app_id,
+                "x-ig-www-claim": WWW_CLAIM,
+                "x-requested-with": "XMLHttpRequest",
+                "Referer": f"https://www.instagram.com/",
+                "Referrer-Policy": "strict-origin-when-cross-origin"
+            }),
+            "like": HeaderTemplate({
+                "accept": "*/*",
+                "accept-language": "en-US,en;q=0.9",
+                "content-type": "application/x-www-form-urlencoded",
+                "sec-ch-prefers-color-scheme": self.preferred_color_scheme,
+                "sec-ch-ua": "\"Not.A/Brand\";v=\"8\", \"Chromium\";v=\"114\", \"Google Chrome\";v=\"114\"",
+                "sec-ch-ua-full-version-list": "\"Not.A/Brand\";v=\"8.0.0.0\", \"Chromium\";v=\"114.0.5735.110\", "
+                                               "\"Google Chrome\";v=\"114.0.5735.110\"",
+                "sec-ch-ua-mobile": "?0",
+                "sec-ch-ua-platform": "\"Windows\"",
+                "sec-ch-ua-platform-version": "\"15.0.0\"",
+                "sec-fetch-dest": "empty",
+                "sec-fetch-mode": "cors",
+                "sec-fetch-site": "same-origin",
+                "viewport-width": "1475",
+                "x-asbd-id": "129477",
+                "x-csrftoken": CSRF_TOKEN,
+                "x-ig-app-id": self.insta_app_id,
+                "x-ig-www-claim": WWW_CLAIM,
+                "x-instagram-ajax": "1007670408",
+                "x-requested-with": "XMLHttpRequest",
+                "Referer": f"https://www.instagram.com/",
+                "Referrer-Policy": "strict-origin-when-cross-origin"
+            })
+        }
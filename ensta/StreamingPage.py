@@ -0,0 +1,135 @@
+import re
+import codecs
+from json import JSONDecoder, JSONDecodeError
+from collections.abc import Callable, Generator, Iterator
+from requests import Response
+
+# Bytes read from the socket at once while streaming a page
+STREAM_CHUNK_SIZE: int = 8192
+
+_SEPARATORS = re.compile(r"[\s,:]*")
+_DELIMITERS = frozenset(" \t\r\n,:]}")
+_DECODER = JSONDecoder()
+
+
+class StreamingPage:
+    """
+    Parses a page (a JSON Object) while it's being downloaded.
+
+    - Iterating over it yields each element of the 'array_key' array as soon as that element is complete.
+    - Every other top-level value (next_max_id, status, ...) lands in 'fields' as soon as it appears.
+    - Values are decoded by the standard library's C scanner, which also tells where each one ends,
+      so the body is only scanned once no matter how it's chunked.
+    """
+
+    array_key: str
+    fields: dict[str, any]
+    found: bool
+    on_field: Callable[[str, any], None] | None
+
+    def __init__(
+        self,
+        source: Response | Iterator[bytes],
+        array_key: str,
+        on_field: Callable[[str, any], None] | None = None
+    ) -> None:
+
+        """
+        :param source: Response requested with stream=True, or an iterator over the body's chunks
+        :param array_key: Key of the array whose elements should be yielded. e.g. - "users"
+        :param on_field: (Optional) Function called with (key, value) for each other top-level value, as soon as it's parsed
+        """
+
+        if isinstance(source, Response): source = source.iter_content(STREAM_CHUNK_SIZE)
+
+        self.array_key = array_key
+        self.fields = {}
+        self.found = False
+        self.on_field = on_field
+
+        self._chunks = iter(source)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._text = ""
+        self._position = 0
+        self._exhausted = False
+
+    def __iter__(self) -> Generator[any, None, None]:
+        if self._peek() != "{": self._error("Page isn't a JSON Object")
+        self._position += 1
+
+        while True:
+            if self._peek() == "}": return None
+
+            key: str = self._take_value()
+
+            if key == self.array_key and self._peek() == "[":
+                self.found = True
+                self._position += 1
+
+                while self._peek() != "]":
+                    yield self._take_value()
+
+                    # Parsed elements aren't needed anymore
+                    self._text = self._text[self._position:]
+                    self._position = 0
+
+                self._position += 1
+                continue
+
+            value: any = self._take_value()
+
+            self.fields[key] = value
+            if self.on_field is not None: self.on_field(key, value)
+
+    def _fill(self) -> bool:
+        """
+        Appends the next chunk of the body to the buffer.
+        :return: Boolean (False once the body is over)
+        """
+
+        for chunk in self._chunks:
+            text: str = self._utf8.decode(chunk)
+            if not text: continue
+
+            self._text += text
+            return True
+
+        self._exhausted = True
+        return False
+
+    def _error(self, message: str) -> None:
+        raise JSONDecodeError(message, self._text[-64:], self._position)
+
+    def _peek(self) -> str:
+        """
+        Skips whitespace and separators.
+        :return: Next character
+        """
+
+        while True:
+            self._position = _SEPARATORS.match(self._text, self._position).end()
+            if self._position < len(self._text): return self._text[self._position]
+
+            if not self._fill(): self._error("Page ended unexpectedly")
+
+    def _take_value(self) -> any:
+        """
+        Decodes (downloading more if needed) the JSON value starting at the current position.
+        :return: Decoded value
+        """
+
+        self._peek()
+
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._text, self._position)
+
+                # A number could continue in the next chunk ("2." of "2.5"): It's complete once a delimiter follows it
+                if self._exhausted or (end < len(self._text) and self._text[end] in _DELIMITERS):
+                    self._position = end
+                    return value
+
+            except JSONDecodeError:
+                if self._exhausted: raise
+
+            self._fill()
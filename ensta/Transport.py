@@ -0,0 +1,224 @@
+import time
+from requests import Session, PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, Timeout
+from .RateLimiter import RateLimiter
+from .RetryPolicy import RetryPolicy, OK, RETRYABLE, RATE_LIMITED, FATAL
+from .ProxyPool import ProxyPool, ProxyHealth
+from .ResponseCache import ResponseCache
+
+
+class TransportAdapter(HTTPAdapter):
+    """
+    HTTPAdapter which passes every request through its Transport (rate limiter, proxy pool, retry policy).
+    """
+
+    transport: "Transport"
+
+    def __init__(self, transport: "Transport", **kwargs) -> None:
+        self.transport = transport
+        super().__init__(**kwargs)
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        rate_limiter: RateLimiter | None = self.transport.rate_limiter
+        retry_policy: RetryPolicy | None = self.transport.retry_policy
+        proxy_pool: ProxyPool | None = self.transport.proxy_pool
+        response_cache: ResponseCache | None = self.transport.response_cache
+        attempts: dict[str, int] = {}
+
+        # Cache hits don't count against rate limits
+        if response_cache is not None:
+            cached: Response | None = response_cache.lookup(request)
+            if cached is not None: return cached
+
+        while True:
+            if rate_limiter is not None: rate_limiter.acquire(request.url)
+
+            # Each attempt may go through a different proxy
+            proxy: ProxyHealth | None = None
+
+            if proxy_pool is not None:
+                proxy = proxy_pool.choose()
+                kwargs["proxies"] = {"http": proxy.url, "https": proxy.url}
+
+            started: float = time.monotonic()
+
+            try:
+                response: Response = super().send(request, **kwargs)
+                verdict: str = OK if retry_policy is None else retry_policy.classify(
+                    request, response, kwargs.get("stream", False)
+                )
+
+                if proxy is not None:
+                    proxy_pool.report(proxy, time.monotonic() - started, flagged=verdict == RATE_LIMITED)
+
+            except (ConnectionError, Timeout):
+                if proxy is not None: proxy_pool.report(proxy, time.monotonic() - started, failed=True)
+
+                if retry_policy is None or not retry_policy.should_retry(
+                    request.method, RETRYABLE, attempts.get(RETRYABLE, 0)
+                ):
+                    if retry_policy is not None: retry_policy.record(request.url, retried=False)
+                    raise
+
+                verdict, response = RETRYABLE, None
+
+            if verdict == OK and response_cache is not None and not kwargs.get("stream", False):
+                response_cache.store(request, response)
+
+            if verdict == OK or verdict == FATAL: return response
+
+            # Retries are counted separately for each kind of failure
+            attempt: int = attempts.get(verdict, 0)
+
+            if not retry_policy.should_retry(request.method, verdict, attempt):
+                retry_policy.record(request.url, retried=False)
+                return response
+
+            retry_policy.record(request.url, retried=True)
+            delay: float = retry_policy.delay(verdict, attempt, response)
+
+            if response is not None: response.close()
+            time.sleep(delay)
+            attempts[verdict] = attempt + 1
+
+
+class Transport:
+    """
+    Connection pools shared by every client of one account.
+
+    - SessionHost, its embedded Guest, Mobile and Direct can all be given the same Transport.
+    - Each of them still gets its own cookie jar (requests.Session), but they share sockets and TLS sessions.
+    - Pool sizes can be tuned per host, e.g. Transport({"www.instagram.com": 50, "rupload": 4})
+    - With a RateLimiter (opt-in), every request goes through it, so all clients of an account share its buckets.
+    - Failed requests are retried as decided by the Transport's RetryPolicy.
+    - With a ProxyPool, every request (and every retry) is sent through the best scored proxy.
+    - With a ResponseCache, profile, feed & private info responses are served from it while they're fresh.
+    """
+
+    # Pool Name -> URL prefixes served by that pool
+    POOL_PREFIXES: dict[str, tuple[str, ...]] = {
+        "www.instagram.com": ("https://www.instagram.com/",),
+        "i.instagram.com": ("https://i.instagram.com/",),
+        "rupload": (
+            "https://i.instagram.com/rupload_igphoto/",
+            "https://i.instagram.com/rupload_igvideo/",
+            "https://rupload.facebook.com/"
+        )
+    }
+
+    DEFAULT_POOL_SIZES: dict[str, int] = {
+        "www.instagram.com": 10,
+        "i.instagram.com": 10,
+        "rupload": 2
+    }
+
+    pool_sizes: dict[str, int]
+    rate_limiter: RateLimiter | None
+    retry_policy: RetryPolicy | None
+    proxy_pool: ProxyPool | None
+    response_cache: ResponseCache | None
+    adapters: dict[str, HTTPAdapter]
+    default_adapter: HTTPAdapter
+
+    def __init__(
+        self,
+        pool_sizes: dict[str, int] | None = None,
+        default_pool_size: int = 10,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        proxy_pool: ProxyPool | None = None,
+        response_cache: ResponseCache | None = None
+    ) -> None:
+
+        """
+        :param pool_sizes: (Optional) Max number of kept-alive connections per pool: www.instagram.com, i.instagram.com, rupload
+        :param default_pool_size: (Optional) Max number of kept-alive connections for any other host
+        :param rate_limiter: (Optional) Rate limits, e.g. - RateLimiter() for the default buckets. None: No limiting
+        :param retry_policy: (Optional) Custom retry policy. Use RetryPolicy.disabled() to turn retrying off
+        :param proxy_pool: (Optional) Proxies to rotate requests across
+        :param response_cache: (Optional) Cache for profile, feed & private info responses
+        """
+
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.proxy_pool = proxy_pool
+        self.response_cache = response_cache
+        self.pool_sizes = {**self.DEFAULT_POOL_SIZES, **(pool_sizes or {})}
+
+        for name in self.pool_sizes:
+            if name not in self.POOL_PREFIXES: raise ValueError(
+                f"Unknown pool \"{name}\". Available pools: {', '.join(self.POOL_PREFIXES)}"
+            )
+
+        self.adapters = {
+            name: self._new_adapter(len(self.POOL_PREFIXES[name]), size)
+            for name, size in self.pool_sizes.items()
+        }
+
+        self.default_adapter = self._new_adapter(10, default_pool_size)
+
+    @classmethod
+    def uniform(
+        cls,
+        pool_size: int,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None
+    ) -> "Transport":
+
+        """
+        Creates a Transport which keeps the same number of connections for every host.
+        :param pool_size: Max number of kept-alive connections per host
+        :param rate_limiter: (Optional) Custom rate limits
+        :param retry_policy: (Optional) Custom retry policy
+        :return: Transport
+        """
+
+        return cls({name: pool_size for name in cls.POOL_PREFIXES}, pool_size, rate_limiter, retry_policy)
+
+    def _new_adapter(self, pool_connections: int, pool_maxsize: int) -> HTTPAdapter:
+        return TransportAdapter(self, pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+
+    def mount(self, session: Session) -> Session:
+        """
+        Makes the given session send its requests through this transport's pools.
+        :param session: Session to mount the pools on
+        :return: Same session
+        """
+
+        session.mount("https://", self.default_adapter)
+        session.mount("http://", self.default_adapter)
+
+        for name, adapter in self.adapters.items():
+            for prefix in self.POOL_PREFIXES[name]:
+                session.mount(prefix, adapter)
+
+        return session
+
+    def apply_proxy(self, session: Session, proxy: dict[str, str] | ProxyPool | None) -> None:
+        """
+        Applies a client's 'proxy' argument: A static proxy goes on the session, a ProxyPool on this transport.
+        :param session: Client's session
+        :param proxy: JSON Object of proxy, ProxyPool or None
+        :return: None
+        """
+
+        if isinstance(proxy, ProxyPool): self.proxy_pool = proxy
+        elif proxy is not None: session.proxies.update(proxy)
+
+    def session(self) -> Session:
+        """
+        Creates a new session (own cookie jar & headers) which shares this transport's pools.
+        :return: Session
+        """
+
+        return self.mount(Session())
+
+    def close(self) -> None:
+        """
+        Closes every pooled connection.
+        :return: None
+        """
+
+        self.default_adapter.close()
+        for adapter in self.adapters.values(): adapter.close()
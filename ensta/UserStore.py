@@ -0,0 +1,362 @@
+import json
+from array import array
+from collections.abc import Callable, Iterable, Generator
+from .containers.FollowPerson import FollowPerson
+from .containers.Liker import Liker
+
+try: import pyarrow
+except ImportError: pyarrow = None
+
+
+class Bitset:
+    """
+    Growable array of booleans, 8 per byte (least significant bit first, like Arrow's bitmaps).
+    """
+
+    data: bytearray
+    length: int
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+        self.length = 0
+
+    def append(self, value: bool) -> None:
+        bit: int = self.length & 7
+
+        if bit == 0: self.data.append(1 if value else 0)
+        elif value: self.data[-1] |= 1 << bit
+
+        self.length += 1
+
+    def __getitem__(self, index: int) -> bool:
+        return bool(self.data[index >> 3] >> (index & 7) & 1)
+
+
+class BoolColumn:
+
+    values: Bitset
+    valid: Bitset
+
+    def __init__(self) -> None:
+        self.values = Bitset()
+        self.valid = Bitset()
+
+    def append(self, value: bool | None) -> None:
+        self.valid.append(value is not None)
+        self.values.append(bool(value))
+
+    def get(self, index: int) -> bool | None:
+        return self.values[index] if self.valid[index] else None
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.values.data) + len(self.valid.data)
+
+    def to_arrow(self) -> "pyarrow.Array":
+        return pyarrow.Array.from_buffers(
+            pyarrow.bool_(),
+            self.valid.length,
+            [pyarrow.py_buffer(self.valid.data), pyarrow.py_buffer(self.values.data)]
+        )
+
+
+class IntColumn:
+
+    values: array
+    valid: Bitset
+    view: Callable[[int], any]
+
+    # Arrow type of each array typecode
+    ARROW_TYPES: dict[str, str] = {"b": "int8", "q": "int64"}
+
+    def __init__(self, typecode: str = "q", view: Callable[[int], any] = int) -> None:
+        """
+        :param typecode: Typecode of the values' array. e.g. - "q" (int64)
+        :param view: Function turning a stored value into the one a row shows. e.g. - str for UserIDs
+        """
+
+        self.values = array(typecode)
+        self.valid = Bitset()
+        self.view = view
+
+    def append(self, value: int | str | None) -> None:
+        # Missing values arrive as None or "", depending on the endpoint
+        missing: bool = value is None or value == ""
+
+        self.valid.append(not missing)
+        self.values.append(0 if missing else int(value))
+
+    def get(self, index: int) -> any:
+        return self.view(self.values[index]) if self.valid[index] else None
+
+    @property
+    def nbytes(self) -> int:
+        return self.values.itemsize * len(self.values) + len(self.valid.data)
+
+    def to_arrow(self) -> "pyarrow.Array":
+        return pyarrow.Array.from_buffers(
+            getattr(pyarrow, self.ARROW_TYPES[self.values.typecode])(),
+            len(self.values),
+            [pyarrow.py_buffer(self.valid.data), pyarrow.py_buffer(self.values)]
+        )
+
+
+class StringColumn:
+    """
+    Strings stored back to back as UTF-8, with each one's end offset. No per-string object overhead.
+    """
+
+    data: bytearray
+    offsets: array
+    valid: Bitset
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+        self.offsets = array("q", [0])
+        self.valid = Bitset()
+
+    def append(self, value: str | None) -> None:
+        self.valid.append(value is not None)
+        if value is not None: self.data += value.encode("utf-8")
+
+        self.offsets.append(len(self.data))
+
+    def get(self, index: int) -> str | None:
+        if not self.valid[index]: return None
+        return self.data[self.offsets[index]:self.offsets[index + 1]].decode("utf-8")
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.data) + self.offsets.itemsize * len(self.offsets) + len(self.valid.data)
+
+    def to_arrow(self) -> "pyarrow.Array":
+        return pyarrow.Array.from_buffers(
+            pyarrow.large_string(),
+            len(self.offsets) - 1,
+            [pyarrow.py_buffer(self.valid.data), pyarrow.py_buffer(self.offsets), pyarrow.py_buffer(self.data)]
+        )
+
+
+class CategoryColumn:
+    """
+    Dictionary-encoded values: Each distinct value is kept once, and every row stores its index.
+    Rows with equal values share the same object, so it mustn't be modified.
+    """
+
+    codes: array
+    values: list
+    index: dict[str, int]
+
+    def __init__(self) -> None:
+        self.codes = array("I")
+        self.values = []
+        self.index = {}
+
+    def append(self, value: any) -> None:
+        key: str = value if isinstance(value, str) else json.dumps(value, sort_keys=True, separators=(",", ":"))
+        code: int | None = self.index.get(key)
+
+        if code is None:
+            code = self.index[key] = len(self.values)
+            self.values.append(value)
+
+        self.codes.append(code)
+
+    def get(self, index: int) -> any:
+        return self.values[self.codes[index]]
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.itemsize * len(self.codes) + sum(len(key) for key in self.index)
+
+    def to_arrow(self) -> "pyarrow.Array":
+        codes = pyarrow.Array.from_buffers(pyarrow.uint32(), len(self.codes), [None, pyarrow.py_buffer(self.codes)])
+
+        # Real values (e.g. - lists of badges, nulls), not their JSON keys. Each distinct one is converted once,
+        # then gathered per row: Parquet can't write dictionaries of lists
+        return pyarrow.array(self.values).take(codes)
+
+
+class UserStore:
+    """
+    Columnar container for millions of users (followers, followings, likers).
+
+    - UserIDs are int64s, booleans are bit-packed, strings are packed UTF-8 and badges are stored once per distinct value,
+      so a user takes a few dozen bytes instead of the ~1 KB of a dataclass instance with its strings & lists.
+    - Indexing (or iterating) returns the familiar row object, built on access.
+    - Fill it with extend(host.followers(...)), or pass it to the paginator (host.followers(..., store=store)),
+      which calls append_json() on each user of the pages without building the row objects.
+    - to_arrow() / to_parquet() hand the columns to pyarrow (pip install pyarrow) without copying them.
+    """
+
+    ROW: type
+
+    # Field -> Column factory
+    COLUMNS: dict[str, Callable[[], BoolColumn | IntColumn | StringColumn | CategoryColumn]]
+
+    # Field -> Key of the same value in API responses
+    JSON_KEYS: dict[str, str]
+
+    columns: dict[str, BoolColumn | IntColumn | StringColumn | CategoryColumn]
+    length: int
+
+    def __init__(self, rows: Iterable | None = None) -> None:
+        """
+        :param rows: (Optional) Rows to add right away. e.g. - host.followers("leomessi")
+        """
+
+        self.columns = {name: factory() for name, factory in self.COLUMNS.items()}
+        self.length = 0
+
+        if rows is not None: self.extend(rows)
+
+    def append(self, row: any) -> None:
+        """
+        Adds a row object (FollowPerson / Liker).
+        :param row: Row
+        :return: None
+        """
+
+        for name, column in self.columns.items(): column.append(getattr(row, name))
+        self.length += 1
+
+    def append_json(self, user: dict) -> None:
+        """
+        Adds a user straight from an API response, without building a row object.
+        :param user: User's JSON Object. e.g. - each item of response_json["users"]
+        :return: None
+        """
+
+        for name, column in self.columns.items(): column.append(user.get(self.JSON_KEYS[name]))
+        self.length += 1
+
+    def extend(self, rows: Iterable) -> None:
+        """
+        Adds many row objects. Paginators can be passed directly: Each row is dropped right after it's stored.
+        :param rows: Rows. None items (yielded by paginators right before they raise) are skipped
+        :return: None
+        """
+
+        for row in rows:
+            if row is not None: self.append(row)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: int | slice) -> any:
+        if isinstance(index, slice): return [self[each] for each in range(*index.indices(self.length))]
+
+        if index < 0: index += self.length
+        if not 0 <= index < self.length: raise IndexError("UserStore index out of range")
+
+        return self.ROW(**{name: column.get(index) for name, column in self.columns.items()})
+
+    def __iter__(self) -> Generator[any, None, None]:
+        for index in range(self.length): yield self[index]
+
+    def column(self, name: str) -> list:
+        """
+        Returns every value of one field.
+        :param name: Field. e.g. - "username"
+        :return: List of values
+        """
+
+        column = self.columns[name]
+        return [column.get(index) for index in range(self.length)]
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Bytes taken by the columns' buffers.
+        """
+
+        return sum(column.nbytes for column in self.columns.values())
+
+    def to_arrow(self) -> "pyarrow.Table":
+        """
+        Returns the store as an Arrow table. Requires pyarrow.
+        Buffers are shared, not copied: Appending raises BufferError while the table is alive.
+        :return: pyarrow.Table
+        """
+
+        if pyarrow is None: raise ImportError("pyarrow isn't installed. Install it using: pip install pyarrow")
+
+        return pyarrow.table({name: column.to_arrow() for name, column in self.columns.items()})
+
+    def to_parquet(self, path: str, **kwargs) -> None:
+        """
+        Writes the store to a Parquet file. Requires pyarrow.
+        :param path: Parquet file
+        :param kwargs: (Optional) Passed to pyarrow.parquet.write_table(). e.g. - compression="zstd"
+        :return: None
+        """
+
+        table: "pyarrow.Table" = self.to_arrow()
+
+        import pyarrow.parquet
+        pyarrow.parquet.write_table(table, path, **kwargs)
+
+
+class FollowPersonStore(UserStore):
+    """
+    UserStore of FollowPerson rows: Followers & followings.
+    """
+
+    ROW = FollowPerson
+
+    COLUMNS = {
+        "has_anonymous_profile_picture": BoolColumn,
+        "user_id": lambda: IntColumn("q", str),
+        "username": StringColumn,
+        "full_name": StringColumn,
+        "is_private": BoolColumn,
+        "is_verified": BoolColumn,
+        "profile_picture_url": StringColumn,
+        "badges": CategoryColumn,
+        # The API's raw value, kept as is
+        "third_party_downloads_enabled": lambda: IntColumn("b")
+    }
+
+    JSON_KEYS = {
+        "has_anonymous_profile_picture": "has_anonymous_profile_picture",
+        "user_id": "pk",
+        "username": "username",
+        "full_name": "full_name",
+        "is_private": "is_private",
+        "is_verified": "is_verified",
+        "profile_picture_url": "profile_pic_url",
+        "badges": "account_badges",
+        "third_party_downloads_enabled": "third_party_downloads_enabled"
+    }
+
+
+class LikerStore(UserStore):
+    """
+    UserStore of Liker rows.
+    """
+
+    ROW = Liker
+
+    COLUMNS = {
+        "user_id": lambda: IntColumn("q", str),
+        "username": StringColumn,
+        "full_name": StringColumn,
+        "is_private": BoolColumn,
+        "badges": CategoryColumn,
+        "is_verified": BoolColumn,
+        "profile_picture_id": StringColumn,
+        "profile_picture_url": StringColumn,
+        "latest_reel_media": IntColumn
+    }
+
+    JSON_KEYS = {
+        "user_id": "pk",
+        "username": "username",
+        "full_name": "full_name",
+        "is_private": "is_private",
+        "badges": "account_badges",
+        "is_verified": "is_verified",
+        "profile_picture_id": "profile_pic_id",
+        "profile_picture_url": "profile_pic_url",
+        "latest_reel_media": "latest_reel_media"
+    }
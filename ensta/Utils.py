@@ -1,10 +1,118 @@
+import re
 import time
+import base64
+from collections.abc import Iterable
+from .lib.Exceptions import ConversionError
 
 
 def time_id() -> str:
     return str(int(time.time() * 1000))
 
 
-def fb_uploader(id: str | None) -> str:
+def fb_uploader(id: str | None = None) -> str:
     id = id if id else time_id()
     return f'fb_uploader_{id}'
+
+
+# Endpoint Family -> URL fragments which identify it
+ENDPOINT_FAMILIES: dict[str, tuple[str, ...]] = {
+    "rupload": ("/rupload_igphoto/", "/rupload_igvideo/", "rupload.facebook.com/"),
+    "friendships": ("/friendships/",),
+    "web_profile_info": ("/users/web_profile_info/", "info_stream/", "/info/"),
+    "feed": ("/feed/",),
+    "direct_v2": ("/direct_v2/",)
+}
+
+
+def endpoint_family(url: str) -> str:
+    """
+    Returns which family of Instagram's endpoints the given url belongs to.
+    :param url: Request URL
+    :return: Family name (see ENDPOINT_FAMILIES) or 'default'
+    """
+
+    for family, fragments in ENDPOINT_FAMILIES.items():
+        for fragment in fragments:
+            if fragment in url: return family
+
+    return "default"
+
+
+# Shortcodes are media ids written in base64 (url-safe alphabet), without leading zeros ('A')
+SHORTCODE_LENGTH: int = 11
+_SHORTCODE = re.compile(r"[A-Za-z0-9_-]{1,11}")
+_SHARE_URL = re.compile(r"instagram\.com/(?:[\w.]+/)?(?:p|reels?|tv)/([A-Za-z0-9_-]+)")
+
+
+def shortcode_from_url(share_url: str) -> str | None:
+    """
+    Extracts the shortcode from a post's share url.
+    :param share_url: e.g. - https://www.instagram.com/p/Czr2yLmroCQ/
+    :return: Shortcode (e.g. - Czr2yLmroCQ) or None
+    """
+
+    match = _SHARE_URL.search(share_url)
+    return match.group(1) if match is not None else None
+
+
+def shortcode_to_media_id(shortcode: str) -> str:
+    """
+    Converts a post's shortcode into its media id (post_id), without any request.
+    :param shortcode: e.g. - Czr2yLmroCQ
+    :return: Media ID in text format
+    """
+
+    return shortcodes_to_media_ids((shortcode,))[0]
+
+
+def media_id_to_shortcode(media_id: str | int) -> str:
+    """
+    Converts a media id (post_id) into the post's shortcode, without any request.
+    :param media_id: e.g. - 3236921700141400208 (Czr2yLmroCQ), or 3236921700141400208_5173052 (media_id_userid)
+    :return: Shortcode
+    """
+
+    return media_ids_to_shortcodes((media_id,))[0]
+
+
+def shortcodes_to_media_ids(shortcodes: Iterable[str]) -> list[str]:
+    """
+    Converts many shortcodes at once: They're decoded together as one base64 string.
+    :param shortcodes: Shortcodes
+    :return: Media IDs, in the same order
+    """
+
+    shortcodes: list[str] = list(shortcodes)
+
+    for shortcode in shortcodes:
+        if _SHORTCODE.fullmatch(shortcode) is None: raise ConversionError(
+            f"Can't convert \"{shortcode}\" into a media id. Shortcodes are 1 to {SHORTCODE_LENGTH} "
+            "characters long, made of letters, digits, '-' and '_'."
+        )
+
+    # 12 base64 characters -> 9 bytes per media id
+    decoded: bytes = base64.urlsafe_b64decode("".join(shortcode.rjust(12, "A") for shortcode in shortcodes))
+
+    return [str(int.from_bytes(decoded[index:index + 9], "big")) for index in range(0, len(decoded), 9)]
+
+
+def media_ids_to_shortcodes(media_ids: Iterable[str | int]) -> list[str]:
+    """
+    Converts many media ids at once: They're encoded together as one base64 string.
+    :param media_ids: Media IDs (media_id or media_id_userid)
+    :return: Shortcodes, in the same order
+    """
+
+    packed: bytearray = bytearray()
+
+    for media_id in media_ids:
+        try:
+            number: int = int(str(media_id).split("_", 1)[0])
+            packed += number.to_bytes(9, "big")
+
+        except (ValueError, OverflowError):
+            raise ConversionError(f"Can't convert \"{media_id}\" into a shortcode. It isn't a valid media id.")
+
+    encoded: str = base64.urlsafe_b64encode(packed).decode()
+
+    return [encoded[index:index + 12].lstrip("A") or "A" for index in range(0, len(encoded), 12)]
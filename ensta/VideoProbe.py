@@ -0,0 +1,151 @@
+import os
+import struct
+from collections.abc import Generator
+from typing import BinaryIO
+from .containers.VideoInfo import VideoInfo
+from .lib.Exceptions import FileTypeError
+
+# 'mvhd', 'tkhd' & 'hdlr' are ~100 bytes. Anything past this is never needed
+_MAX_PAYLOAD: int = 256
+
+# 'mvhd' duration meaning "unknown" (e.g. - Fragmented files)
+_UNKNOWN_DURATIONS: set[int] = {0, 0xFFFFFFFF, 0xFFFFFFFFFFFFFFFF}
+
+
+def probe_mp4(path: str | os.PathLike) -> VideoInfo:
+    """
+    Reads an MP4 / MOV file's duration & size from its 'moov' box, without decoding anything.
+    Only box headers and a few hundred bytes of metadata are read: 'mdat' (the media itself) is seeked past.
+    :param path: Video file
+    :return: VideoInfo
+    :raises ValueError: If it isn't an MP4 / MOV file, or lacks what's needed (e.g. - Fragmented files)
+    """
+
+    with open(path, "rb") as file:
+        end: int = os.fstat(file.fileno()).st_size
+
+        for box_type, start, box_end in _boxes(file, 0, end):
+            if box_type == b"moov": return _parse_moov(file, start, box_end)
+
+    raise ValueError("No 'moov' box: Not an MP4 / MOV file.")
+
+
+def probe_video(path: str | os.PathLike) -> VideoInfo:
+    """
+    Reads a video's duration & size. MP4 / MOV files are parsed directly, anything else goes through moviepy.
+    moviepy (and its ffmpeg stack) is only imported for those other files.
+    :param path: Video file
+    :return: VideoInfo
+    """
+
+    try: return probe_mp4(path)
+    except ValueError as error: parse_error: ValueError = error
+
+    try: import moviepy.editor
+    except ImportError: raise FileTypeError(
+        f"Couldn't read the video's metadata ({parse_error}). "
+        "For formats other than MP4 / MOV, install moviepy using: pip install moviepy"
+    )
+
+    clip = moviepy.editor.VideoFileClip(str(path))
+
+    try: return VideoInfo(duration=clip.duration, width=clip.size[0], height=clip.size[1])
+    finally: clip.close()
+
+
+def _boxes(file: BinaryIO, start: int, end: int) -> Generator[tuple[bytes, int, int], None, None]:
+    """
+    Yields (type, payload start, box end) of each box between 'start' & 'end'.
+    """
+
+    position: int = start
+
+    while position + 8 <= end:
+        file.seek(position)
+        size, box_type = struct.unpack(">I4s", file.read(8))
+        header_size: int = 8
+
+        if size == 1:
+            large_size: bytes = file.read(8)
+            if len(large_size) < 8: raise ValueError("Truncated box header.")
+
+            size, header_size = struct.unpack(">Q", large_size)[0], 16
+
+        # Runs until the end of its parent (or of the file)
+        elif size == 0: size = end - position
+
+        if size < header_size or position + size > end: raise ValueError(
+            f"Malformed '{box_type.decode('latin-1')}' box."
+        )
+
+        yield box_type, position + header_size, position + size
+        position += size
+
+
+def _payload(file: BinaryIO, start: int, end: int) -> bytes:
+    file.seek(start)
+    return file.read(min(end - start, _MAX_PAYLOAD))
+
+
+def _parse_moov(file: BinaryIO, start: int, end: int) -> VideoInfo:
+    duration: float | None = None
+    size: tuple[int, int] | None = None
+
+    for box_type, box_start, box_end in _boxes(file, start, end):
+        if box_type == b"mvhd": duration = _parse_mvhd(_payload(file, box_start, box_end))
+
+        elif box_type == b"trak":
+            handler, track_size = _parse_trak(file, box_start, box_end)
+
+            # Prefer the video track. Older files may lack 'hdlr': Then, the first track having a size
+            if handler == b"vide" or (size is None and handler is None and track_size != (0, 0)):
+                size = track_size
+
+    if duration is None: raise ValueError("No duration in 'mvhd' box.")
+    if size is None or size == (0, 0): raise ValueError("No video track.")
+
+    return VideoInfo(duration=duration, width=size[0], height=size[1])
+
+
+def _parse_mvhd(payload: bytes) -> float:
+    try:
+        # Version 1 stores times in 64 bits
+        if payload[0] == 1: timescale, duration = struct.unpack_from(">IQ", payload, 20)
+        else: timescale, duration = struct.unpack_from(">II", payload, 12)
+
+    except (IndexError, struct.error): raise ValueError("Truncated 'mvhd' box.")
+
+    if timescale == 0 or duration in _UNKNOWN_DURATIONS: raise ValueError("Unknown duration in 'mvhd' box.")
+    return duration / timescale
+
+
+def _parse_trak(file: BinaryIO, start: int, end: int) -> tuple[bytes | None, tuple[int, int]]:
+    """
+    Returns the track's handler type (b"vide", b"soun", ...) & its size.
+    """
+
+    handler: bytes | None = None
+    size: tuple[int, int] = (0, 0)
+
+    for box_type, box_start, box_end in _boxes(file, start, end):
+        if box_type == b"tkhd": size = _parse_tkhd(_payload(file, box_start, box_end))
+
+        elif box_type == b"mdia":
+            for nested_type, nested_start, nested_end in _boxes(file, box_start, box_end):
+                if nested_type != b"hdlr": continue
+
+                payload: bytes = _payload(file, nested_start, nested_end)
+                if len(payload) >= 12: handler = payload[8:12]
+
+    return handler, size
+
+
+def _parse_tkhd(payload: bytes) -> tuple[int, int]:
+    # Version, flags & times (64 bits in version 1), then 16 bytes of layer / volume & the 36 byte matrix
+    offset: int = (36 if payload[:1] == b"\x01" else 24) + 52
+
+    try: width, height = struct.unpack_from(">II", payload, offset)
+    except struct.error: raise ValueError("Truncated 'tkhd' box.")
+
+    # 16.16 fixed point
+    return round(width / 65536), round(height / 65536)
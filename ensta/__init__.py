@@ -1,10 +1,32 @@
 from ensta.Guest import Guest
 from ensta.SessionHost import SessionHost
 from ensta.Host import Host
+from ensta.AsyncGuest import AsyncGuest
+from ensta.AsyncSessionHost import AsyncSessionHost
+from ensta.AsyncHost import AsyncHost
 from ensta.lib import Exceptions
 from ensta.PasswordEncryption import PasswordEncryption
 from ensta.Authentication import new_session_id
 from ensta.Direct import Direct
 from ensta.Mobile import Mobile
+from ensta.AccountPool import AccountPool
 from ensta.Credentials import Credentials
-from ensta.Utils import time_id, fb_uploader
+from ensta.Transport import Transport
+from ensta.RateLimiter import RateLimiter, TokenBucket
+from ensta.RetryPolicy import RetryPolicy
+from ensta.ProxyPool import ProxyPool
+from ensta.IdentifierCache import IdentifierCache
+from ensta.ResponseCache import ResponseCache
+from ensta.Checkpoint import Checkpoint
+from ensta.Exporter import Exporter, export
+from ensta.UserStore import FollowPersonStore, LikerStore
+from ensta.JsonBackend import use_json_backend
+from ensta.Utils import (
+    time_id,
+    fb_uploader,
+    shortcode_from_url,
+    shortcode_to_media_id,
+    media_id_to_shortcode,
+    shortcodes_to_media_ids,
+    media_ids_to_shortcodes
+)
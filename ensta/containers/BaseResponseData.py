@@ -1,33 +1,62 @@
+from json import JSONDecodeError
+from types import MemberDescriptorType
+from typing import Any, ClassVar, Optional
+from collections.abc import Callable
 from dataclasses import fields, is_dataclass
+from ..JsonBackend import loads
+
+try: import msgspec
+except ImportError: msgspec = None
+
+# How each field's value is built from the JSON one
+_RAW: str = "raw"  # As is
+_CONTAINER: str = "container"  # BaseResponseData subclass, decoded the same way
+_DATACLASS: str = "dataclass"  # Any other dataclass, from its keyword arguments
+
+# Container class -> Function building it from a JSON Object
+_decoders: dict[type, Callable[[dict], any]] = {}
+
+# Container class -> (msgspec struct its JSON is decoded into, Function building it from that struct)
+_structs: dict[type, tuple[type, Callable[[any], any]]] = {}
+
+# (Container class, Whole response?) -> msgspec decoder
+_typed_decoders: dict[tuple[type, bool], any] = {}
 
 
 class BaseResponseData:
+    """
+    Base of the containers built from Instagram's media JSON Objects (PhotoUpload, ReelUpload, ...).
+
+    - Each class gets a decoder generated the first time it's used: Field types are inspected once,
+      not on every decode.
+    - With msgspec installed (pip install msgspec), from_json() & from_response_content() decode the bytes
+      straight into typed structs, skipping the keys the container has no field for.
+      Set BaseResponseData.typed_decoding = False to always go through the JSON backend instead.
+    """
+
+    # Subclasses are slotted dataclasses: No instance __dict__ here either
+    __slots__ = ()
+
+    typed_decoding: ClassVar[bool] = msgspec is not None
 
     @classmethod
     def from_data(cls, data):
-        parsed_data = {}
-        
-        for field in fields(cls):
-            raw_value = data.get(field.name, None)
-            
-            if raw_value is None:
-                parsed_data[field.name] = None
-                
-            elif not isinstance(field.type, type):
-                parsed_data[field.name] = raw_value
-                
-            elif issubclass(field.type, BaseResponseData):
-                value = field.type.from_data(raw_value)
-                parsed_data[field.name] = value
-                
-            elif is_dataclass(field.type):
-                value = field.type(**raw_value)
-                parsed_data[field.name] = value
-                
-            else:
-                parsed_data[field.name] = raw_value
-
-        return cls(**parsed_data)
+        decoder: Callable[[dict], any] | None = _decoders.get(cls)
+        if decoder is None: decoder = _decoders[cls] = _compile_decoder(cls)
+
+        return decoder(data)
+
+    @classmethod
+    def from_json(cls, content: str | bytes):
+        if not cls._typed(): return cls.from_data(loads(content))
+
+        try: struct = _typed_decoder(cls, False).decode(content)
+
+        # e.g. - Not a JSON Object: Fails the same way as without msgspec
+        except msgspec.ValidationError: return cls.from_data(loads(content))
+        except msgspec.DecodeError as error: raise JSONDecodeError(str(error), "", 0) from error
+
+        return _structs[cls][1](struct)
 
     @classmethod
     def from_response_data(cls, response_data: dict):
@@ -36,11 +65,153 @@ class BaseResponseData:
                 "Key 'status' not 'ok' in response JSON. "
                 "Please check the images or videos you supplied."
             )
-            
+
         data = response_data.get("media")
-        
+
         if data is None: raise Exception(
             "Either Instagram's Internal Server Error or this library needs to be updated."
         )
 
         return cls.from_data(data)
+
+    @classmethod
+    def from_response_content(cls, content: str | bytes):
+        """
+        Same as from_response_data(), from the response's body.
+        :param content: Response body. e.g. - http_response.content
+        :return: Container
+        """
+
+        if not cls._typed(): return cls.from_response_data(loads(content))
+
+        try: response = _typed_decoder(cls, True).decode(content)
+        except msgspec.ValidationError: return cls.from_response_data(loads(content))
+        except msgspec.DecodeError as error: raise JSONDecodeError(str(error), "", 0) from error
+
+        if response.status != "ok":
+            raise Exception(
+                "Key 'status' not 'ok' in response JSON. "
+                "Please check the images or videos you supplied."
+            )
+
+        if response.media is None: raise Exception(
+            "Either Instagram's Internal Server Error or this library needs to be updated."
+        )
+
+        return _structs[cls][1](response.media)
+
+    @classmethod
+    def _typed(cls) -> bool:
+        return msgspec is not None and BaseResponseData.typed_decoding
+
+
+def _plan(cls: type) -> list[tuple[str, str, type]]:
+    plan: list[tuple[str, str, type]] = []
+
+    for field in fields(cls):
+        kind: str = _RAW
+
+        if isinstance(field.type, type):
+            if issubclass(field.type, BaseResponseData): kind = _CONTAINER
+            elif is_dataclass(field.type): kind = _DATACLASS
+
+        plan.append((field.name, kind, field.type))
+
+    return plan
+
+
+def _generate(
+    cls: type,
+    plan: list[tuple[str, str, type]],
+    prelude: str,
+    read: str,
+    containers: dict[type, Callable]
+) -> Callable:
+
+    """
+    Generates a function building a container. Missing & null values are None.
+    Slots are filled directly when the class allows it: A frozen dataclass' __init__ costs more than the reads.
+    :param prelude: Statement run before the fields are read. e.g. - "get = data.get"
+    :param read: Expression reading a field's value from 'data', formatted with its name. e.g. - "get({name!r})"
+    :param containers: Nested container class -> Function building it from its value
+    """
+
+    namespace: dict[str, any] = {"cls": cls, "new": object.__new__}
+    values: list[str] = []
+
+    for index, (name, kind, field_type) in enumerate(plan):
+        value: str = read.format(name=name)
+
+        if kind != _RAW:
+            namespace[f"build_{index}"] = containers[field_type] if kind == _CONTAINER else field_type
+            build: str = f"build_{index}(value_{index})" if kind == _CONTAINER else f"build_{index}(**value_{index})"
+            value = f"(None if (value_{index} := {value}) is None else {build})"
+
+        values.append(value)
+
+    slotted: bool = not hasattr(cls, "__post_init__") and all(
+        isinstance(getattr(cls, name, None), MemberDescriptorType) for name, _, _ in plan
+    )
+
+    source: str = f"def build(data):\n    {prelude}\n"
+
+    if slotted:
+        source += "    container = new(cls)\n"
+
+        for index, ((name, _, _), value) in enumerate(zip(plan, values)):
+            namespace[f"set_{index}"] = getattr(cls, name).__set__
+            source += f"    set_{index}(container, {value})\n"
+
+        source += "    return container\n"
+
+    else:
+        source += "    return cls(\n        "
+        source += ",\n        ".join(f"{name}={value}" for (name, _, _), value in zip(plan, values)) + "\n    )\n"
+
+    exec(compile(source, f"<{cls.__name__} decoder>", "exec"), namespace)
+    return namespace["build"]
+
+
+def _compile_decoder(cls: type) -> Callable[[dict], any]:
+    plan: list[tuple[str, str, type]] = _plan(cls)
+
+    # Nested containers use their own cached decoder, compiled on first use
+    containers: dict[type, Callable] = {field_type: field_type.from_data for _, kind, field_type in plan if kind == _CONTAINER}
+
+    return _generate(cls, plan, "get = data.get", "get({name!r})", containers)
+
+
+def _struct(cls: type) -> tuple[type, Callable[[any], any]]:
+    cached: tuple[type, Callable[[any], any]] | None = _structs.get(cls)
+    if cached is not None: return cached
+
+    plan: list[tuple[str, str, type]] = _plan(cls)
+    struct_fields: list[tuple[str, any, None]] = []
+    containers: dict[type, Callable] = {}
+
+    for name, kind, field_type in plan:
+        if kind == _CONTAINER:
+            nested, containers[field_type] = _struct(field_type)
+            struct_fields.append((name, Optional[nested], None))
+
+        # Values aren't validated, like from_data()
+        else: struct_fields.append((name, Any, None))
+
+    struct: type = msgspec.defstruct(f"{cls.__name__}Struct", struct_fields)
+    _structs[cls] = struct, _generate(cls, plan, "pass", "data.{name}", containers)
+
+    return _structs[cls]
+
+
+def _typed_decoder(cls: type, response: bool) -> any:
+    decoder = _typed_decoders.get((cls, response))
+    if decoder is not None: return decoder
+
+    struct: type = _struct(cls)[0]
+
+    if response: struct = msgspec.defstruct(
+        f"{cls.__name__}Response", [("status", Any, None), ("media", Optional[struct], None)]
+    )
+
+    decoder = _typed_decoders[(cls, response)] = msgspec.json.Decoder(struct)
+    return decoder
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class Comment:
+
+    comment_id: str = None
+    post_id: str = None
+    parent_comment_id: str | None = None
+    text: str = None
+    created_at: int = None
+    like_count: int = None
+    child_comment_count: int = None
+    user_id: str = None
+    username: str = None
+    full_name: str = None
+    is_private: bool = None
+    is_verified: bool = None
+    profile_picture_url: str = None
@@ -3,7 +3,7 @@ from .DirectThreadInviter import DirectThreadInviter
 from .DirectThreadLastPermanentItem import DirectThreadLastPermanentItem
 
 
-@dataclass(frozen=False)
+@dataclass(frozen=False, slots=True)
 class DirectThread:
 
     raw: dict = None
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=False)
+@dataclass(frozen=False, slots=True)
 class DirectThreadLastPermanentItem:
 
     ...
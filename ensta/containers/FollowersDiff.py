@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class FollowersDiff:
+
+    # UserIDs, newest first
+    added: list[str] = None
+    removed: list[str] = None
+
+    # Current followers (newest first): Pass it as 'previous' next time
+    snapshot: list[str] = None
+
+    # False if pagination stopped early: Removals older than the last known follower seen aren't detected
+    complete: bool = None
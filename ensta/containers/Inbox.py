@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from .DirectThread import DirectThread
 
 
-@dataclass(frozen=False)
+@dataclass(frozen=False, slots=True)
 class Inbox:
 
     unseen_count: int = None
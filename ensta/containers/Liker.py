@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class Liker:
 
     user_id: str = None
@@ -13,3 +13,11 @@ class Liker:
     profile_picture_id: str = None
     profile_picture_url: str = None
     latest_reel_media: int = None
+
+    # Compared & hashed by user_id: Usable in sets and as dict keys, even though 'badges' is a list
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Liker): return NotImplemented
+        return str(self.user_id) == str(other.user_id)
+
+    def __hash__(self) -> int:
+        return hash(str(self.user_id))
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from .Liker import Liker
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Likers:
 
     user_count: int = None
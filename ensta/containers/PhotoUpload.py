@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from .BaseResponseData import BaseResponseData
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PhotoUpload(BaseResponseData):
     raw: dict
     taken_at: int
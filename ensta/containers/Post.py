@@ -2,7 +2,7 @@ from .PostUser import PostUser
 from dataclasses import dataclass, field
 
 
-@dataclass(frozen=False)
+@dataclass(frozen=False, slots=True)
 class Post:
     share_url: str = ""
     taken_at: int = 0
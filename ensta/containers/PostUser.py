@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass(frozen=False)
+@dataclass(frozen=False, slots=True)
 class PostUser:
     has_anonymous_profile_picture: bool = False
     fbid_v2: str = ""
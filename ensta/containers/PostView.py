@@ -0,0 +1,154 @@
+from dataclasses import fields
+from .Post import Post
+from .PostUser import PostUser
+
+
+_MISSING: object = object()
+
+
+class Key:
+    """
+    Field read from the item's JSON Object the first time it's accessed, then kept in the view's '_values'.
+    """
+
+    __slots__ = ("key", "default", "parent", "name")
+
+    def __init__(self, key: str, default: any, parent: str | None = None) -> None:
+        """
+        :param key: Key in the JSON Object
+        :param default: Value if it's missing. Callables (e.g. - list) are called, so each view gets its own
+        :param parent: (Optional) Key of the nested JSON Object holding it. e.g. - "caption"
+        """
+
+        self.key = key
+        self.default = default
+        self.parent = parent
+        self.name = key
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: any, owner: type) -> any:
+        if instance is None: return self
+
+        value: any = instance._values.get(self.name, _MISSING)
+        if value is not _MISSING: return value
+
+        data: dict | None = instance.data if self.parent is None else instance.data.get(self.parent)
+
+        if data is not None and self.key in data: value = data[self.key]
+        else: value = self.default() if callable(self.default) else self.default
+
+        instance._values[self.name] = value
+        return value
+
+
+class PostUserView:
+    """
+    Read-only PostUser backed by the post's "user" JSON Object.
+    """
+
+    __slots__ = ("data", "_values")
+
+    has_anonymous_profile_picture = Key("has_anonymous_profile_picture", False)
+    fbid_v2 = Key("fbid_v2", "")
+    transparency_product_enabled = Key("transparency_product_enabled", False)
+    is_favorite = Key("is_favorite", False)
+    is_unpublished = Key("is_unpublished", False)
+    uid = Key("pk", "")
+    username = Key("username", "")
+    full_name = Key("full_name", "")
+    is_private = Key("is_private", False)
+    is_verified = Key("is_verified", False)
+    profile_picture_id = Key("profile_pic_id", "")
+    profile_picture_url = Key("profile_pic_url", "")
+    account_badges = Key("account_badges", list)
+    feed_post_reshare_disabled = Key("feed_post_reshare_disabled", False)
+    show_account_transparency_details = Key("show_account_transparency_details", False)
+    third_party_downloads_enabled = Key("third_party_downloads_enabled", 0)
+    latest_reel_media = Key("latest_reel_media", 0)
+
+    def __init__(self, data: dict | None) -> None:
+        self.data = data if data is not None else {}
+        self._values = {}
+
+    def to_post_user(self) -> PostUser:
+        return PostUser(**{each.name: getattr(self, each.name) for each in fields(PostUser)})
+
+    def __repr__(self) -> str:
+        return f"PostUserView(uid={self.uid!r}, username={self.username!r})"
+
+
+class PostView:
+    """
+    Read-only Post backed by a feed item: Each field is read from the item the first time it's accessed (and
+    kept), instead of all ~40 of them being copied into a Post upfront. The user view is created on first access too.
+    """
+
+    __slots__ = ("data", "_values", "_user")
+
+    taken_at = Key("taken_at", 0)
+    post_id = Key("pk", "")
+    media_type = Key("media_type", 0)
+    code = Key("code", "")
+    caption_is_edited = Key("caption_is_edited", False)
+    original_media_has_visual_reply_media = Key("original_media_has_visual_reply_media", False)
+    like_and_view_counts_disabled = Key("like_and_view_counts_disabled", False)
+    can_viewer_save = Key("can_viewer_save", False)
+    profile_grid_control_enabled = Key("profile_grid_control_enabled", False)
+    is_comments_gif_composer_enabled = Key("is_comments_gif_composer_enabled", False)
+    comment_threading_enabled = Key("comment_threading_enabled", False)
+    comment_count = Key("comment_count", 0)
+    has_liked = Key("has_liked", False)
+    can_viewer_reshare = Key("can_viewer_reshare", False)
+    like_count = Key("like_count", 0)
+    top_likers = Key("top_likers", list)
+    caption_text = Key("text", "", parent="caption")
+    is_caption_covered = Key("is_covered", False, parent="caption")
+    caption_created_at = Key("created_at", 0, parent="caption")
+    caption_share_enabled = Key("share_enabled", False, parent="caption")
+    caption_did_report_as_spam = Key("did_report_as_spam", False, parent="caption")
+    is_paid_partnership = Key("is_paid_partnership", False)
+    show_shop_entrypoint = Key("show_shop_entrypoint", False)
+    deleted_reason = Key("deleted_reason", 0)
+    integrity_review_decision = Key("integrity_review_decision", "")
+    ig_media_sharing_disabled = Key("ig_media_sharing_disabled", False)
+    has_shared_to_fb = Key("has_shared_to_fb", False)
+    is_unified_video = Key("is_unified_video", False)
+    should_request_ads = Key("should_request_ads", False)
+    is_visual_reply_commenter_notice_enabled = Key("is_visual_reply_commenter_notice_enabled", False)
+    commerciality_status = Key("commerciality_status", "")
+    explore_hide_comments = Key("explore_hide_comments", False)
+    has_delayed_metadata = Key("has_delayed_metadata", False)
+    location_latitude = Key("lat", 0)
+    location_longitude = Key("lng", 0)
+
+    def __init__(self, data: dict) -> None:
+        self.data = data
+        self._values = {}
+
+    @property
+    def share_url(self) -> str:
+        return f"https://www.instagram.com/p/{self.data.get('code', '')}"
+
+    @property
+    def user(self) -> PostUserView:
+        try: return self._user
+        except AttributeError: pass
+
+        self._user = PostUserView(self.data.get("user"))
+        return self._user
+
+    def to_post(self) -> Post:
+        """
+        Copies every field into a regular (mutable) Post.
+        :return: Post
+        """
+
+        post: Post = Post(**{each.name: getattr(self, each.name) for each in fields(Post) if each.name != "user"})
+        post.user = self.user.to_post_user()
+
+        return post
+
+    def __repr__(self) -> str:
+        return f"PostView(post_id={self.post_id!r}, code={self.code!r})"
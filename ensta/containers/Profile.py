@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=False)
+@dataclass(frozen=False, slots=True)
 class Profile:
 
     raw: dict = None
@@ -21,16 +21,16 @@ class Profile:
     is_verified: bool = None
     profile_picture_url: str = None
     profile_picture_url_hd: str = None
-    pronouns: list[str] = None,
-    has_ar_effects: bool = None,
-    has_clips: bool = None,
-    has_guides: bool = None,
-    has_channel: bool = None,
-    highlight_count: int = None,
-    hide_like_and_view_counts: bool = None,
-    is_embeds_disabled: bool = None,
-    is_verified_by_mv4b: bool = None,
-    should_show_category: bool = None,
-    should_show_public_contacts: bool = None,
-    show_account_transparency_details: bool = None,
+    pronouns: list[str] = None
+    has_ar_effects: bool = None
+    has_clips: bool = None
+    has_guides: bool = None
+    has_channel: bool = None
+    highlight_count: int = None
+    hide_like_and_view_counts: bool = None
+    is_embeds_disabled: bool = None
+    is_verified_by_mv4b: bool = None
+    should_show_category: bool = None
+    should_show_public_contacts: bool = None
+    show_account_transparency_details: bool = None
     total_post_count: int = None
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from .Profile import Profile
 
 
-@dataclass(frozen=False)
+@dataclass(frozen=False, slots=True)
 class ProfileHost(Profile):
 
     blocked_by_viewer: bool = None
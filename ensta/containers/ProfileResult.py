@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileResult:
+
+    identifier: str = None
+
+    # Profile / ProfileHost (Guest, SessionHost) or structures.Profile (Mobile). None if it couldn't be fetched
+    profile: any = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.profile is not None
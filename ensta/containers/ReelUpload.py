@@ -4,13 +4,13 @@ from .BaseResponseData import BaseResponseData
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MediaAppreciationSettings(BaseResponseData):
     media_gifting_state: str
     gift_count_visibility: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReelUpload(BaseResponseData):
     raw: dict
     taken_at: int
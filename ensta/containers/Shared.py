@@ -3,7 +3,7 @@ from .BaseResponseData import BaseResponseData
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommentInformTreatment(BaseResponseData):
     should_have_inform_treatment: bool
     text: str
@@ -11,7 +11,7 @@ class CommentInformTreatment(BaseResponseData):
     action_type: Any  # @TODO
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SharingFrictionInfo(BaseResponseData):
     should_have_sharing_friction: bool
     bloks_app_url: Any  # @TODO
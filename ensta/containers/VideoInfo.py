@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class VideoInfo:
+
+    # Seconds
+    duration: float = None
+
+    # Pixels, as stored in the file (before any rotation)
+    width: int = None
+    height: int = None
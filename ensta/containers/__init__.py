@@ -1,11 +1,15 @@
 from .FollowPerson import FollowPerson
+from .FollowersDiff import FollowersDiff
 from .Profile import Profile
 from .ProfileHost import ProfileHost
+from .ProfileResult import ProfileResult
 from .FollowedStatus import FollowedStatus
 from .UnfollowedStatus import UnfollowedStatus
 from .Post import Post
 from .PostUser import PostUser
+from .PostView import PostView, PostUserView
 from .Liker import Liker
+from .Comment import Comment
 from .Likers import Likers
 from .PrivateInfo import PrivateInfo
 from .PhotoUpload import PhotoUpload
@@ -15,3 +19,4 @@ from .DirectThreadInviter import DirectThreadInviter
 from .DirectThreadLastPermanentItem import DirectThreadLastPermanentItem
 from .ReelUpload import ReelUpload
 from .BaseResponseData import BaseResponseData
+from .VideoInfo import VideoInfo
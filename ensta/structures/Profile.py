@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from .BiographyLink import BiographyLink
 
 
-@dataclass
+@dataclass(slots=True)
 class Profile:
 
     """
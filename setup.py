@@ -47,11 +47,14 @@ setup(
     ],
     install_requires=[
         "requests",
-        "moviepy",
         "cryptography",
         "pyotp",
         "ntplib"
     ],
+    extras_require={
+        # Reels in formats other than MP4 / MOV
+        "video": ["moviepy"]
+    },
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
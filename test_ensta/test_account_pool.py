@@ -0,0 +1,109 @@
+import io
+import json
+from unittest import TestCase
+from unittest.mock import patch
+from requests import Response
+from ensta.AccountPool import AccountPool
+from ensta.SessionHost import SessionHost
+from ensta.Checkpoint import Checkpoint
+from ensta.lib import RateLimitedError
+
+
+def streamed_page(**content) -> Response:
+    response = Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(json.dumps(content).encode())
+
+    return response
+
+
+def follow_person(index: int) -> dict:
+    return {
+        "pk": str(index),
+        "username": f"user_{index}",
+        "full_name": "",
+        "is_private": False,
+        "is_verified": False,
+        "profile_pic_url": "",
+        "has_anonymous_profile_picture": False,
+        "account_badges": [],
+        "third_party_downloads_enabled": 0
+    }
+
+
+class FakeAccount:
+
+    def __init__(self, username: str, limited_after: int | None = None):
+        self.username = username
+        self.limited_after = limited_after
+        self.calls = 0
+        self.pages = 0
+
+    def profile(self, username: str) -> str:
+        self.calls += 1
+        if self.limited_after is not None and self.calls > self.limited_after: raise RateLimitedError("limited")
+        return f"{username}@{self.username}"
+
+    def followers(self, identifier: str, count: int = 0, stream: bool = False, resume_from=None, **_):
+        checkpoint = resume_from or Checkpoint()
+
+        for index in range(checkpoint.generated_count, count):
+            self.pages += 1
+
+            if self.limited_after is not None and index >= self.limited_after:
+                yield None
+                raise RateLimitedError("limited")
+
+            yield index
+            checkpoint.generated_count = index + 1
+
+
+class AccountPoolTest(TestCase):
+
+    def test_least_loaded(self):
+        first, second = FakeAccount("first"), FakeAccount("second")
+        pool = AccountPool([first, second])
+
+        for _ in range(4): pool.profile("leomessi")
+
+        self.assertEqual((first.calls, second.calls), (2, 2))
+
+    def test_bench_and_reroute(self):
+        limited, healthy = FakeAccount("limited", limited_after=0), FakeAccount("healthy")
+        pool = AccountPool([limited, healthy])
+
+        self.assertEqual(pool.profile("leomessi"), "leomessi@healthy")
+        self.assertEqual(pool.healthy(), [healthy])
+
+    def test_all_benched(self):
+        pool = AccountPool([FakeAccount("limited", limited_after=0)])
+        self.assertRaises(RateLimitedError, pool.profile, "leomessi")
+
+    def test_paginate_hands_over(self):
+        limited, healthy = FakeAccount("limited", limited_after=3), FakeAccount("healthy")
+        pool = AccountPool([limited, healthy])
+
+        self.assertEqual(list(pool.followers("leomessi", 6)), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(healthy.pages, 3)
+        self.assertGreater(pool.throughput(), 0)
+
+    def test_streamed_checkpoint_hands_over(self):
+        limited, healthy = (
+            SessionHost(json.dumps({"session_id": "", "user_id": str(index)}), skip_auth_verification=True)
+            for index in (1, 2)
+        )
+
+        pool = AccountPool([limited, healthy])
+
+        # The RetryPolicy doesn't read streamed bodies: The paginator has to notice the checkpoint
+        with patch.object(limited.request_session, "get", side_effect=[
+            streamed_page(users=[follow_person(index) for index in range(2)], next_max_id="2", status="ok"),
+            streamed_page(message="checkpoint_required", status="fail")
+        ]), patch.object(healthy.request_session, "get", side_effect=[
+            streamed_page(users=[follow_person(index) for index in range(2, 4)], status="ok")
+        ]) as get:
+            followers = list(pool.followers(12345, stream=True))
+
+        self.assertEqual([person.user_id for person in followers], ["0", "1", "2", "3"])
+        self.assertIn("max_id=2", get.call_args_list[0].args[0])
+        self.assertEqual(pool.healthy(), [healthy])
@@ -0,0 +1,59 @@
+import asyncio
+import threading
+from unittest import TestCase
+from ensta.AsyncClient import AsyncClient
+
+
+class AsyncClientTest(TestCase):
+
+    def test_iterate(self):
+        client = AsyncClient(client=None, max_workers=2)
+
+        async def collect():
+            return [item async for item in client._iterate(x for x in range(5))]
+
+        self.assertEqual(asyncio.run(collect()), [0, 1, 2, 3, 4])
+        client.close()
+
+    def test_cancelled_iteration_closes_generator(self):
+        client = AsyncClient(client=None, max_workers=2)
+        started, release, closed = threading.Event(), threading.Event(), threading.Event()
+
+        def pages():
+            try:
+                started.set()
+                release.wait(5)
+                yield 1
+                yield 2
+
+            finally: closed.set()
+
+        # Kept alive: Only _iterate() may close it
+        generator = pages()
+
+        async def consume():
+            async for _ in client._iterate(generator): pass
+
+        async def cancel():
+            task = asyncio.create_task(consume())
+            await asyncio.to_thread(started.wait, 1)
+
+            # Cancelled while the worker thread is inside next()
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        asyncio.run(cancel())
+        self.assertFalse(closed.is_set())
+
+        release.set()
+        self.assertTrue(closed.wait(1))
+        client.close()
+
+    def test_run(self):
+        client = AsyncClient(client=None, max_workers=2)
+
+        async def gather():
+            return await asyncio.gather(*(client._run(pow, x, 2) for x in range(4)))
+
+        self.assertEqual(asyncio.run(gather()), [0, 1, 4, 9])
+        client.close()
@@ -0,0 +1,80 @@
+import time
+import itertools
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+from ensta import Guest
+from ensta.Batch import run_batch
+from ensta.lib import NetworkError
+
+
+class RunBatchTest(TestCase):
+
+    def test_deduplicates_and_reports_failures(self):
+        calls: list[str] = []
+
+        def fetch(username: str) -> str:
+            calls.append(username)
+            if username == "missing": raise NetworkError("not found")
+            return username.upper()
+
+        results = {
+            identifier: (result, error)
+            for identifier, result, error in run_batch(fetch, ["a", "A", "missing", "b", "a"], 2, str.lower)
+        }
+
+        self.assertEqual(sorted(calls), ["a", "b", "missing"])
+        self.assertEqual(results["a"], ("A", None))
+        self.assertEqual(results["b"], ("B", None))
+        self.assertIsInstance(results["missing"][1], NetworkError)
+
+    def test_completion_order_and_bound(self):
+        lock = threading.Lock()
+        running, most = 0, 0
+
+        def fetch(delay: str) -> str:
+            nonlocal running, most
+
+            with lock:
+                running += 1
+                most = max(most, running)
+
+            time.sleep(float(delay))
+
+            with lock: running -= 1
+            return delay
+
+        order = [identifier for identifier, _, _ in run_batch(fetch, ["0.3", "0.1", "0.2", "0.01", "0.02"], 3)]
+
+        self.assertEqual(order[0], "0.1")
+        self.assertEqual(order[-1], "0.3")
+        self.assertLessEqual(most, 3)
+
+    def test_lazy_input(self):
+        started = itertools.count()
+
+        def fetch(identifier: str) -> str:
+            next(started)
+            return identifier
+
+        for _ in run_batch(fetch, (str(index) for index in itertools.count()), 4): break
+
+        self.assertLessEqual(next(started), 6)
+
+
+class ProfilesTest(TestCase):
+
+    def test_guest_profiles(self):
+        guest = Guest()
+
+        def profile(username: str, __session__=None) -> str | None:
+            if username == "ratelimited": raise NetworkError("limited")
+            return f"profile:{username}"
+
+        with patch.object(guest, "profile", side_effect=profile):
+            results = {result.identifier: result for result in guest.profiles(["LeoMessi", "leo messi", "ratelimited"])}
+
+        self.assertEqual(list(sorted(results)), ["leomessi", "ratelimited"])
+        self.assertEqual(results["leomessi"].profile, "profile:leomessi")
+        self.assertTrue(results["leomessi"].ok)
+        self.assertFalse(results["ratelimited"].ok)
@@ -0,0 +1,71 @@
+import json
+from unittest import TestCase
+from unittest.mock import patch
+from requests import Response
+from ensta import Guest, SessionHost
+from ensta.containers import FollowPerson, Liker, Profile, ProfileHost, PhotoUpload
+
+
+def profile_response() -> Response:
+    user = {
+        "biography": "", "bio_links": [], "country_block": False, "full_name": "Leo Messi",
+        "edge_followed_by": {"count": 1}, "edge_follow": {"count": 2}, "id": "427553890", "username": "leomessi",
+        "category_name": None, "is_business_account": False, "is_professional_account": False,
+        "is_supervision_enabled": False, "is_joined_recently": False, "is_private": False, "is_verified": True,
+        "profile_pic_url": "", "profile_pic_url_hd": "", "pronouns": [], "has_ar_effects": False,
+        "has_clips": False, "has_guides": False, "has_channel": False, "highlight_reel_count": 0,
+        "hide_like_and_view_counts": False, "is_embeds_disabled": False, "is_verified_by_mv4b": False,
+        "should_show_category": False, "should_show_public_contacts": False,
+        "show_account_transparency_details": False, "edge_owner_to_timeline_media": {"count": 3, "edges": []},
+        "blocked_by_viewer": False, "followed_by_viewer": True, "follows_viewer": False, "has_blocked_viewer": False,
+        "has_requested_viewer": False, "is_guardian_of_viewer": False, "is_supervised_by_viewer": False,
+        "requested_by_viewer": False, "edge_mutual_followed_by": {"count": 0}
+    }
+
+    response = Response()
+    response.status_code = 200
+    response._content = json.dumps({"status": "ok", "data": {"user": user}}).encode()
+
+    return response
+
+
+class ContainersTest(TestCase):
+
+    def test_slotted(self):
+        for container in (FollowPerson(), Liker(), Profile(), ProfileHost()):
+            self.assertFalse(hasattr(container, "__dict__"), type(container).__name__)
+
+        self.assertIn("raw", PhotoUpload.__slots__)
+        self.assertIsNone(Profile().pronouns)
+
+    def test_hashed_by_user_id(self):
+        first = FollowPerson(user_id="1", username="old", badges=[])
+        renamed = FollowPerson(user_id=1, username="new", badges=[{"type": "verified"}])
+
+        self.assertEqual(first, renamed)
+        self.assertEqual(len({first, renamed, FollowPerson(user_id="2", badges=[])}), 2)
+        self.assertIn(Liker(user_id="3", badges=[]), {Liker(user_id="3")})
+        self.assertNotEqual(first, Liker(user_id="1"))
+
+    def test_raw_payload(self):
+        kept = Guest()
+        trimmed = Guest(raw_payload="trim")
+        dropped = SessionHost(json.dumps({"session_id": "", "user_id": "1"}), skip_auth_verification=True, raw_payload="drop")
+
+        with patch.object(kept.request_session, "get", return_value=profile_response()):
+            self.assertIn("edge_follow", kept.profile("leomessi").raw)
+
+        with patch.object(trimmed.request_session, "get", return_value=profile_response()):
+            raw = trimmed.profile("leomessi").raw
+
+            self.assertEqual(raw["username"], "leomessi")
+            self.assertNotIn("edge_follow", raw)
+
+        with patch.object(dropped.request_session, "get", return_value=profile_response()):
+            profile = dropped.profile("leomessi")
+
+            self.assertIsInstance(profile, ProfileHost)
+            self.assertIsNone(profile.raw)
+            self.assertTrue(profile.followed_by_viewer)
+
+        self.assertRaises(ValueError, Guest, raw_payload="everything")
@@ -0,0 +1,110 @@
+import os
+import csv
+import json
+import tempfile
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+from ensta import Guest, SessionHost, Checkpoint, Exporter, export
+from ensta.lib import NetworkError
+from test_ensta.test_pagination import page, follow_person
+
+try: import pyarrow.parquet
+except ImportError: pyarrow = None
+
+
+def items(start: int, stop: int) -> list[dict]:
+    return [
+        {"pk": str(index), "code": f"code_{index}", "like_count": index, "user": {"pk": "1", "username": "leomessi"}}
+        for index in range(start, stop)
+    ]
+
+
+class ExporterTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.guest = Guest()
+        self.host = SessionHost(json.dumps({"session_id": "", "user_id": "1"}), skip_auth_verification=True)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory.name, name)
+
+    def test_ndjson(self):
+        with patch.object(self.guest.request_session, "get", side_effect=[page(items=items(0, 3))]):
+            self.assertEqual(export(self.guest.posts("leomessi"), self.path("posts.ndjson"), batch_size=2), 3)
+
+        with open(self.path("posts.ndjson")) as file: rows = [json.loads(line) for line in file]
+
+        self.assertEqual([row["post_id"] for row in rows], ["0", "1", "2"])
+        self.assertEqual(rows[0]["user"]["username"], "leomessi")
+        self.assertEqual(os.listdir(self.directory.name), ["posts.ndjson"])
+
+    def test_csv(self):
+        with patch.object(self.host.request_session, "get", side_effect=[page(users=[follow_person(index) for index in range(3)])]):
+            export(self.host.followers(12345), self.path("followers.csv"))
+
+        with open(self.path("followers.csv"), newline="") as file: rows = list(csv.DictReader(file))
+
+        self.assertEqual([row["username"] for row in rows], ["user_0", "user_1", "user_2"])
+        self.assertEqual(rows[0]["badges"], "[]")
+
+    def test_resume_without_duplicates(self):
+        checkpoint = Checkpoint()
+        path = self.path("followers.ndjson")
+
+        # Interrupted while requesting the 2nd page: The last 5 rows weren't committed
+        with patch.object(self.host.request_session, "get", side_effect=[
+            page(users=[follow_person(index) for index in range(35)], next_max_id="35"),
+            KeyboardInterrupt()
+        ]):
+            with self.assertRaises(KeyboardInterrupt):
+                export(self.host.followers(12345, resume_from=checkpoint), path, batch_size=10, checkpoint=checkpoint)
+
+        self.assertFalse(os.path.exists(path))
+
+        # A new process: The checkpoint is restored from the export's state
+        checkpoint = Checkpoint()
+
+        with patch.object(self.host.request_session, "get", side_effect=[
+            page(users=[follow_person(index) for index in range(35)], next_max_id="35"),
+            page(users=[follow_person(index) for index in range(35, 40)])
+        ]):
+            rows = export(self.host.followers(12345, resume_from=checkpoint), path, batch_size=10, checkpoint=checkpoint)
+
+        with open(path) as file: user_ids = [json.loads(line)["user_id"] for line in file]
+
+        self.assertEqual(rows, 40)
+        self.assertEqual(user_ids, [str(index) for index in range(40)])
+        self.assertTrue(checkpoint.done)
+        self.assertEqual(os.listdir(self.directory.name), ["followers.ndjson"])
+
+    def test_keeps_rows_before_error(self):
+        checkpoint = Checkpoint()
+        path = self.path("posts.csv")
+
+        with patch.object(self.guest.request_session, "get", side_effect=[page(items=items(0, 3), next_max_id="3"), page()]):
+            with self.assertRaises(NetworkError):
+                export(self.guest.posts("leomessi", resume_from=checkpoint), path, batch_size=2, checkpoint=checkpoint)
+
+        with patch.object(self.guest.request_session, "get", side_effect=[page(items=items(3, 5))]):
+            self.assertEqual(export(self.guest.posts("leomessi", resume_from=checkpoint), path, checkpoint=checkpoint), 5)
+
+        with open(path, newline="") as file: rows = list(csv.DictReader(file))
+        self.assertEqual([row["post_id"] for row in rows], ["0", "1", "2", "3", "4"])
+
+    @skipIf(pyarrow is None, "pyarrow isn't installed")
+    def test_parquet(self):
+        with patch.object(self.guest.request_session, "get", side_effect=[page(items=items(0, 5))]):
+            export(self.guest.posts("leomessi", lazy=True), self.path("posts.parquet"), batch_size=2)
+
+        table = pyarrow.parquet.read_table(self.path("posts.parquet"))
+
+        self.assertEqual(table.column("like_count").to_pylist(), [0, 1, 2, 3, 4])
+        self.assertEqual(table.column("user.username").to_pylist(), ["leomessi"] * 5)
+        self.assertEqual(str(table.schema.field("top_likers").type), "string")
+
+    def test_unknown_format(self):
+        self.assertRaises(ValueError, Exporter, self.path("followers.xlsx"))
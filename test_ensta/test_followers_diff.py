@@ -0,0 +1,50 @@
+from unittest import TestCase
+from ensta.FollowersDiffer import diff_followers
+from ensta.containers import FollowPerson
+
+
+class CountingFollowers:
+
+    def __init__(self, user_ids: list[int]):
+        self.user_ids = user_ids
+        self.read = 0
+
+    def __iter__(self):
+        for uid in self.user_ids:
+            self.read += 1
+            yield FollowPerson(user_id=str(uid))
+
+
+class FollowersDiffTest(TestCase):
+
+    def test_stops_on_known_run(self):
+        previous = list(range(100, 0, -1))
+
+        # 2 new followers, and 95 left from the most recent ones
+        followers = CountingFollowers([102, 101] + [uid for uid in previous if uid != 95])
+        diff = diff_followers(followers, previous, known_run=10)
+
+        self.assertEqual(diff.added, ["102", "101"])
+        self.assertEqual(diff.removed, ["95"])
+        self.assertFalse(diff.complete)
+        self.assertEqual(followers.read, 12)
+
+        self.assertEqual(diff.snapshot, [str(uid) for uid in [102, 101] + previous if uid != 95])
+
+    def test_full_reconcile(self):
+        previous = list(range(100, 0, -1))
+
+        # Oldest follower left: Only a full reconcile can notice
+        followers = CountingFollowers([101] + previous[:-1])
+
+        self.assertEqual(diff_followers(followers, previous, known_run=10).removed, [])
+
+        diff = diff_followers(followers, previous, known_run=10, full=True)
+
+        self.assertEqual((diff.added, diff.removed, diff.complete), (["101"], ["1"], True))
+        self.assertEqual(diff.snapshot, [str(uid) for uid in [101] + previous[:-1]])
+
+    def test_first_snapshot(self):
+        diff = diff_followers(CountingFollowers([3, 2, 1]), [])
+
+        self.assertEqual((diff.added, diff.removed, diff.snapshot), (["3", "2", "1"], [], ["3", "2", "1"]))
@@ -0,0 +1,64 @@
+import os
+import time
+import tempfile
+from unittest import TestCase
+from ensta.IdentifierCache import IdentifierCache, MISSING
+
+
+class IdentifierCacheTest(TestCase):
+
+    def test_both_directions(self):
+        cache = IdentifierCache()
+        cache.put("LeoMessi", 427553890)
+
+        self.assertEqual(cache.get_uid("leomessi"), "427553890")
+        self.assertEqual(cache.get_username("427553890"), "leomessi")
+        self.assertIsNone(cache.get_uid("cristiano"))
+
+    def test_least_recently_used_evicted(self):
+        cache = IdentifierCache(max_size=2)
+        cache.put("first", 1)
+        cache.put("second", 2)
+
+        cache.get_uid("first")
+        cache.put("third", 3)
+
+        self.assertEqual(cache.get_uid("first"), "1")
+        self.assertIsNone(cache.get_uid("second"))
+
+    def test_expiry(self):
+        cache = IdentifierCache(ttl=0.05)
+        cache.put("leomessi", 1)
+        time.sleep(0.1)
+
+        self.assertIsNone(cache.get_uid("leomessi"))
+        self.assertIsNone(cache.get_username(1))
+
+    def test_missing(self):
+        cache = IdentifierCache()
+        cache.put_missing("nobody")
+
+        self.assertEqual(cache.get_uid("nobody"), MISSING)
+
+    def test_renamed_account(self):
+        cache = IdentifierCache()
+        cache.put("old_name", 1)
+        cache.put("new_name", 1)
+
+        self.assertIsNone(cache.get_uid("old_name"))
+        self.assertEqual(cache.get_username(1), "new_name")
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file = os.path.join(directory, "identifiers.json")
+
+            cache = IdentifierCache(file=file)
+            cache.put("leomessi", 1)
+            cache.put_missing("nobody")
+            cache.save()
+
+            loaded = IdentifierCache(file=file)
+
+            self.assertEqual(loaded.get_uid("leomessi"), "1")
+            self.assertEqual(loaded.get_username(1), "leomessi")
+            self.assertEqual(loaded.get_uid("nobody"), MISSING)
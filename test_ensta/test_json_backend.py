@@ -0,0 +1,61 @@
+import json
+from unittest import TestCase
+from json import JSONDecodeError
+from ensta import JsonBackend
+from ensta.containers import BaseResponseData, ReelUpload
+from ensta.containers.Shared import CommentInformTreatment
+
+try: import msgspec
+except ImportError: msgspec = None
+
+
+class JsonBackendTest(TestCase):
+
+    def tearDown(self):
+        JsonBackend.use_json_backend(JsonBackend.BACKENDS.get("orjson", JsonBackend.BACKENDS["json"]))
+        BaseResponseData.typed_decoding = msgspec is not None
+
+    def test_backends_agree(self):
+        content = b'{"users": [{"pk": "1", "username": "\\u00e9nsta"}], "next_max_id": null, "status": "ok"}'
+        decoded = []
+
+        for backend in JsonBackend.BACKENDS:
+            JsonBackend.use_json_backend(backend)
+            decoded.append(JsonBackend.loads(content))
+
+        self.assertTrue(all(each == decoded[0] for each in decoded))
+
+    def test_custom_backend_errors(self):
+        def decoder(content):
+            raise ValueError("Not JSON")
+
+        JsonBackend.use_json_backend(decoder)
+
+        with self.assertRaises(JSONDecodeError): JsonBackend.loads(b"{")
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError): JsonBackend.use_json_backend("simdjson")
+
+    def test_container_from_json(self):
+        treatment = CommentInformTreatment.from_json(b'{"should_have_inform_treatment": false, "text": ""}')
+        self.assertFalse(treatment.should_have_inform_treatment)
+
+    def test_compiled_decoder(self):
+        media = {
+            "pk": "1", "code": "abc", "like_count": 3, "unknown": [1, 2],
+            "comment_inform_treatment": {"should_have_inform_treatment": True, "text": "t"},
+            "media_appreciation_settings": None
+        }
+
+        for typed in (False, True):
+            BaseResponseData.typed_decoding = typed
+
+            from_content = ReelUpload.from_response_content(json.dumps({"status": "ok", "media": media}).encode())
+            self.assertEqual(from_content, ReelUpload.from_data(media))
+
+            self.assertEqual((from_content.pk, from_content.like_count, from_content.play_count), ("1", 3, None))
+            self.assertEqual(from_content.comment_inform_treatment, CommentInformTreatment(True, "t", None, None))
+            self.assertIsNone(from_content.media_appreciation_settings)
+
+            with self.assertRaises(JSONDecodeError): ReelUpload.from_response_content(b"{")
+            with self.assertRaises(Exception): ReelUpload.from_response_content(b'{"status": "fail"}')
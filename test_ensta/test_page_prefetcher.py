@@ -0,0 +1,91 @@
+import time
+import threading
+from unittest import TestCase
+from ensta.PagePrefetcher import PagePrefetcher
+from ensta.lib import NetworkError
+
+
+class PageSource:
+
+    def __init__(self, pages: int, fail_at: int | None = None):
+        self.pages = pages
+        self.fail_at = fail_at
+        self.fetched: list[str] = []
+        self.lock = threading.Lock()
+
+    def fetch(self, max_id: str) -> dict:
+        index = int(max_id or 0)
+
+        with self.lock: self.fetched.append(max_id)
+        if index == self.fail_at: raise NetworkError("failed")
+
+        page = {"status": "ok", "users": [index] * 10}
+        if index + 1 < self.pages: page["next_max_id"] = str(index + 1)
+
+        return page
+
+    def wait_for(self, count: int) -> None:
+        deadline = time.monotonic() + 2
+
+        while len(self.fetched) < count and time.monotonic() < deadline: time.sleep(0.01)
+        time.sleep(0.05)
+
+
+class PagePrefetcherTest(TestCase):
+
+    def test_pages_in_order(self):
+        source = PageSource(5)
+        prefetcher = PagePrefetcher(source.fetch, "", 2, "users")
+
+        pages, max_id = [], ""
+
+        while True:
+            page = prefetcher.page(max_id)
+            pages.append(page["users"][0])
+
+            if "next_max_id" not in page: break
+            max_id = page["next_max_id"]
+
+        self.assertEqual(pages, [0, 1, 2, 3, 4])
+        self.assertEqual(source.fetched, ["", "1", "2", "3", "4"])
+
+    def test_bounded_buffer(self):
+        source = PageSource(100)
+        prefetcher = PagePrefetcher(source.fetch, "", 3, "users")
+
+        # 3 buffered pages, and 1 waiting for room
+        source.wait_for(4)
+        self.assertEqual(len(source.fetched), 4)
+
+        prefetcher.page("")
+        source.wait_for(5)
+        self.assertEqual(len(source.fetched), 5)
+
+        prefetcher.close()
+
+    def test_needed_items(self):
+        source = PageSource(100)
+        PagePrefetcher(source.fetch, "", 10, "users", needed=25)
+
+        source.wait_for(3)
+        self.assertEqual(source.fetched, ["", "1", "2"])
+
+    def test_error_raised_in_order(self):
+        source = PageSource(10, fail_at=1)
+        prefetcher = PagePrefetcher(source.fetch, "", 4, "users")
+
+        self.assertEqual(prefetcher.page("")["users"][0], 0)
+        self.assertRaises(NetworkError, prefetcher.page, "1")
+
+        source.wait_for(2)
+        self.assertEqual(source.fetched, ["", "1"])
+
+    def test_stops_when_abandoned(self):
+        source = PageSource(100)
+        PagePrefetcher(source.fetch, "", 1, "users")
+
+        source.wait_for(2)
+        time.sleep(0.3)
+
+        self.assertLessEqual(len(source.fetched), 2)
+        self.assertFalse(any(thread.name == "ensta-prefetch" for thread in threading.enumerate()))
@@ -0,0 +1,273 @@
+import io
+import os
+import json
+import tempfile
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+from requests import Response
+from ensta import Guest, SessionHost, Checkpoint, FollowPersonStore
+from ensta.lib import NetworkError
+
+
+def page(**content) -> Response:
+    response = Response()
+    response.status_code = 200
+    response._content = json.dumps({"status": "ok", **content}).encode()
+
+    return response
+
+
+def streamed_page(**content) -> Response:
+    response = Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(json.dumps({**content, "status": "ok"}).encode())
+
+    return response
+
+
+def follow_person(index: int) -> dict:
+    return {
+        "pk": str(index),
+        "username": f"user_{index}",
+        "full_name": "",
+        "is_private": False,
+        "is_verified": False,
+        "profile_pic_url": "",
+        "has_anonymous_profile_picture": False,
+        "account_badges": [],
+        "third_party_downloads_enabled": 0
+    }
+
+
+class PaginationTest(TestCase):
+
+    def setUp(self):
+        self.guest = Guest()
+        self.host = SessionHost(json.dumps({"session_id": "", "user_id": "1"}), skip_auth_verification=True)
+
+    def test_posts(self):
+        pages = [
+            page(items=[{"pk": "1", "code": "a"}, {"pk": "2", "code": "b"}], next_max_id="2"),
+            page(items=[{"pk": "3", "code": "c"}])
+        ]
+
+        with patch.object(self.guest.request_session, "get", side_effect=pages):
+            posts = list(self.guest.posts("leomessi"))
+
+        self.assertEqual([post.post_id for post in posts], ["1", "2", "3"])
+
+    def test_followers(self):
+        pages = [
+            page(users=[follow_person(index) for index in range(35)], next_max_id="35"),
+            page(users=[follow_person(index) for index in range(35, 40)])
+        ]
+
+        with patch.object(self.host.request_session, "get", side_effect=pages):
+            followers = list(self.host.followers(12345))
+
+        self.assertEqual([person.user_id for person in followers], [str(index) for index in range(40)])
+
+    def test_followers_into_store(self):
+        pages = [
+            page(users=[follow_person(index) for index in range(35)], next_max_id="35"),
+            page(users=[follow_person(index) for index in range(35, 40)])
+        ]
+
+        store = FollowPersonStore()
+
+        with patch.object(self.host.request_session, "get", side_effect=pages):
+            with patch("ensta.SessionHost.FollowPerson", side_effect=AssertionError("FollowPerson built")):
+                generated = list(self.host.followers(12345, count=38, store=store))
+
+        self.assertEqual(generated, [])
+        self.assertEqual(store.column("user_id"), [str(index) for index in range(38)])
+        self.assertEqual(store[1].third_party_downloads_enabled, 0)
+
+    def test_streamed_posts(self):
+        pages = [
+            streamed_page(items=[{"pk": "1", "code": "a"}, {"pk": "2", "code": "b"}], next_max_id="2"),
+            streamed_page(items=[{"pk": "3", "code": "c"}])
+        ]
+
+        with patch.object(self.guest.request_session, "get", side_effect=pages):
+            posts = list(self.guest.posts("leomessi", stream=True))
+
+        self.assertEqual([post.post_id for post in posts], ["1", "2", "3"])
+
+    def test_streamed_followers_count(self):
+        pages = [streamed_page(users=[follow_person(index) for index in range(35)], next_max_id="35")]
+
+        with patch.object(self.host.request_session, "get", side_effect=pages) as get:
+            followers = list(self.host.followers(12345, count=10, stream=True))
+
+        self.assertEqual(len(followers), 10)
+        self.assertEqual(get.call_count, 1)
+
+    def test_streamed_next_page_requested_at_cursor(self):
+        requested = threading.Event()
+
+        def get(url, **_):
+            if "max_id=3" in url: requested.set()
+            return responses.pop(0)
+
+        responses = [
+            streamed_page(next_max_id="3", users=[follow_person(index) for index in range(3)]),
+            streamed_page(users=[follow_person(index) for index in range(3, 5)])
+        ]
+
+        with patch.object(self.host.request_session, "get", side_effect=get):
+            followers = self.host.followers(12345, stream=True)
+            first = next(followers)
+
+            # Sent while the first page's users are still being generated
+            self.assertTrue(requested.wait(1))
+            rest = list(followers)
+
+        self.assertEqual([person.user_id for person in [first, *rest]], [str(index) for index in range(5)])
+
+    def test_followers_fill_identifier_cache(self):
+        pages = [page(users=[follow_person(index) for index in range(3)])]
+
+        with patch.object(self.host.request_session, "get", side_effect=pages):
+            list(self.host.followers(12345))
+
+        with patch.object(self.host.request_session, "get") as get:
+            self.assertEqual(self.host.get_uid("user_2"), "2")
+            self.assertEqual(self.host.get_username(1), "user_1")
+            self.assertEqual(get.call_count, 0)
+
+    def test_resume_from_checkpoint(self):
+        checkpoint = Checkpoint()
+        followers = self.host.followers(12345, resume_from=checkpoint)
+
+        # Crashes while reading the 2nd page, after 2 of its users were generated
+        with patch.object(self.host.request_session, "get", side_effect=[
+            page(users=[follow_person(index) for index in range(3)], next_max_id="3"),
+            page(users=[follow_person(index) for index in range(3, 6)], next_max_id="6")
+        ]):
+            generated = [next(followers).user_id for _ in range(5)]
+            next(followers)
+
+        followers.close()
+        self.assertEqual((checkpoint.max_id, checkpoint.offset, checkpoint.generated_count), ("3", 2, 5))
+
+        restored = Checkpoint.from_dict(json.loads(json.dumps(checkpoint.to_dict())))
+
+        with patch.object(self.host.request_session, "get", side_effect=[
+            page(users=[follow_person(index) for index in range(3, 6)], next_max_id="6"),
+            page(users=[follow_person(index) for index in range(6, 8)])
+        ]) as get:
+            generated.extend(person.user_id for person in self.host.followers(12345, resume_from=restored))
+
+        self.assertIn("max_id=3", get.call_args_list[0].args[0])
+        self.assertEqual(generated, [str(index) for index in range(8)])
+        self.assertTrue(restored.done)
+
+    def test_autosave(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "posts.json")
+
+            with patch.object(self.guest.request_session, "get", side_effect=[
+                page(items=[{"pk": "1", "code": "a"}], next_max_id="1"),
+                page(items=[{"pk": "2", "code": "b"}], next_max_id="2"),
+                page()
+            ]):
+                with self.assertRaises(NetworkError): list(self.guest.posts("leomessi", autosave=path, autosave_every=2))
+
+            checkpoint = Checkpoint.load(path)
+            self.assertEqual((checkpoint.kind, checkpoint.target, checkpoint.max_id), ("posts", "leomessi", "2"))
+
+            self.assertRaises(ValueError, lambda: list(self.guest.posts("cristiano", resume_from=checkpoint)))
+
+    def test_prefetched_followers(self):
+        pages = [
+            page(users=[follow_person(index) for index in range(35)], next_max_id="35"),
+            page(users=[follow_person(index) for index in range(35, 70)], next_max_id="70"),
+            page(users=[follow_person(index) for index in range(70, 105)], next_max_id="105")
+        ]
+
+        with patch.object(self.host.request_session, "get", side_effect=pages) as get:
+            followers = list(self.host.followers(12345, count=50, prefetch=2))
+
+        self.assertEqual([person.user_id for person in followers], [str(index) for index in range(50)])
+        self.assertEqual(get.call_count, 2)
+        self.assertIn("max_id=35", get.call_args_list[1].args[0])
+
+        self.assertRaises(ValueError, lambda: list(self.host.followers(12345, stream=True, prefetch=2)))
+
+    def test_followings_stop_at_null_cursor(self):
+        pages = [page(users=[follow_person(index) for index in range(3)], next_max_id=None)]
+
+        with patch.object(self.host.request_session, "get", side_effect=pages) as get:
+            followings = list(self.host.followings(12345))
+
+        self.assertEqual(len(followings), 3)
+        self.assertEqual(get.call_count, 1)
+
+    def test_abandoned_paginator_stops_prefetching(self):
+        pages = [page(users=[follow_person(index) for index in range(35)], next_max_id="35")]
+
+        with patch.object(self.host.request_session, "get", side_effect=pages), \
+                patch("ensta.Paginator.PagePrefetcher.close") as close:
+
+            followers = self.host.followers(12345, prefetch=2)
+            next(followers)
+            followers.close()
+
+        close.assert_called_once()
+
+    def test_likers(self):
+        likers = [{"pk": str(index), "username": f"user_{index}", "profile_pic_url": f"{index}.jpg"} for index in range(5)]
+
+        pages = [
+            page(users=likers[:3], next_max_id="3", user_count=5),
+            page(users=likers[3:], next_max_id=None, user_count=5)
+        ]
+
+        with patch.object(self.host.request_session, "get", side_effect=pages) as get:
+            users = list(self.host.iter_likers("123", prefetch=1))
+
+        self.assertEqual([user.user_id for user in users], [str(index) for index in range(5)])
+        self.assertEqual(users[0].profile_picture_url, "0.jpg")
+        self.assertIn("likers/?max_id=3", get.call_args_list[1].args[0])
+        self.assertEqual(get.call_count, 2)
+
+        with patch.object(self.host.request_session, "get", side_effect=pages[:1]):
+            self.assertEqual(len(list(self.host.iter_likers("123", count=2))), 2)
+
+    def test_comments_with_replies(self):
+        def comment(pk: str, children: int = 0) -> dict:
+            return {"pk": pk, "text": f"text {pk}", "child_comment_count": children, "user": {"pk": "1", "username": "leomessi"}}
+
+        def pages():
+            return [
+                page(comments=[comment("1", children=2), comment("2")], next_min_id='{"cursor": 2}'),
+                page(child_comments=[comment("1.1")], has_more_tail_child_comments=True, next_max_child_cursor="1.1"),
+                page(child_comments=[comment("1.2")], has_more_tail_child_comments=False),
+                page(comments=[comment("3")])
+            ]
+
+        with patch.object(self.host.request_session, "get", side_effect=pages()) as get:
+            comments = list(self.host.comments("123", replies=True))
+
+        self.assertEqual([each.comment_id for each in comments], ["1", "1.1", "1.2", "2", "3"])
+        self.assertEqual(get.call_args_list[2].kwargs["params"], {"max_id": "1.1"})
+        self.assertEqual(get.call_args_list[3].kwargs["params"]["min_id"], '{"cursor": 2}')
+
+        # Interrupted while going through the 1st comment's replies
+        checkpoint = Checkpoint()
+
+        with patch.object(self.host.request_session, "get", side_effect=pages()):
+            interrupted = self.host.comments("123", replies=True, resume_from=checkpoint)
+            self.assertEqual([next(interrupted).comment_id for _ in range(2)], ["1", "1.1"])
+            restored = Checkpoint.from_dict(checkpoint.to_dict())
+            interrupted.close()
+
+        with patch.object(self.host.request_session, "get", side_effect=pages()):
+            resumed = [each.comment_id for each in self.host.comments("123", replies=True, resume_from=restored)]
+
+        self.assertEqual(resumed, ["1.1", "1.2", "2", "3"])
+
+        with patch.object(self.host.request_session, "get", side_effect=pages()[:1]):
+            self.assertEqual([each.comment_id for each in self.host.comments("123", count=1)], ["1"])
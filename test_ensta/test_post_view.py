@@ -0,0 +1,60 @@
+import json
+from unittest import TestCase
+from unittest.mock import patch
+from requests import Response
+from ensta import Guest
+from ensta.containers import PostView, PostUserView
+
+
+def item(index: int) -> dict:
+    return {
+        "pk": str(index),
+        "code": f"code_{index}",
+        "taken_at": 1700000000 + index,
+        "like_count": 10 * index,
+        "lat": 1.5,
+        "caption": {"text": f"Caption {index}", "created_at": 1700000000},
+        "user": {"pk": "427553890", "username": "leomessi", "is_verified": True, "account_badges": []}
+    }
+
+
+class PostViewTest(TestCase):
+
+    def test_matches_eager_post(self):
+        process = Guest._Guest__process_post_data
+
+        for data in (item(1), {"pk": "2", "caption": None}, {}):
+            self.assertEqual(PostView(data).to_post(), process(data))
+
+    def test_reads_on_access(self):
+        data = item(1)
+        view = PostView(data)
+
+        data["like_count"] = 99
+        self.assertEqual(view.like_count, 99)
+
+        # Kept after the first access
+        data["like_count"] = 100
+        self.assertEqual(view.like_count, 99)
+        self.assertIs(view.user.account_badges, view.user.account_badges)
+        self.assertEqual(view.share_url, "https://www.instagram.com/p/code_1")
+        self.assertIs(view.user, view.user)
+        self.assertEqual(PostUserView(None).username, "")
+
+        # Missing lists aren't shared between views
+        self.assertIsNot(PostView({}).top_likers, PostView({}).top_likers)
+        self.assertRaises(AttributeError, setattr, view, "like_count", 1)
+
+    def test_lazy_posts(self):
+        guest = Guest()
+        response = Response()
+        response.status_code = 200
+        response._content = json.dumps({"status": "ok", "items": [item(1), item(2)]}).encode()
+
+        with patch.object(guest.request_session, "get", return_value=response):
+            posts = list(guest.posts("leomessi", lazy=True))
+
+        self.assertTrue(all(isinstance(post, PostView) for post in posts))
+        self.assertTrue(all(not hasattr(post, "_user") for post in posts))
+        self.assertEqual([post.post_id for post in posts], ["1", "2"])
+        self.assertEqual(guest.identifier_cache.get_uid("leomessi"), "427553890")
@@ -0,0 +1,82 @@
+import threading
+from unittest import TestCase
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from ensta.Transport import Transport
+from ensta.RateLimiter import RateLimiter
+from ensta.RetryPolicy import RetryPolicy
+from ensta.ProxyPool import ProxyPool
+
+
+def stand_in_proxy(status: int) -> ThreadingHTTPServer:
+    """
+    Local stand-in for a proxy: Answers every request itself with the given status.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+
+        def do_GET(self):
+            body = b"{\"status\": \"ok\"}"
+
+            self.send_response(status)
+            if status == 302: self.send_header("location", "https://www.instagram.com/accounts/login/")
+            self.send_header("content-length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
+
+
+class ProxyPoolTest(TestCase):
+
+    def setUp(self):
+        self.flagged, self.working = stand_in_proxy(302), stand_in_proxy(200)
+
+        self.pool = ProxyPool([
+            f"http://127.0.0.1:{self.flagged.server_port}",
+            {"http": f"http://127.0.0.1:{self.working.server_port}"}
+        ])
+
+        self.session = Transport(
+            rate_limiter=RateLimiter.unlimited(),
+            retry_policy=RetryPolicy(max_rate_limited_retries=2, rate_limited_backoff=0.01),
+            proxy_pool=self.pool
+        ).session()
+
+    def tearDown(self):
+        for server in (self.flagged, self.working):
+            server.shutdown()
+            server.server_close()
+
+    def test_rotates_away_from_flagged_proxy(self):
+        for _ in range(5):
+            response = self.session.get("http://instagram.test/api/v1/feed/user/a/username/", allow_redirects=False)
+            self.assertEqual(response.status_code, 200)
+
+        healthy = self.pool.healthy()
+
+        self.assertEqual(len(healthy), 1)
+        self.assertEqual(healthy[0].url, f"http://127.0.0.1:{self.working.server_port}")
+
+    def test_prefers_faster_proxy(self):
+        pool = ProxyPool(["http://slow", "http://fast"])
+        slow, fast = pool.proxies
+
+        pool.report(slow, 2.0)
+        pool.report(fast, 0.1)
+
+        self.assertTrue(all(pool.choose() is fast for _ in range(10)))
+
+    def test_consecutive_failures(self):
+        pool = ProxyPool(["http://a", "http://b"], max_consecutive_failures=2)
+
+        pool.report(pool.proxies[0], 1.0, failed=True)
+        self.assertEqual(len(pool.healthy()), 2)
+
+        pool.report(pool.proxies[0], 1.0, failed=True)
+        self.assertEqual([proxy.url for proxy in pool.healthy()], ["http://b"])
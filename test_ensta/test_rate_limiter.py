@@ -0,0 +1,40 @@
+import time
+from unittest import TestCase
+from ensta.RateLimiter import RateLimiter, TokenBucket
+from ensta.lib import RateLimitedError
+from ensta.Utils import endpoint_family
+
+
+class RateLimiterTest(TestCase):
+
+    def test_endpoint_family(self):
+        self.assertEqual(endpoint_family("https://www.instagram.com/api/v1/friendships/1/followers/?count=35"), "friendships")
+        self.assertEqual(endpoint_family("https://www.instagram.com/api/v1/users/web_profile_info/?username=a"), "web_profile_info")
+        self.assertEqual(endpoint_family("https://i.instagram.com/rupload_igvideo/fb_uploader_1"), "rupload")
+        self.assertEqual(endpoint_family("https://www.instagram.com/api/v1/web/likes/1/like/"), "default")
+
+    def test_burst_then_queue(self):
+        bucket = TokenBucket(requests=20, period=1.0, burst=2)
+
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertAlmostEqual(bucket.reserve(), 0.05, delta=0.01)
+        self.assertAlmostEqual(bucket.reserve(), 0.10, delta=0.01)
+
+    def test_blocking(self):
+        limiter = RateLimiter({"feed": TokenBucket(requests=20, period=1.0, burst=1)})
+        started = time.monotonic()
+
+        for _ in range(3): limiter.acquire("https://www.instagram.com/api/v1/feed/user/a/username/")
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.09)
+
+    def test_non_blocking(self):
+        limiter = RateLimiter({"feed": TokenBucket(requests=1, period=60.0, burst=1)}, block=False)
+        limiter.acquire("https://www.instagram.com/api/v1/feed/user/a/username/")
+
+        self.assertRaises(RateLimitedError, limiter.acquire, "https://www.instagram.com/api/v1/feed/user/a/username/")
+
+    def test_unlimited(self):
+        limiter = RateLimiter.unlimited()
+        self.assertEqual(limiter.buckets, {})
@@ -0,0 +1,130 @@
+import os
+import json
+import tempfile
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from requests import Response
+from ensta import SessionHost
+from ensta.Transport import Transport
+from ensta.RateLimiter import RateLimiter
+from ensta.ResponseCache import ResponseCache, CacheEntry
+
+
+class CountingHandler(BaseHTTPRequestHandler):
+
+    hits: int = 0
+    cache_control: str | None = None
+
+    def do_GET(self):
+        CountingHandler.hits += 1
+        CountingHandler.cache_control = self.headers.get("cache-control")
+        body = json.dumps({"status": "ok", "hits": CountingHandler.hits}).encode()
+
+        self.send_response(200)
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_POST = do_GET
+
+    def log_message(self, *_):
+        pass
+
+
+class ResponseCacheTest(TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), CountingHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        self.base = f"http://127.0.0.1:{self.server.server_port}/api/v1"
+        self.cache = ResponseCache()
+        self.session = Transport(rate_limiter=RateLimiter.unlimited(), response_cache=self.cache).session()
+        CountingHandler.hits = 0
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def hits(self, url: str, times: int = 2, **kwargs) -> list[int]:
+        return [self.session.get(url, **kwargs).json()["hits"] for _ in range(times)]
+
+    def test_read_through(self):
+        url = f"{self.base}/users/web_profile_info/?username=leomessi"
+
+        self.assertEqual(self.hits(url), [1, 1])
+
+        self.cache.invalidate("LeoMessi")
+        self.assertEqual(self.hits(url), [2, 2])
+
+    def test_uncached_endpoints(self):
+        self.assertEqual(self.hits(f"{self.base}/friendships/1/followers/"), [1, 2])
+        self.assertEqual([self.session.post(f"{self.base}/feed/user/a/username/").json()["hits"] for _ in range(2)], [3, 4])
+
+    def test_no_cache_header(self):
+        url = f"{self.base}/accounts/edit/web_form_data/"
+
+        self.assertEqual(self.hits(url), [1, 1])
+        self.assertEqual(self.hits(url, 1, headers={"cache-control": "no-cache"}), [2])
+
+    def test_bypass(self):
+        url = f"{self.base}/accounts/edit/web_form_data/"
+
+        self.assertEqual(self.hits(url), [1, 1])
+        with ResponseCache.bypass(): self.assertEqual(self.hits(url), [2, 3])
+
+        # Nothing is added to the request, and the fresh response was cached
+        self.assertIsNone(CountingHandler.cache_control)
+        self.assertEqual(self.hits(url, 1), [3])
+
+    def test_separate_accounts(self):
+        url = f"{self.base}/feed/user/leomessi/username/"
+
+        self.session.cookies.set("ds_user_id", "1")
+        self.assertEqual(self.hits(url), [1, 1])
+
+        self.session.cookies.set("ds_user_id", "2")
+        self.assertEqual(self.hits(url), [2, 2])
+
+    def test_sqlite_backend(self):
+        url = f"{self.base}/users/web_profile_info/?username=leomessi"
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.sqlite3")
+
+            first = Transport(rate_limiter=RateLimiter.unlimited(), response_cache=ResponseCache.sqlite(path))
+            self.assertEqual(first.session().get(url).json()["hits"], 1)
+            first.response_cache.backend.close()
+
+            second = Transport(rate_limiter=RateLimiter.unlimited(), response_cache=ResponseCache.sqlite(path))
+            self.assertEqual(second.session().get(url).json()["hits"], 1)
+
+            second.response_cache.invalidate(family="web_profile_info")
+            self.assertEqual(second.session().get(url).json()["hits"], 2)
+            second.response_cache.backend.close()
+
+    def test_follow_invalidates(self):
+        host = SessionHost(
+            json.dumps({"session_id": "", "user_id": "1", "username": "me"}),
+            skip_auth_verification=True,
+            transport=Transport(response_cache=self.cache)
+        )
+
+        host.identifier_cache.put("leomessi", 427553890)
+
+        for key, subject in (("a", "leomessi"), ("b", "me"), ("c", "cristiano")):
+            self.cache.backend.set(key, CacheEntry(subject, "web_profile_info", float("inf"), 200, {}, b"{}"))
+
+        response = Response()
+        response.status_code = 200
+        response._content = json.dumps({
+            "status": "ok",
+            "friendship_status": {"following": True, "outgoing_request": False, "followed_by": False},
+            "previous_following": False
+        }).encode()
+
+        with patch.object(host.request_session, "post", return_value=response): host.follow(427553890)
+
+        self.assertEqual(list(self.cache.backend.entries), ["c"])
@@ -0,0 +1,90 @@
+import io
+import os
+import json
+import tempfile
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+from requests import Response
+from requests.exceptions import ConnectionError
+from ensta.ResumableUpload import rupload, committed_offset
+from ensta.RetryPolicy import RetryPolicy
+from ensta.Transport import Transport
+from ensta.Utils import fb_uploader
+
+
+def response(status_code: int = 200, **content) -> Response:
+    result = Response()
+    result.status_code = status_code
+    result._content = json.dumps(content).encode()
+    result.raw = io.BytesIO()
+
+    return result
+
+
+class ResumableUploadTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "video.mp4")
+        self.content = bytes(range(256)) * 40
+
+        with open(self.path, "wb") as file: file.write(self.content)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_streams_file(self):
+        session = MagicMock()
+        sent = []
+
+        session.post.side_effect = lambda url, data, headers: sent.append((data.read(), headers)) or response(status="ok")
+
+        self.assertEqual(rupload(session, "https://rupload", self.path, {"x-entity-name": "a"}).status_code, 200)
+        self.assertEqual(sent[0][0], self.content)
+        self.assertEqual((sent[0][1]["offset"], sent[0][1]["x-entity-length"]), ("0", str(len(self.content))))
+        session.get.assert_not_called()
+
+    def test_resumes_from_committed_offset(self):
+        session = MagicMock()
+        sent = []
+
+        def post(url, data, headers):
+            sent.append((data.read(), headers))
+            if len(sent) == 1: raise ConnectionError()
+
+            return response(status="ok")
+
+        session.post.side_effect = post
+        session.get.return_value = response(offset=1000)
+
+        rupload(session, "https://rupload", self.path, {}, retry_policy=RetryPolicy(backoff=0))
+
+        self.assertEqual(sent[1][0], self.content[1000:])
+        self.assertEqual((sent[1][1]["offset"], sent[1][1]["content-length"]), ("1000", str(len(self.content) - 1000)))
+
+    def test_gives_up(self):
+        session = MagicMock()
+        session.post.side_effect = lambda url, data, headers: response(503)
+        session.get.return_value = response(503)
+
+        policy = RetryPolicy(max_retries=2, backoff=0)
+
+        self.assertEqual(rupload(session, "https://rupload", self.path, {}, retry_policy=policy).status_code, 503)
+        self.assertEqual(session.post.call_count, 3)
+        self.assertEqual((sum(policy.retries.values()), sum(policy.failures.values())), (2, 1))
+        self.assertEqual(committed_offset(response(503)), 0)
+
+    def test_uses_transport_policy_only(self):
+        policy = RetryPolicy(max_retries=1, backoff=0)
+        session = Transport(retry_policy=policy).session()
+        url = "https://i.instagram.com/rupload_igvideo/a"
+
+        with patch("requests.adapters.HTTPAdapter.send", side_effect=lambda request, **_: response(503)) as send:
+            self.assertEqual(rupload(session, url, self.path, {}).status_code, 503)
+
+        # POST, offset GET, POST: None of them retried by the Transport itself
+        self.assertEqual([call.args[0].method for call in send.call_args_list], ["POST", "GET", "POST"])
+
+    def test_fb_uploader(self):
+        self.assertTrue(fb_uploader().startswith("fb_uploader_"))
+        self.assertEqual(fb_uploader("1"), "fb_uploader_1")
@@ -0,0 +1,110 @@
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+from requests import Request, Response
+from ensta import JsonBackend
+from ensta.JsonBackend import decode_response
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from ensta.Transport import Transport
+from ensta.RateLimiter import RateLimiter
+from ensta.RetryPolicy import RetryPolicy
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+
+    # Status codes to answer with, one per request, then 200
+    statuses: list[int] = []
+
+    def do_GET(self):
+        status = self.statuses.pop(0) if self.statuses else 200
+        body = b"{\"status\": \"ok\"}" if status == 200 else b"<html>"
+
+        self.send_response(status)
+        if status == 429: self.send_header("retry-after", "0")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_):
+        pass
+
+
+class RetryPolicyTest(TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        self.url = f"http://127.0.0.1:{self.server.server_port}/api/v1/feed/user/a/username/?max_id=abc"
+        self.policy = RetryPolicy(max_rate_limited_retries=2, backoff=0.01, rate_limited_backoff=0.01)
+        self.session = Transport(rate_limiter=RateLimiter.unlimited(), retry_policy=self.policy).session()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_retries_until_ok(self):
+        FlakyHandler.statuses = [500, 502, 429]
+
+        response = self.session.get(self.url)
+
+        self.assertEqual(response.json(), {"status": "ok"})
+        self.assertEqual(self.policy.retries["feed"], 3)
+
+    def test_gives_up(self):
+        FlakyHandler.statuses = [500] * 10
+
+        self.assertEqual(self.session.get(self.url).status_code, 500)
+        self.assertEqual(self.policy.retries["feed"], 3)
+        self.assertEqual(self.policy.failures["feed"], 1)
+
+    def test_rate_limited_not_retried_by_default(self):
+        FlakyHandler.statuses = [429]
+        policy = RetryPolicy(backoff=0.01)
+        session = Transport(retry_policy=policy).session()
+
+        self.assertEqual(session.get(self.url).status_code, 429)
+        self.assertEqual(policy.retries["feed"], 0)
+        self.assertEqual(policy.failures["feed"], 1)
+
+    def test_post_not_retried(self):
+        FlakyHandler.statuses = [500]
+        FlakyHandler.do_POST = FlakyHandler.do_GET
+
+        self.assertEqual(self.session.post(self.url).status_code, 500)
+        self.assertEqual(self.policy.retries["feed"], 0)
+
+    def test_delay(self):
+        policy = RetryPolicy(backoff=1.0, max_backoff=5.0)
+
+        for attempt in range(5):
+            self.assertLessEqual(policy.delay("retryable", attempt), 5.0)
+            self.assertGreaterEqual(policy.delay("retryable", attempt), min(2 ** attempt, 5.0) / 2)
+
+    def test_classify_reads_top_level_keys(self):
+        policy = RetryPolicy()
+        request = Request("GET", self.url).prepare()
+
+        def verdict(body: bytes) -> str:
+            response = Response()
+            response.status_code = 200
+            response._content = body
+
+            return policy.classify(request, response)
+
+        quoted = b'{"items": [{"caption": "\\"checkpoint_required\\" \\"spam\\":true Please wait a few minutes"}], "status": "ok"}'
+
+        self.assertEqual(verdict(quoted), "ok")
+        self.assertEqual(verdict(b'{"message": "checkpoint_required", "status": "fail"}'), "rate_limited")
+        self.assertEqual(verdict(b'{"message": "feedback_required", "spam": true, "status": "fail"}'), "rate_limited")
+        self.assertEqual(verdict(b'{"message": "Please wait a few minutes before you try again.", "status": "fail"}'), "rate_limited")
+        self.assertEqual(verdict(b'{"items": [{"pk": 1'), "retryable")
+
+    def test_body_decoded_once(self):
+        FlakyHandler.statuses = []
+
+        with patch("ensta.JsonBackend._decoder", wraps=JsonBackend._decoder) as decoder:
+            response = self.session.get(self.url)
+
+            self.assertEqual(decode_response(response), {"status": "ok"})
+            self.assertEqual(decoder.call_count, 1)
@@ -0,0 +1,60 @@
+import json
+from unittest import TestCase
+from json import JSONDecodeError
+from ensta.StreamingPage import StreamingPage
+
+PAGE = json.dumps({
+    "users": [{"pk": str(index), "username": f"user_{index}", "full_name": "Ünïcode \"quoted\" [x]"} for index in range(5)],
+    "page_size": 35,
+    "next_max_id": "35",
+    "status": "ok"
+}).encode()
+
+
+def chunked(content: bytes, size: int) -> list[bytes]:
+    return [content[index:index + size] for index in range(0, len(content), size)]
+
+
+class StreamingPageTest(TestCase):
+
+    def test_any_chunking(self):
+        expected = json.loads(PAGE)
+
+        for size in (1, 2, 3, 7, 64, len(PAGE)):
+            page = StreamingPage(chunked(PAGE, size), "users")
+
+            self.assertEqual(list(page), expected["users"])
+            self.assertEqual(page.fields, {"page_size": 35, "next_max_id": "35", "status": "ok"})
+            self.assertTrue(page.found)
+
+    def test_numbers_split_across_chunks(self):
+        page = StreamingPage([b'{"users": [12', b'.5e', b'3, 4', b'0], "next_max_id": 1', b'7}'], "users")
+
+        self.assertEqual(list(page), [12.5e3, 40])
+        self.assertEqual(page.fields["next_max_id"], 17)
+
+    def test_yields_before_page_is_over(self):
+        received = []
+
+        def chunks():
+            for chunk in chunked(PAGE, 16):
+                received.append(chunk)
+                yield chunk
+
+        first = next(iter(StreamingPage(chunks(), "users")))
+
+        self.assertEqual(first["pk"], "0")
+        self.assertLess(sum(map(len, received)), len(PAGE) / 2)
+
+    def test_fields_reported_as_they_appear(self):
+        seen = []
+        page = StreamingPage(chunked(b'{"next_max_id": "x", "users": [1, 2]}', 4), "users", on_field=lambda *field: seen.append(field))
+
+        iterator = iter(page)
+        next(iterator)
+
+        self.assertEqual(seen, [("next_max_id", "x")])
+
+    def test_truncated(self):
+        with self.assertRaises(JSONDecodeError): list(StreamingPage([PAGE[:-30]], "users"))
+        with self.assertRaises(JSONDecodeError): list(StreamingPage([b"[1, 2]"], "users"))
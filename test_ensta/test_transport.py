@@ -0,0 +1,29 @@
+from unittest import TestCase
+from ensta.Transport import Transport
+from ensta.RateLimiter import RateLimiter
+
+
+class TransportTest(TestCase):
+
+    def test_pools_are_shared_between_sessions(self):
+        transport = Transport({"rupload": 3})
+        first, second = transport.session(), transport.session()
+
+        self.assertIsNot(first.cookies, second.cookies)
+        self.assertIs(first.get_adapter("https://www.instagram.com/api/v1/"), second.get_adapter("https://www.instagram.com/"))
+
+    def test_requests_are_routed_per_host(self):
+        transport = Transport()
+        session = transport.session()
+
+        self.assertIs(session.get_adapter("https://i.instagram.com/api/v1/users/1/info/"), transport.adapters["i.instagram.com"])
+        self.assertIs(session.get_adapter("https://i.instagram.com/rupload_igvideo/fb_uploader_1"), transport.adapters["rupload"])
+        self.assertIs(session.get_adapter("https://rupload.facebook.com/messenger_image/x"), transport.adapters["rupload"])
+        self.assertIs(session.get_adapter("https://example.com/"), transport.default_adapter)
+
+    def test_unknown_pool(self):
+        self.assertRaises(ValueError, Transport, {"example.com": 1})
+
+    def test_rate_limiting_is_opt_in(self):
+        self.assertIsNone(Transport().rate_limiter)
+        self.assertIsNotNone(Transport(rate_limiter=RateLimiter()).rate_limiter)
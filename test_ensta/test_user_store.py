@@ -0,0 +1,88 @@
+from dataclasses import astuple
+from unittest import TestCase, skipIf
+from ensta.UserStore import FollowPersonStore, LikerStore, Bitset, pyarrow
+from ensta.containers import FollowPerson, Liker
+
+
+def follow_person(index: int) -> FollowPerson:
+    return FollowPerson(
+        has_anonymous_profile_picture=index % 3 == 0,
+        user_id=str(10_000_000_000 + index),
+        username=f"user_{index}",
+        full_name=f"Ünïcødé {index}" if index % 2 else None,
+        is_private=index % 2 == 0,
+        is_verified=None if index == 5 else index % 5 == 0,
+        profile_picture_url=f"https://instagram.com/{index}.jpg",
+        badges=[] if index % 4 else [{"type": "verified"}],
+        third_party_downloads_enabled=index % 2
+    )
+
+
+class UserStoreTest(TestCase):
+
+    def test_bitset(self):
+        bits = Bitset()
+        values = [index % 3 == 0 for index in range(20)]
+
+        for value in values: bits.append(value)
+
+        self.assertEqual([bits[index] for index in range(20)], values)
+        self.assertEqual(len(bits.data), 3)
+
+    def test_round_trip(self):
+        rows = [follow_person(index) for index in range(50)]
+        store = FollowPersonStore(rows + [None])
+
+        self.assertEqual(len(store), 50)
+        self.assertEqual([astuple(row) for row in store], [astuple(row) for row in rows])
+        self.assertEqual(store[-1], rows[-1])
+        self.assertEqual(store[10:13], rows[10:13])
+        self.assertEqual(store.column("user_id")[:2], [rows[0].user_id, rows[1].user_id])
+        self.assertRaises(IndexError, lambda: store[50])
+        self.assertEqual(store[1].third_party_downloads_enabled, 1)
+
+        # Equal badges are stored once
+        self.assertEqual(len(store.columns["badges"].values), 2)
+
+    def test_append_json(self):
+        store = LikerStore()
+
+        store.append_json({
+            "pk": "427553890",
+            "username": "leomessi",
+            "full_name": "Leo Messi",
+            "is_private": False,
+            "is_verified": True,
+            "profile_pic_id": "1_2",
+            "profile_pic_url": "https://instagram.com/leomessi.jpg",
+            "account_badges": [],
+            "latest_reel_media": 1700000000
+        })
+
+        store.append_json({"pk": "", "username": "ghost"})
+
+        self.assertEqual(astuple(store[0]), astuple(Liker(
+            user_id="427553890",
+            username="leomessi",
+            full_name="Leo Messi",
+            is_private=False,
+            badges=[],
+            is_verified=True,
+            profile_picture_id="1_2",
+            profile_picture_url="https://instagram.com/leomessi.jpg",
+            latest_reel_media=1700000000
+        )))
+
+        self.assertEqual((store[1].user_id, store[1].username, store[1].is_private), (None, "ghost", None))
+
+    @skipIf(pyarrow is None, "pyarrow isn't installed")
+    def test_to_arrow(self):
+        rows = [follow_person(index) for index in range(20)]
+        table = FollowPersonStore(rows).to_arrow()
+
+        self.assertEqual(table.column("user_id").to_pylist(), [int(row.user_id) for row in rows])
+        self.assertEqual(table.column("full_name").to_pylist(), [row.full_name for row in rows])
+        self.assertEqual(table.column("is_verified").to_pylist(), [row.is_verified for row in rows])
+
+        badges = FollowPersonStore([follow_person(1), FollowPerson(user_id="2"), follow_person(4)]).to_arrow().column("badges")
+        self.assertEqual(badges.to_pylist(), [[], None, [{"type": "verified"}]])
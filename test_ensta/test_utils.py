@@ -1,6 +1,14 @@
 from unittest import TestCase
 import time
-from ensta.Utils import time_id
+from ensta.Utils import (
+    time_id,
+    shortcode_from_url,
+    shortcode_to_media_id,
+    media_id_to_shortcode,
+    shortcodes_to_media_ids,
+    media_ids_to_shortcodes
+)
+from ensta.lib import ConversionError
 
 
 class TimeIdTest(TestCase):
@@ -12,3 +20,27 @@ class TimeIdTest(TestCase):
             ids.add(time_id())
             time.sleep(0.001)
         self.assertEqual(len(ids), total)
+
+
+class ShortcodeTest(TestCase):
+
+    def test_round_trip(self):
+        self.assertEqual(shortcode_to_media_id("Czr2yLmroCQ"), "3236921700141400208")
+        self.assertEqual(media_id_to_shortcode("3236921700141400208"), "Czr2yLmroCQ")
+        self.assertEqual(media_id_to_shortcode("3236921700141400208_5173052"), "Czr2yLmroCQ")
+
+    def test_bulk(self):
+        media_ids = [0, 1, 63, 64, 3236921700141400208, 2 ** 63 - 1]
+        shortcodes = media_ids_to_shortcodes(media_ids)
+
+        self.assertEqual(shortcodes[:4], ["A", "B", "_", "BA"])
+        self.assertEqual(shortcodes_to_media_ids(shortcodes), [str(media_id) for media_id in media_ids])
+
+    def test_invalid(self):
+        with self.assertRaises(ConversionError): shortcode_to_media_id("not a shortcode")
+        with self.assertRaises(ConversionError): media_id_to_shortcode("abc")
+
+    def test_share_url(self):
+        self.assertEqual(shortcode_from_url("https://www.instagram.com/p/Czr2yLmroCQ/?igsh=x"), "Czr2yLmroCQ")
+        self.assertEqual(shortcode_from_url("https://www.instagram.com/reel/Czr2yLmroCQ"), "Czr2yLmroCQ")
+        self.assertIsNone(shortcode_from_url("https://www.instagram.com/leomessi/"))
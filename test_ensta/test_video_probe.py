@@ -0,0 +1,76 @@
+import os
+import sys
+import struct
+import subprocess
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+from ensta.VideoProbe import probe_mp4, probe_video
+from ensta.containers import VideoInfo
+from ensta.lib.Exceptions import FileTypeError
+
+
+def box(box_type: bytes, payload: bytes = b"", large: bool = False) -> bytes:
+    if large: return struct.pack(">I4sQ", 1, box_type, len(payload) + 16) + payload
+    return struct.pack(">I4s", len(payload) + 8, box_type) + payload
+
+
+def mvhd(timescale: int, duration: int, version: int = 0) -> bytes:
+    if version == 1: times = struct.pack(">QQIQ", 0, 0, timescale, duration)
+    else: times = struct.pack(">IIII", 0, 0, timescale, duration)
+
+    return box(b"mvhd", bytes([version, 0, 0, 0]) + times + bytes(80))
+
+
+def trak(handler: bytes, width: int, height: int, version: int = 0) -> bytes:
+    times = bytes(32 if version == 1 else 20)
+    tkhd = bytes([version, 0, 0, 7]) + times + bytes(52) + struct.pack(">II", width << 16, height << 16)
+    hdlr = bytes(8) + handler + bytes(12) + b"\x00"
+
+    return box(b"trak", box(b"tkhd", tkhd) + box(b"mdia", box(b"mdhd", bytes(24)) + box(b"hdlr", hdlr)))
+
+
+class VideoProbeTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "video.mp4")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, *boxes: bytes) -> str:
+        with open(self.path, "wb") as file: file.write(b"".join(boxes))
+        return self.path
+
+    def test_moov_after_mdat(self):
+        moov = box(b"moov", mvhd(1000, 3500) + trak(b"soun", 0, 0) + trak(b"vide", 720, 1280))
+        path = self.write(box(b"ftyp", b"isom" + bytes(4)), box(b"mdat", bytes(100_000), large=True), moov)
+
+        self.assertEqual(probe_mp4(path), VideoInfo(duration=3.5, width=720, height=1280))
+
+    def test_version_1_boxes(self):
+        path = self.write(box(b"moov", mvhd(600, 2 ** 33, version=1) + trak(b"vide", 1080, 1920, version=1)))
+        self.assertEqual(probe_mp4(path), VideoInfo(duration=2 ** 33 / 600, width=1080, height=1920))
+
+    def test_unreadable(self):
+        fragmented = self.write(box(b"ftyp"), box(b"moov", mvhd(1000, 0) + trak(b"vide", 720, 1280)))
+        with self.assertRaises(ValueError): probe_mp4(fragmented)
+
+        truncated = self.write(box(b"ftyp"), struct.pack(">I4s", 4096, b"moov"))
+        with self.assertRaises(ValueError): probe_mp4(truncated)
+
+        audio_only = self.write(box(b"moov", mvhd(1000, 3500) + trak(b"soun", 0, 0)))
+        with self.assertRaises(ValueError): probe_mp4(audio_only)
+
+    def test_moviepy_fallback(self):
+        path = self.write(b"\x1aE\xdf\xa3" + bytes(64))
+
+        with patch.dict(sys.modules, {"moviepy": None, "moviepy.editor": None}):
+            with self.assertRaises(FileTypeError): probe_video(path)
+
+    def test_moviepy_not_imported(self):
+        code = "import sys, ensta.VideoProbe; print('moviepy' in sys.modules)"
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+        self.assertEqual(output.strip(), "False")